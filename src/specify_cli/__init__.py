@@ -24,28 +24,16 @@ Or install globally:
     specify init --here
 """
 
-import subprocess
-import sys
-from typing import Optional
-
-import typer
-from rich.align import Align
-from typer.core import TyperGroup
-
-from .agent_config import AGENT_CONFIG
-from .commands import check_tool
-from .commands import init as init_command
-from .commands import audit, doctor  # Import command modules
-from .console import console
-from .gitutils import is_git_repo
-from .ui import StepTracker, show_banner
-from .logging_config import setup_logging, get_logger
+import importlib
+from typing import Any
 
 __all__ = [
     "AGENT_CONFIG",
     "check_tool",
     "init_command",
+    "advisories",
     "audit",
+    "deps",
     "doctor",
     "console",
     "is_git_repo",
@@ -55,144 +43,30 @@ __all__ = [
     "get_logger",
 ]
 
-# Agent configuration moved to src/specify_cli/agent_config.py
-# Script type choices moved to src/specify_cli/config.py
-# CLAUDE_LOCAL_PATH moved to src/specify_cli/commands/init.py
-# SSL context and HTTP client moved to src/specify_cli/http.py
-
-BANNER = """
-███████╗██████╗ ███████╗ ██████╗██╗███████╗██╗   ██╗
-██╔════╝██╔══██╗██╔════╝██╔════╝██║██╔════╝╚██╗ ██╔╝
-███████╗██████╔╝█████╗  ██║     ██║█████╗   ╚████╔╝
-╚════██║██╔═══╝ ██╔══╝  ██║     ██║██╔══╝    ╚██╔╝
-███████║██║     ███████╗╚██████╗██║██║        ██║
-╚══════╝╚═╝     ╚══════╝ ╚═════╝╚═╝╚═╝        ╚═╝
-"""
-
-TAGLINE = "GitHub Spec Kit - Spec-Driven Development Toolkit"
-# StepTracker moved to src/specify_cli/ui/tracker.py
-# get_key() and select_with_arrows() moved to src/specify_cli/ui/selector.py
-# console moved to src/specify_cli/console.py
-
-
-class BannerGroup(TyperGroup):
-    """Custom group that shows banner before help."""
-
-    def format_help(self, ctx, formatter):
-        # Show banner before help
-        show_banner()
-        super().format_help(ctx, formatter)
-
-
-app = typer.Typer(
-    name="specify",
-    help="Setup tool for Specify spec-driven development projects",
-    add_completion=False,
-    invoke_without_command=True,
-    cls=BannerGroup,
-)
-
-# show_banner() function moved to src/specify_cli/ui/banner.py
-
-
-@app.callback()
-def callback(
-    ctx: typer.Context,
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
-    debug: bool = typer.Option(False, "--debug", help="Enable debug output"),
-):
-    """Show banner when no subcommand is provided."""
-    # Initialize logging based on verbosity flags
-    setup_logging(verbose=verbose, debug=debug)
-    logger = get_logger(__name__)
-
-    if debug:
-        logger.debug("Debug mode enabled")
-    elif verbose:
-        logger.info("Verbose mode enabled")
-
-    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
-        show_banner()
-        console.print(Align.center("[dim]Run 'specify --help' for usage information[/dim]"))
-        console.print()
-
-
-def run_command(
-    cmd: list[str], check_return: bool = True, capture: bool = False, shell: bool = False
-) -> Optional[str]:
-    """Run a shell command and optionally capture output."""
-    try:
-        if capture:
-            result = subprocess.run(
-                cmd, check=check_return, capture_output=True, text=True, shell=shell
-            )
-            return result.stdout.strip()
-        else:
-            subprocess.run(cmd, check=check_return, shell=shell)
-            return None
-    except subprocess.CalledProcessError as e:
-        if check_return:
-            console.print(f"[red]Error running command:[/red] {' '.join(cmd)}")
-            console.print(f"[red]Exit code:[/red] {e.returncode}")
-            if hasattr(e, "stderr") and e.stderr:
-                console.print(f"[red]Error output:[/red] {e.stderr}")
-            raise
-        return None
-
-
-# check_tool(), is_git_repo(), and init_git_repo() functions moved to src/specify_cli/commands/init.py
-
-# handle_vscode_settings() and merge_json_files() functions moved to src/specify_cli/github/extraction.py
-# download_template_from_github() function moved to src/specify_cli/github/download.py
-# download_and_extract_template() function moved to src/specify_cli/github/extraction.py
-
-# Register init command from commands.init_impl
-app.command()(init_command)
-
-# Register audit and doctor command apps
-app.add_typer(audit.app, name="audit")
-app.add_typer(doctor.app, name="doctor")
-
-
-@app.command()
-def check():
-    """Check that all required tools are installed."""
-    show_banner()
-    console.print("[bold]Checking for installed tools...[/bold]\n")
-
-    tracker = StepTracker("Check Available Tools")
-
-    tracker.add("git", "Git version control")
-    git_ok = check_tool("git", tracker=tracker)
-
-    agent_results = {}
-    for agent_key, agent_config in AGENT_CONFIG.items():
-        agent_name = agent_config["name"]
-
-        tracker.add(agent_key, agent_name)
-        agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
-
-    # Check VS Code variants (not in agent config)
-    tracker.add("code", "Visual Studio Code")
-    check_tool("code", tracker=tracker)
-
-    tracker.add("code-insiders", "Visual Studio Code Insiders")
-    check_tool("code-insiders", tracker=tracker)
-
-    console.print(tracker.render())
-
-    console.print("\n[bold green]Specify CLI is ready to use![/bold green]")
-
-    if not git_ok:
-        console.print("[dim]Tip: Install git for repository management[/dim]")
-
-    if not any(agent_results.values()):
-        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
-
-
-def main():
-    app()
-
-
-if __name__ == "__main__":
-    main()
+# Public names resolve from the full CLI module on first access (PEP 562), so
+# light entry points such as the daemon client never import typer or rich.
+_LAZY = set(__all__) | {
+    "app",
+    "main",
+    "run_command",
+    "callback",
+    "check",
+    "BannerGroup",
+    "BANNER",
+    "TAGLINE",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cli = importlib.import_module("._app", __name__)
+    # Bind every name at once, shadowing same-named submodules as the eager
+    # imports used to (e.g. ``console`` is the Console, not the module)
+    for lazy in _LAZY:
+        globals()[lazy] = getattr(cli, lazy)
+    return globals()[name]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY)
@@ -0,0 +1,385 @@
+"""Offline advisory database for air-gapped dependency scanning.
+
+Advisories are kept in a local SQLite store stamped with a monotonically
+increasing version. Full dumps replace the store; delta files (added,
+changed and withdrawn advisories) are applied transactionally on top of the
+version they were cut from. Per-package scan results are cached keyed on the
+database version, and a delta only invalidates the packages it touches.
+
+Dump format::
+
+    {"version": 12, "advisories": [ADVISORY, ...]}
+
+Delta format::
+
+    {"base_version": 12, "version": 13,
+     "added": [ADVISORY, ...], "changed": [ADVISORY, ...], "withdrawn": ["ID", ...]}
+
+where ``ADVISORY`` is ``{"id", "package", "vulnerable_specs", "fix_version",
+"cve", "severity"}`` and ``vulnerable_specs`` is a list of PEP 440 specifier
+sets, any of which marks a version as affected.
+"""
+
+from __future__ import annotations
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+from specify_cli.errors import AdvisoryDBError
+from specify_cli.import_index import normalize_dist
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+DB_PATH = Path(".speckit/advisories.db")  # relative to the project root
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS advisories (
+    advisory_id TEXT PRIMARY KEY,
+    package TEXT NOT NULL,
+    vulnerable_specs TEXT NOT NULL,
+    fix_version TEXT,
+    cve TEXT,
+    severity TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_advisories_package ON advisories(package);
+CREATE TABLE IF NOT EXISTS dep_results (
+    package TEXT NOT NULL,
+    version TEXT NOT NULL,
+    db_version INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (package, version)
+);
+"""
+
+
+@dataclass
+class Advisory:
+    """A single advisory affecting one package."""
+
+    advisory_id: str
+    package: str
+    vulnerable_specs: List[str]
+    fix_version: Optional[str] = None
+    cve: Optional[str] = None
+    severity: str = "UNKNOWN"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Advisory":
+        """Build and validate an advisory from a dump/delta record.
+
+        Raises:
+            AdvisoryDBError: Missing fields or unparseable specifiers
+        """
+        adv_id = data.get("id") or data.get("advisory_id")
+        package = data.get("package")
+        specs = data.get("vulnerable_specs")
+        if specs is None and data.get("vulnerable_spec") is not None:
+            specs = [data["vulnerable_spec"]]
+        if not adv_id or not package or not specs:
+            raise AdvisoryDBError(f"Advisory record missing id, package or specs: {data!r}")
+        for spec in specs:
+            try:
+                SpecifierSet(spec)
+            except InvalidSpecifier as e:
+                raise AdvisoryDBError(f"Advisory {adv_id} has invalid specifier {spec!r}") from e
+        return cls(
+            advisory_id=str(adv_id),
+            package=normalize_dist(str(package)),
+            vulnerable_specs=[str(s) for s in specs],
+            fix_version=data.get("fix_version"),
+            cve=data.get("cve"),
+            severity=str(data.get("severity") or "UNKNOWN").upper(),
+        )
+
+    def affects(self, version: str) -> bool:
+        """Return True if ``version`` falls in any vulnerable range."""
+        try:
+            v = Version(version)
+        except InvalidVersion:
+            log.debug(f"Unparseable version {version!r} for {self.package}")
+            return False
+        return any(SpecifierSet(s).contains(v, prereleases=True) for s in self.vulnerable_specs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.advisory_id,
+            "package": self.package,
+            "vulnerable_specs": self.vulnerable_specs,
+            "fix_version": self.fix_version,
+            "cve": self.cve,
+            "severity": self.severity,
+        }
+
+
+@dataclass
+class DeltaResult:
+    """Summary of an applied delta."""
+
+    from_version: int
+    version: int
+    added: int = 0
+    changed: int = 0
+    withdrawn: int = 0
+    touched_packages: Set[str] = field(default_factory=set)
+    invalidated_results: int = 0
+
+
+class AdvisoryStore:
+    """SQLite-backed advisory store with a version stamp and result cache."""
+
+    def __init__(self, path: Path):
+        """Open (or create) the store.
+
+        Args:
+            path: Database file, usually ``<project>/DB_PATH``
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transactions are managed explicitly below
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "AdvisoryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group statements into one atomic write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @property
+    def version(self) -> int:
+        """Current database version (0 when nothing has been imported)."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _set_version(self, version: int) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("version", str(version)), ("updated_at", datetime.now().isoformat())],
+        )
+
+    def _upsert(self, advisories: Iterable[Advisory]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO advisories VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    a.advisory_id,
+                    a.package,
+                    json.dumps(a.vulnerable_specs),
+                    a.fix_version,
+                    a.cve,
+                    a.severity,
+                )
+                for a in advisories
+            ],
+        )
+
+    @staticmethod
+    def _row(row: tuple) -> Advisory:
+        return Advisory(
+            advisory_id=row[0],
+            package=row[1],
+            vulnerable_specs=json.loads(row[2]),
+            fix_version=row[3],
+            cve=row[4],
+            severity=row[5],
+        )
+
+    def import_full(self, dump_path: Path) -> int:
+        """Replace the store with a full advisory dump.
+
+        Args:
+            dump_path: Dump file
+
+        Returns:
+            Number of advisories imported
+
+        Raises:
+            AdvisoryDBError: Malformed dump (store left unchanged)
+        """
+        data = _read_json(dump_path)
+        advisories = [Advisory.from_dict(a) for a in data.get("advisories", [])]
+        version = int(data.get("version", self.version + 1))
+
+        with self.transaction():
+            self._conn.execute("DELETE FROM advisories")
+            self._conn.execute("DELETE FROM dep_results")
+            self._upsert(advisories)
+            self._set_version(version)
+        log.info(f"Imported {len(advisories)} advisories at version {version}")
+        return len(advisories)
+
+    def apply_delta(self, delta_path: Path) -> DeltaResult:
+        """Apply a delta file transactionally.
+
+        Cached results for packages the delta does not touch are carried
+        over to the new version; touched packages are invalidated.
+
+        Args:
+            delta_path: Delta file
+
+        Returns:
+            Summary of the applied delta
+
+        Raises:
+            AdvisoryDBError: Version mismatch or malformed delta (store left unchanged)
+        """
+        data = _read_json(delta_path)
+        current = self.version
+        base = int(data.get("base_version", -1))
+        new = int(data.get("version", -1))
+        if base != current:
+            raise AdvisoryDBError(
+                f"Delta {delta_path.name} applies to version {base}, database is at {current}",
+                db_path=self.path,
+                hint="Apply missing deltas in order or re-import a full dump",
+            )
+        if new <= base:
+            raise AdvisoryDBError(f"Delta {delta_path.name} does not advance the version")
+
+        added = [Advisory.from_dict(a) for a in data.get("added", [])]
+        changed = [Advisory.from_dict(a) for a in data.get("changed", [])]
+        withdrawn = [str(i) for i in data.get("withdrawn", [])]
+        result = DeltaResult(from_version=current, version=new)
+
+        with self.transaction():
+            # Old package names count as touched too (an advisory may be re-targeted)
+            ids = [a.advisory_id for a in changed] + withdrawn
+            for chunk in _chunks(ids):
+                rows = self._conn.execute(
+                    f"SELECT package FROM advisories WHERE advisory_id IN ({_marks(chunk)})",
+                    chunk,
+                ).fetchall()
+                result.touched_packages.update(r[0] for r in rows)
+            result.touched_packages.update(a.package for a in added + changed)
+
+            self._upsert(added + changed)
+            for chunk in _chunks(withdrawn):
+                self._conn.execute(
+                    f"DELETE FROM advisories WHERE advisory_id IN ({_marks(chunk)})", chunk
+                )
+
+            touched = sorted(result.touched_packages)
+            for chunk in _chunks(touched):
+                cur = self._conn.execute(
+                    f"DELETE FROM dep_results WHERE package IN ({_marks(chunk)})", chunk
+                )
+                result.invalidated_results += cur.rowcount
+            self._conn.execute(
+                "UPDATE dep_results SET db_version = ? WHERE db_version = ?", (new, current)
+            )
+            self._set_version(new)
+
+        result.added, result.changed, result.withdrawn = len(added), len(changed), len(withdrawn)
+        log.info(
+            f"Advisory DB {current} -> {new}: +{result.added} ~{result.changed} "
+            f"-{result.withdrawn}, invalidated {result.invalidated_results} cached results"
+        )
+        return result
+
+    def advisories_for(self, package: str) -> List[Advisory]:
+        """Return all advisories recorded for a package."""
+        rows = self._conn.execute(
+            "SELECT * FROM advisories WHERE package = ? ORDER BY advisory_id",
+            (normalize_dist(package),),
+        ).fetchall()
+        return [self._row(r) for r in rows]
+
+    def advisories_by_package(self, packages: Iterable[str]) -> Dict[str, List[Advisory]]:
+        """Return advisories for many packages in one indexed pass.
+
+        Args:
+            packages: Distribution names (any spelling)
+
+        Returns:
+            Mapping of normalized package name to its advisories
+        """
+        names = sorted({normalize_dist(p) for p in packages})
+        out: Dict[str, List[Advisory]] = {}
+        for chunk in _chunks(names):
+            rows = self._conn.execute(
+                f"SELECT * FROM advisories WHERE package IN ({_marks(chunk)}) "
+                "ORDER BY package, advisory_id",
+                chunk,
+            )
+            for row in rows:
+                adv = self._row(row)
+                out.setdefault(adv.package, []).append(adv)
+        return out
+
+    def check(self, package: str, version: str) -> List[Advisory]:
+        """Return advisories affecting ``package==version``, using the result cache.
+
+        Args:
+            package: Distribution name
+            version: Installed/pinned version
+
+        Returns:
+            Matching advisories
+        """
+        pkg = normalize_dist(package)
+        db_version = self.version
+        row = self._conn.execute(
+            "SELECT db_version, payload FROM dep_results WHERE package = ? AND version = ?",
+            (pkg, version),
+        ).fetchone()
+        if row and row[0] == db_version:
+            return [Advisory.from_dict(a) for a in json.loads(row[1])]
+
+        matches = [a for a in self.advisories_for(pkg) if a.affects(version)]
+        self._conn.execute(
+            "INSERT OR REPLACE INTO dep_results VALUES (?, ?, ?, ?)",
+            (pkg, version, db_version, json.dumps([a.to_dict() for a in matches])),
+        )
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store statistics."""
+        count = self._conn.execute("SELECT COUNT(*) FROM advisories").fetchone()[0]
+        cached = self._conn.execute("SELECT COUNT(*) FROM dep_results").fetchone()[0]
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'updated_at'").fetchone()
+        return {
+            "version": self.version,
+            "advisories": count,
+            "cached_results": cached,
+            "updated_at": row[0] if row else None,
+        }
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise AdvisoryDBError(f"Cannot read advisory file {path}: {e}") from e
+
+
+def _marks(items: List[str]) -> str:
+    return ",".join("?" * len(items))
+
+
+def _chunks(items: List[str], size: int = 500) -> Iterable[List[str]]:
+    # Stay well under SQLite's bound-parameter limit
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
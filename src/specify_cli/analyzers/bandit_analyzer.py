@@ -1,10 +1,13 @@
 """Bandit security analyzer for Python code."""
 
 from __future__ import annotations
+import io
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Any
-import fnmatch
+from typing import List, Dict, Any, Mapping
+
+from specify_cli.analyzers.registry import AnalyzerContext
+from specify_cli.discovery import discover_python_files, is_excluded
 
 try:
     from bandit.core import manager as bandit_manager
@@ -34,15 +37,22 @@ class BanditFinding:
 class BanditAnalyzer:
     """Wrapper for Bandit security scanner."""
 
-    def __init__(self, target: Path, exclude_globs: List[str] | None = None):
+    def __init__(
+        self,
+        target: Path,
+        exclude_globs: List[str] | None = None,
+        files: List[Path] | None = None,
+    ):
         """Initialize analyzer with target path.
 
         Args:
             target: Directory or file to analyze
             exclude_globs: List of glob patterns to exclude
+            files: Pre-discovered Python files; skips discovery when given
         """
         self.target = Path(target)
         self.exclude_globs = exclude_globs or []
+        self.files = files
 
     def _is_excluded(self, p: Path) -> bool:
         """Check if path matches any exclude pattern.
@@ -54,10 +64,7 @@ class BanditAnalyzer:
             True if path should be excluded
         """
         rel = str(p.relative_to(self.target)) if p.is_absolute() else str(p)
-        return any(
-            fnmatch.fnmatch(rel, pat) or rel.startswith(pat.rstrip("/"))
-            for pat in self.exclude_globs
-        )
+        return is_excluded(rel, self.exclude_globs)
 
     def run(self) -> List[BanditFinding]:
         """Run Bandit analysis on target.
@@ -72,25 +79,42 @@ class BanditAnalyzer:
         mgr = bandit_manager.BanditManager(cfg, "file")
 
         # Find Python files, excluding common patterns and user-defined globs
-        py_files = []
-        for p in self.target.rglob("*.py"):
-            # Skip virtual environments and build artifacts
-            if any(
-                part in p.parts
-                for part in [".venv", "venv", ".tox", "build", "dist", "__pycache__"]
-            ):
-                continue
-            # Skip user-defined excludes
-            if self._is_excluded(p):
-                continue
-            py_files.append(str(p))
+        if self.files is None:
+            self.files = discover_python_files(self.target, self.exclude_globs)
+        py_files = [str(p) for p in self.files]
 
         if not py_files:
             return []
 
         mgr.discover_files(py_files)
         mgr.run_tests()
+        return self._collect(mgr)
+
+    def scan_buffers(self, buffers: Mapping[str, bytes]) -> List[BanditFinding]:
+        """Run Bandit over in-memory file contents instead of files on disk.
+
+        Args:
+            buffers: File content keyed by the path to report it under
 
+        Returns:
+            List of BanditFinding objects
+        """
+        if not BANDIT or not buffers:
+            return []
+
+        cfg = bandit_config.BanditConfig()
+        mgr = bandit_manager.BanditManager(cfg, "file")
+        # Bandit drops files it cannot parse from this list, so seed it with every name
+        mgr.files_list = list(buffers)
+        new_files_list = list(mgr.files_list)
+        for fname, data in buffers.items():
+            mgr._parse_file(fname, io.BytesIO(data), new_files_list)
+        mgr.files_list = new_files_list
+        mgr.metrics.aggregate()
+        return self._collect(mgr)
+
+    @staticmethod
+    def _collect(mgr: Any) -> List[BanditFinding]:
         out: List[BanditFinding] = []
         for i in mgr.get_issue_list():
             cwe = None
@@ -125,3 +149,11 @@ class BanditAnalyzer:
             List of dictionaries
         """
         return [asdict(f) for f in findings]
+
+
+def run_plugin(ctx: AnalyzerContext) -> List[Dict[str, Any]]:
+    """Analyzer plugin entry (see ``specify_cli.analyzers.registry``)."""
+    analyzer = BanditAnalyzer(ctx.root, exclude_globs=ctx.exclude_globs, files=ctx.files)
+    if ctx.buffers is not None:
+        return BanditAnalyzer.to_dicts(analyzer.scan_buffers(ctx.buffers))
+    return BanditAnalyzer.to_dicts(analyzer.run())
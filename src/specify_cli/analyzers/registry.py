@@ -0,0 +1,151 @@
+"""Analyzer plugin registry built from package entry points.
+
+Plugins are declared as ``AnalyzerPlugin`` objects exposed under the
+``specify_cli.analyzers`` entry-point group. The declaration module must be
+cheap to import: it only names the analyzer's implementation as a
+``"module:callable"`` string, which is imported when the analyzer actually
+runs. Declared capabilities drive scheduling in the runner:
+
+- ``scope``: ``"file"`` analyzers receive the discovered Python files,
+  ``"project"`` analyzers look at the project as a whole
+- ``cost``: ``"cpu"`` analyzers run in worker processes, ``"io"`` analyzers on threads
+- ``cacheable``: per-file results may be reused while file content is unchanged
+- ``kind``: ``"code"`` or ``"dependency"`` findings
+- ``in_memory``: the analyzer can scan ``AnalyzerContext.buffers`` instead of
+  files on disk (required by ``audit staged``)
+- ``async_target``: optional ``"module:coroutine function"`` with the same
+  signature as ``target``, awaited by ``specify_cli.async_runner`` instead
+  of running ``target`` on an executor
+
+Third-party packages register plugins in their ``pyproject.toml``::
+
+    [project.entry-points."specify_cli.analyzers"]
+    mytool = "mytool_speckit.plugin:PLUGIN"
+"""
+
+from __future__ import annotations
+import importlib
+import importlib.util
+import shutil
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+ENTRY_POINT_GROUP = "specify_cli.analyzers"
+
+
+@dataclass
+class AnalyzerContext:
+    """Inputs handed to an analyzer plugin (picklable for worker processes)."""
+
+    root: Path
+    files: List[Path] = field(default_factory=list)
+    exclude_globs: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    advisory_db: Optional[Path] = None
+    buffers: Optional[Dict[str, bytes]] = None  # path -> content, scanned instead of ``files``
+
+
+@dataclass(frozen=True)
+class AnalyzerPlugin:
+    """Declaration of an analyzer and its capabilities."""
+
+    name: str
+    target: str  # "module:callable", called with an AnalyzerContext, returns List[dict]
+    scope: str = "file"
+    cost: str = "cpu"
+    cacheable: bool = True
+    kind: str = "code"
+    in_memory: bool = False
+    async_target: Optional[str] = None  # "module:coroutine function", for run_all_async
+    requires_modules: Tuple[str, ...] = ()
+    requires_executables: Tuple[str, ...] = ()
+
+    def available(self) -> bool:
+        """Check requirements without importing them."""
+        return all(importlib.util.find_spec(m) is not None for m in self.requires_modules) and all(
+            shutil.which(e) for e in self.requires_executables
+        )
+
+    def version(self) -> str:
+        """Version string for cache keys: this package plus required distributions."""
+        parts = []
+        for dist in ("specify-cli",) + self.requires_modules:
+            try:
+                parts.append(f"{dist}=={metadata.version(dist)}")
+            except metadata.PackageNotFoundError:
+                parts.append(f"{dist}==unknown")
+        return ";".join(parts)
+
+    def load(self) -> Callable[[AnalyzerContext], List[dict]]:
+        """Import and return the analyzer callable."""
+        module, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module), attr)
+
+    def load_async(self) -> Optional[Callable[[AnalyzerContext], Awaitable[List[dict]]]]:
+        """Import and return the async analyzer, if the plugin declares one."""
+        if self.async_target is None:
+            return None
+        module, _, attr = self.async_target.partition(":")
+        return getattr(importlib.import_module(module), attr)
+
+
+BANDIT = AnalyzerPlugin(
+    name="bandit",
+    target="specify_cli.analyzers.bandit_analyzer:run_plugin",
+    scope="file",
+    cost="cpu",
+    cacheable=True,
+    kind="code",
+    in_memory=True,
+    requires_modules=("bandit",),
+)
+
+SAFETY = AnalyzerPlugin(
+    name="safety",
+    target="specify_cli.analyzers.safety_analyzer:run_plugin",
+    async_target="specify_cli.analyzers.safety_analyzer:run_plugin_async",
+    scope="project",
+    cost="io",
+    cacheable=False,
+    kind="dependency",
+    requires_executables=("safety",),
+)
+
+# Used when package metadata is unavailable (e.g. running from a source tree)
+BUILTINS = (BANDIT, SAFETY)
+
+
+@lru_cache(maxsize=1)
+def discover_plugins() -> Dict[str, AnalyzerPlugin]:
+    """Return all registered analyzer plugins keyed by name.
+
+    Built-ins always exist; entry points may add analyzers or override them.
+    """
+    plugins = {p.name: p for p in BUILTINS}
+    for ep in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            obj = ep.load()
+        except Exception as e:
+            log.warning(f"Could not load analyzer plugin '{ep.name}': {e}")
+            continue
+        if not isinstance(obj, AnalyzerPlugin):
+            log.warning(f"Entry point '{ep.name}' is not an AnalyzerPlugin; ignoring")
+            continue
+        plugins[ep.name] = obj
+    return plugins
+
+
+def get_plugin(name: str) -> AnalyzerPlugin:
+    """Look up a plugin by name.
+
+    Raises:
+        KeyError: No analyzer registered under that name
+    """
+    return discover_plugins()[name]
@@ -1,15 +1,27 @@
 from __future__ import annotations
+import asyncio
+import codecs
 import json
+import re
 import shlex
 import shutil
 import subprocess
+import tempfile
+import threading
 from dataclasses import dataclass, asdict
+from importlib import metadata
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import IO, List, Dict, Any, Iterator, Optional, Tuple
+from specify_cli.advisories import AdvisoryStore
+from specify_cli.analyzers.registry import AnalyzerContext
 from specify_cli.logging import get_logger
+from specify_cli.manifest import Pin, find_manifest, parse_manifest
 
 log = get_logger(__name__)
 
+DEFAULT_TIMEOUT = 300.0  # seconds
+READ_CHUNK = 64 * 1024
+
 
 @dataclass
 class SafetyFinding:
@@ -20,6 +32,138 @@ class SafetyFinding:
     severity: str
     vulnerable_spec: str
     fix_version: Optional[str]
+    imported: Optional[bool] = None  # set by the runner's import-reachability pass
+
+
+_STRUCTURAL = re.compile(r'[{}\[\]":\\]')
+
+
+class VulnerabilityStream:
+    """
+    Incremental JSON event parser for Safety output.
+
+    Yields each vulnerability object as soon as it is complete, from either
+    a top-level list (legacy) or the top-level ``vulnerabilities`` array.
+    Only the object currently being read is buffered, so memory does not
+    scale with the size of the whole document.
+
+    Anything other than exactly one top-level object or array (login
+    prompts, error text, trailing data) and a ``vulnerabilities`` value
+    that is not an array raise ``json.JSONDecodeError``, like ``json.loads``.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._stack: List[str] = []
+        self._in_str = False
+        self._esc = False
+        self._target: Optional[int] = None  # stack depth of the vulnerabilities array
+        self._key: Optional[str] = None  # last string seen at depth 1
+        self._top_key: Optional[str] = None  # last key seen at depth 1
+        self._key_parts: Optional[List[str]] = None
+        self._item_parts: Optional[List[str]] = None
+        self._expect_array = False  # next value is the top-level vulnerabilities value
+        self._seen = False  # the top-level value has started
+        self._done = False  # ... and ended
+        self._pos = 0
+
+    def _check_gap(self, gap: str, text: str, pos: int) -> None:
+        """Reject non-whitespace between structural characters where no value may be."""
+        if gap.strip() and self._expect_array:
+            raise json.JSONDecodeError("Safety 'vulnerabilities' is not an array", text, pos)
+        if gap.strip() and not self._stack:
+            raise json.JSONDecodeError("Non-JSON safety output", text, pos)
+
+    def feed(self, chunk: bytes) -> Iterator[Dict[str, Any]]:
+        text = self._decoder.decode(chunk)
+        key_start = 0 if self._key_parts is not None else -1
+        item_start = 0 if self._item_parts is not None else -1
+        skip = 0 if self._esc else -1
+        self._esc = False
+        gap_start = 0
+
+        for m in _STRUCTURAL.finditer(text):
+            i = m.start()
+            c = m.group()
+            if i == skip:
+                gap_start = i + 1
+                continue
+            if not self._in_str:
+                self._check_gap(text[gap_start:i], text, i)
+            gap_start = i + 1
+            if self._in_str:
+                if c == "\\":
+                    if i + 1 < len(text):
+                        skip = i + 1
+                    else:
+                        self._esc = True
+                elif c == '"':
+                    self._in_str = False
+                    if key_start >= 0 and self._key_parts is not None:
+                        self._key = "".join(self._key_parts) + text[key_start:i]
+                        self._key_parts = None
+                        key_start = -1
+                continue
+
+            if not self._stack and (c not in "{[" or self._done):
+                raise json.JSONDecodeError("Safety output is not one JSON object or array", text, i)
+            if self._expect_array:
+                if c != "[":
+                    raise json.JSONDecodeError("Safety 'vulnerabilities' is not an array", text, i)
+                self._expect_array = False
+            if c == '"':
+                self._in_str = True
+                if self._stack == ["{"]:
+                    self._key_parts = []
+                    key_start = i + 1
+            elif c == ":":
+                if len(self._stack) == 1:
+                    self._top_key = self._key
+                    self._expect_array = self._stack == ["{"] and self._key == "vulnerabilities"
+            elif c in "{[":
+                depth = len(self._stack)
+                if (
+                    c == "{"
+                    and self._target is not None
+                    and depth == self._target
+                    and self._item_parts is None
+                ):
+                    self._item_parts = []
+                    item_start = i
+                if c == "[" and self._target is None:
+                    if depth == 0 or (self._stack == ["{"] and self._top_key == "vulnerabilities"):
+                        self._target = depth + 1
+                self._seen = True
+                self._stack.append(c)
+            else:
+                opener = "{" if c == "}" else "["
+                if not self._stack or self._stack[-1] != opener:
+                    raise json.JSONDecodeError("Unbalanced safety JSON output", text, i)
+                self._stack.pop()
+                depth = len(self._stack)
+                self._done = depth == 0
+                if c == "}" and self._item_parts is not None and depth == self._target:
+                    doc = "".join(self._item_parts) + text[item_start : i + 1]
+                    self._item_parts = None
+                    item_start = -1
+                    yield json.loads(doc)
+                elif c == "]" and depth + 1 == self._target:
+                    self._target = -1  # array finished; ignore later arrays
+
+        if not self._in_str:
+            self._check_gap(text[gap_start:], text, len(text))
+        if self._key_parts is not None and key_start >= 0:
+            self._key_parts.append(text[key_start:])
+        if self._item_parts is not None and item_start >= 0:
+            self._item_parts.append(text[item_start:])
+        self._pos += len(text)
+
+    def close(self) -> None:
+        """Verify the document ended cleanly."""
+        if self._stack or self._in_str:
+            raise json.JSONDecodeError("Truncated safety JSON output", "", self._pos)
+        if not self._seen:
+            raise json.JSONDecodeError("No JSON in safety output", "", self._pos)
 
 
 class SafetyAnalyzer:
@@ -33,10 +177,21 @@ class SafetyAnalyzer:
       5) Pipfile.lock
       6) pyproject.toml
       else: scan current environment
+
+    With ``advisory_db`` set, pins are checked against the local offline
+    advisory store (see ``specify_cli.advisories``) without invoking safety.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        advisory_db: Optional[Path] = None,
+    ):
         self.root = Path(project_root)
+        self.timeout = timeout
+        # When set, advisories come from the local offline store instead of the safety CLI
+        self.advisory_db = Path(advisory_db) if advisory_db else None
 
     def _which_safety(self) -> str:
         exe = shutil.which("safety")
@@ -47,103 +202,265 @@ class SafetyAnalyzer:
         return exe
 
     def _choose_manifest(self) -> Tuple[str, Optional[Path]]:
-        cands = [
-            "requirements.txt",
-            "requirements-dev.txt",
-            "requirements.in",
-            "poetry.lock",
-            "Pipfile.lock",
-            "pyproject.toml",
-        ]
-        for name in cands:
-            p = self.root / name
-            if p.exists():
-                return ("file", p)
-        return ("env", None)
-
-    def _run_json(self, cmd: str) -> Dict[str, Any]:
-        try:
-            proc = subprocess.run(
-                shlex.split(cmd),
-                cwd=str(self.root),
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-        except FileNotFoundError:
-            log.error("safety command not found")
-            raise
-        except OSError as e:
-            log.error(f"OS error invoking safety: {e}")
-            raise
+        p = find_manifest(self.root)
+        return ("file", p) if p else ("env", None)
+
+    def _run_stream(self, cmd: str) -> List[SafetyFinding]:
+        """Run a safety command, building findings while its JSON streams in.
+
+        Raises:
+            subprocess.TimeoutExpired: safety did not finish within ``timeout``
+            subprocess.CalledProcessError: unexpected exit code
+            json.JSONDecodeError: malformed or truncated output
+        """
+        with tempfile.TemporaryFile() as err:
+            try:
+                proc = subprocess.Popen(
+                    shlex.split(cmd),
+                    cwd=str(self.root),
+                    stdout=subprocess.PIPE,
+                    stderr=err,
+                )
+            except FileNotFoundError:
+                log.error("safety command not found")
+                raise
+            except OSError as e:
+                log.error(f"OS error invoking safety: {e}")
+                raise
+
+            expired = threading.Event()
+
+            def _expire() -> None:
+                expired.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout, _expire) if self.timeout else None
+            if timer:
+                timer.daemon = True
+                timer.start()
+
+            parser = VulnerabilityStream()
+            findings: List[SafetyFinding] = []
+            parse_error: Optional[json.JSONDecodeError] = None
+            try:
+                assert proc.stdout is not None
+                with proc.stdout as out:
+                    for chunk in iter(lambda: out.read(READ_CHUNK), b""):
+                        if parse_error:
+                            continue  # drain so the exit code is still available
+                        try:
+                            findings.extend(self._to_finding(v) for v in parser.feed(chunk))
+                        except json.JSONDecodeError as e:
+                            parse_error = e
+                rc = proc.wait()
+            finally:
+                if timer:
+                    timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
 
-        if proc.returncode not in (0, 1):  # 1 can mean vulnerabilities found
-            log.error(f"safety failed rc={proc.returncode}: {proc.stderr.strip()}")
-            raise subprocess.CalledProcessError(proc.returncode, cmd, proc.stdout, proc.stderr)
+            if expired.is_set():
+                log.error(f"safety timed out after {self.timeout}s")
+                raise subprocess.TimeoutExpired(cmd, self.timeout or 0)
+            self._check_exit(cmd, rc, err)
 
-        out = proc.stdout.strip()
+        self._check_output(parser, parse_error)
+        return findings
+
+    async def _run_stream_async(self, cmd: str) -> List[SafetyFinding]:
+        """``_run_stream`` on ``asyncio.create_subprocess_exec``.
+
+        The process is killed if the awaiting task is cancelled.
+
+        Raises:
+            subprocess.TimeoutExpired: safety did not finish within ``timeout``
+            subprocess.CalledProcessError: unexpected exit code
+            json.JSONDecodeError: malformed or truncated output
+        """
+        with tempfile.TemporaryFile() as err:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *shlex.split(cmd),
+                    cwd=str(self.root),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=err,
+                )
+            except FileNotFoundError:
+                log.error("safety command not found")
+                raise
+            except OSError as e:
+                log.error(f"OS error invoking safety: {e}")
+                raise
+
+            parser = VulnerabilityStream()
+            findings: List[SafetyFinding] = []
+            parse_error: Optional[json.JSONDecodeError] = None
+
+            async def _consume() -> int:
+                nonlocal parse_error
+                assert proc.stdout is not None
+                while chunk := await proc.stdout.read(READ_CHUNK):
+                    if parse_error:
+                        continue  # drain so the exit code is still available
+                    try:
+                        findings.extend(self._to_finding(v) for v in parser.feed(chunk))
+                    except json.JSONDecodeError as e:
+                        parse_error = e
+                return await proc.wait()
+
+            try:
+                rc = await asyncio.wait_for(_consume(), self.timeout)
+            except asyncio.TimeoutError:
+                log.error(f"safety timed out after {self.timeout}s")
+                raise subprocess.TimeoutExpired(cmd, self.timeout or 0) from None
+            finally:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+            self._check_exit(cmd, rc, err)
+
+        self._check_output(parser, parse_error)
+        return findings
+
+    @staticmethod
+    def _check_exit(cmd: str, rc: int, err: IO[bytes]) -> None:
+        if rc not in (0, 1):  # 1 can mean vulnerabilities found
+            err.seek(0)
+            stderr = err.read().decode("utf-8", "replace")
+            log.error(f"safety failed rc={rc}: {stderr.strip()}")
+            raise subprocess.CalledProcessError(rc, cmd, None, stderr)
+
+    @staticmethod
+    def _check_output(
+        parser: VulnerabilityStream, parse_error: Optional[json.JSONDecodeError]
+    ) -> None:
         try:
-            return json.loads(out or "{}")
+            if parse_error:
+                raise parse_error
+            parser.close()
         except json.JSONDecodeError:
             log.error("Failed to parse safety JSON output")
             raise
 
-    def run(self) -> List[SafetyFinding]:
+    def _run_offline(self) -> List[SafetyFinding]:
+        """Check manifest pins (or the current environment) against the offline store."""
+        assert self.advisory_db is not None
+        if not self.advisory_db.exists():
+            msg = (
+                f"Advisory database not found: {self.advisory_db}. Run 'specify advisories import'."
+            )
+            log.error(msg)
+            raise FileNotFoundError(msg)
+
+        mode, manifest = self._choose_manifest()
+        if mode == "file" and manifest:
+            log.info(f"Checking {manifest.name} against offline advisory DB")
+            pins = parse_manifest(manifest)
+        else:
+            log.warning("No supported manifest found. Checking current Python environment.")
+            pins = [Pin(d.metadata["Name"], d.version) for d in metadata.distributions()]
+
+        findings: List[SafetyFinding] = []
+        with AdvisoryStore(self.advisory_db) as store, store.transaction():
+            for pin in pins:
+                for adv in store.check(pin.name, pin.version):
+                    findings.append(
+                        SafetyFinding(
+                            package=pin.name,
+                            installed_version=pin.version,
+                            advisory_id=adv.advisory_id,
+                            cve=adv.cve,
+                            severity=adv.severity,
+                            vulnerable_spec=" || ".join(adv.vulnerable_specs),
+                            fix_version=adv.fix_version,
+                        )
+                    )
+        return findings
+
+    def _commands(self) -> Tuple[str, str]:
+        """The ``safety scan`` command and its legacy ``safety check`` fallback."""
         self._which_safety()
         mode, manifest = self._choose_manifest()
 
-        data: Optional[Dict[str, Any]] = None
         if mode == "file" and manifest:
             log.info(f"Running safety against {manifest.name}")
-            # New CLI
-            try:
-                data = self._run_json(f"safety scan --json --file {shlex.quote(str(manifest))}")
-            except (subprocess.SubprocessError, json.JSONDecodeError, RuntimeError):
-                # safety scan failed - try legacy command
-                log.warning("safety scan failed. Trying legacy 'safety check --json --file'.")
-                data = self._run_json(f"safety check --json --file {shlex.quote(str(manifest))}")
+            primary = f"safety scan --json --file {shlex.quote(str(manifest))}"
+            legacy = f"safety check --json --file {shlex.quote(str(manifest))}"
         else:
             log.warning("No supported manifest found. Scanning current Python environment.")
-            try:
-                data = self._run_json("safety scan --json")
-            except (subprocess.SubprocessError, json.JSONDecodeError, RuntimeError):
-                # safety scan failed - try legacy command
-                log.warning("safety scan failed. Trying legacy 'safety check --json'.")
-                data = self._run_json("safety check --json")
+            primary = "safety scan --json"
+            legacy = "safety check --json"
+        return primary, legacy
 
-        findings: List[SafetyFinding] = []
-        vulns = []
-        if isinstance(data, dict) and "vulnerabilities" in data:
-            vulns = data.get("vulnerabilities", [])
-        elif isinstance(data, list):
-            vulns = data
-
-        for v in vulns:
-            pkg = v.get("package_name") or v.get("package") or v.get("name") or ""
-            inst_ver = v.get("installed_version") or v.get("version") or ""
-            adv_id = v.get("vulnerability_id") or v.get("id") or v.get("advisory_id") or ""
-            severity = (v.get("severity") or "").upper() or "UNKNOWN"
-            spec = v.get("affected_versions") or v.get("spec") or ""
-            fix = None
-            if isinstance(v.get("fix_versions"), list) and v["fix_versions"]:
-                fix = v["fix_versions"][0]
-            elif v.get("fixed_version"):
-                fix = v.get("fixed_version")
-            cve = v.get("cve") or v.get("CVE") or None
-
-            findings.append(
-                SafetyFinding(
-                    package=pkg,
-                    installed_version=inst_ver,
-                    advisory_id=str(adv_id),
-                    cve=cve,
-                    severity=severity,
-                    vulnerable_spec=str(spec),
-                    fix_version=fix,
-                )
-            )
-        return findings
+    def run(self) -> List[SafetyFinding]:
+        if self.advisory_db:
+            return self._run_offline()
+
+        primary, legacy = self._commands()
+        # New CLI
+        try:
+            return self._run_stream(primary)
+        except subprocess.TimeoutExpired:
+            # Retrying the legacy command would only double the wait
+            raise
+        except (subprocess.SubprocessError, json.JSONDecodeError, RuntimeError):
+            # safety scan failed - try legacy command
+            log.warning(f"safety scan failed. Trying legacy '{legacy}'.")
+            return self._run_stream(legacy)
+
+    async def run_async(self) -> List[SafetyFinding]:
+        """``run`` without blocking the event loop; cancelling it kills safety."""
+        if self.advisory_db:
+            return await asyncio.to_thread(self._run_offline)
+
+        primary, legacy = self._commands()
+        try:
+            return await self._run_stream_async(primary)
+        except subprocess.TimeoutExpired:
+            raise
+        except (subprocess.SubprocessError, json.JSONDecodeError, RuntimeError):
+            log.warning(f"safety scan failed. Trying legacy '{legacy}'.")
+            return await self._run_stream_async(legacy)
+
+    @staticmethod
+    def _to_finding(v: Dict[str, Any]) -> SafetyFinding:
+        pkg = v.get("package_name") or v.get("package") or v.get("name") or ""
+        inst_ver = v.get("installed_version") or v.get("version") or ""
+        adv_id = v.get("vulnerability_id") or v.get("id") or v.get("advisory_id") or ""
+        severity = (v.get("severity") or "").upper() or "UNKNOWN"
+        spec = v.get("affected_versions") or v.get("spec") or ""
+        fix = None
+        if isinstance(v.get("fix_versions"), list) and v["fix_versions"]:
+            fix = v["fix_versions"][0]
+        elif v.get("fixed_version"):
+            fix = v.get("fixed_version")
+        cve = v.get("cve") or v.get("CVE") or None
+
+        return SafetyFinding(
+            package=pkg,
+            installed_version=inst_ver,
+            advisory_id=str(adv_id),
+            cve=cve,
+            severity=severity,
+            vulnerable_spec=str(spec),
+            fix_version=fix,
+        )
 
     @staticmethod
     def to_dicts(items: List[SafetyFinding]) -> List[Dict[str, Any]]:
         return [asdict(i) for i in items]
+
+
+def run_plugin(ctx: AnalyzerContext) -> List[Dict[str, Any]]:
+    """Analyzer plugin entry (see ``specify_cli.analyzers.registry``)."""
+    timeout = DEFAULT_TIMEOUT if ctx.timeout is None else min(DEFAULT_TIMEOUT, ctx.timeout)
+    analyzer = SafetyAnalyzer(ctx.root, timeout=timeout, advisory_db=ctx.advisory_db)
+    return SafetyAnalyzer.to_dicts(analyzer.run())
+
+
+async def run_plugin_async(ctx: AnalyzerContext) -> List[Dict[str, Any]]:
+    """Async analyzer plugin entry, used by ``specify_cli.async_runner``."""
+    timeout = DEFAULT_TIMEOUT if ctx.timeout is None else min(DEFAULT_TIMEOUT, ctx.timeout)
+    analyzer = SafetyAnalyzer(ctx.root, timeout=timeout, advisory_db=ctx.advisory_db)
+    return SafetyAnalyzer.to_dicts(await analyzer.run_async())
@@ -0,0 +1,449 @@
+"""Library entry point for running audits.
+
+``audit`` performs the same analysis as ``specify audit run`` and returns
+an ``AuditResult`` (findings, timings and gate status) instead of printing
+panels, writing files and exiting. Reports are optional sinks: pass
+``report_writer`` and ``last_run_writer`` (what the CLI writes) or any
+callable taking the result in ``reporters``.
+
+Example:
+    >>> result = audit(repo, fail_on="MEDIUM", reporters=[report_writer("json", out)])
+    >>> result.exit_code, len(result.code)
+"""
+
+from __future__ import annotations
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from specify_cli.analyzers.registry import discover_plugins
+from specify_cli.baseline import BASELINE_PATH, close_baseline, load_baseline
+from specify_cli.checkpoint import clear_checkpoint
+from specify_cli.config import SpecKitConfig, load_config
+from specify_cli.errors import SpecKitError
+from specify_cli.pipeline import StageStats
+from specify_cli.reporters.html import write_html
+from specify_cli.reporters.sarif import stream_sarif, write_sarif
+from specify_cli.runner import RunConfig, WorkerPool, run_all
+from specify_cli.sharding import Shard, canonical_key, canonical_order, shard_suffix
+from specify_cli.spill import SpillList, dump_json, parse_size
+from specify_cli.store import save_last_run
+
+REPORT_FORMATS = ("json", "sarif", "html")
+
+
+class AuditError(SpecKitError):
+    """An audit could not be started."""
+
+
+class Gate:
+    """Pass/fail gate evaluated incrementally as findings arrive.
+
+    Fails on any finding at or above the severity threshold, or once more
+    than ``max_findings`` findings have been seen (``-1``: unlimited).
+    """
+
+    def __init__(self, threshold: str, max_findings: int = -1):
+        self.threshold = threshold.upper()
+        self.max_findings = max_findings
+        self.severities: Counter = Counter()
+        self.total = 0
+
+    def add(self, findings: Iterable[dict]) -> Gate:
+        """Count more findings."""
+        for f in findings:
+            self.severities[str(f.get("severity", "")).upper()] += 1
+            self.total += 1
+        return self
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the gate fails, or None while it passes."""
+        sev = self.severities
+        high = sev["HIGH"] + sev["CRITICAL"]
+        counted = {
+            "HIGH": high,
+            "MEDIUM": high + sev["MEDIUM"],
+            "LOW": high + sev["MEDIUM"] + sev["LOW"],
+        }.get(self.threshold, 0)
+        if counted > 0:
+            return f"{counted} findings at or above {self.threshold}"
+        if 0 <= self.max_findings < self.total:
+            return f"Exceeded maximum findings limit ({self.total} > {self.max_findings})"
+        return None
+
+    @property
+    def code(self) -> int:
+        """1 if the gate fails, 0 otherwise."""
+        return 0 if self.reason is None else 1
+
+
+def gate_code(findings: Iterable[dict], threshold: str) -> int:
+    """Check if findings exceed severity threshold.
+
+    Args:
+        findings: List of finding dictionaries
+        threshold: Severity threshold (HIGH, MEDIUM, LOW)
+
+    Returns:
+        1 if threshold exceeded, 0 otherwise
+    """
+    return Gate(threshold).add(findings).code
+
+
+def analyzer_available(name: str, advisory_db: Optional[Path] = None) -> bool:
+    """Whether a registered analyzer can run here.
+
+    The offline advisory DB replaces the safety CLI.
+    """
+    plugins = discover_plugins()
+    if name not in plugins:
+        return False
+    return (name == "safety" and bool(advisory_db)) or plugins[name].available()
+
+
+@dataclass
+class AuditResult:
+    """Outcome of one audit."""
+
+    path: Path
+    code: Union[List[dict], SpillList] = field(default_factory=list)  # SpillList with max_memory
+    dependencies: List[dict] = field(default_factory=list)
+    threshold: str = "HIGH"
+    exit_code: int = 0  # 0 pass, 1 findings above threshold, 2 strict-mode failure
+    failure: Optional[str] = None  # why the gate failed
+    failed_fast: bool = False  # the gate failed mid-run and the rest was cancelled
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per analyzer
+    seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    incomplete: List[str] = field(default_factory=list)
+    partial: bool = False
+    coverage: Dict[str, Any] = field(default_factory=dict)
+    suppressed: int = 0  # findings dropped by the baseline
+    cached: int = 0
+    resumed: int = 0
+    shard: Optional[Shard] = None
+    time_budget: Optional[float] = None
+    reports: List[Path] = field(default_factory=list)  # files written by reporters
+
+    @property
+    def passed(self) -> bool:
+        return self.exit_code == 0
+
+    def __iter__(self) -> Iterator[dict]:
+        """All findings, code first."""
+        yield from self.code
+        yield from self.dependencies
+
+    def table(self) -> List[Tuple[str, str, str, str]]:
+        """One ``(severity, id, location, message)`` row per finding."""
+        rows = [
+            (
+                str(f.get("severity", "UNKNOWN")).upper(),
+                str(f.get("rule_id", "")),
+                f"{f.get('file_path', '')}:{f.get('line', '')}",
+                str(f.get("message", "")),
+            )
+            for f in self.code
+        ]
+        rows.extend(
+            (
+                str(d.get("severity", "UNKNOWN")).upper(),
+                str(d.get("advisory_id", "")),
+                f"{d.get('package', '')}=={d.get('installed_version', '')}",
+                str(d.get("vulnerable_spec", "")),
+            )
+            for d in self.dependencies
+        )
+        return rows
+
+    def to_report(self) -> Dict[str, Any]:
+        """The JSON report document written by ``audit run``."""
+        report: Dict[str, Any] = {"code": self.code, "dependencies": self.dependencies}
+        if self.incomplete:
+            report["incomplete"] = list(self.incomplete)
+        if self.shard:
+            report["shard"] = {"index": self.shard[0], "count": self.shard[1]}
+        if self.time_budget:
+            report["partial"] = self.partial
+            report["coverage"] = self.coverage
+        elif self.failed_fast:
+            report["partial"] = True
+        if self.failed_fast:
+            report["failed_fast"] = self.failure
+        return report
+
+
+Reporter = Callable[[AuditResult], Optional[Path]]
+
+
+def report_writer(fmt: str, out_dir: Path) -> Reporter:
+    """Reporter writing the ``audit run`` report (json, sarif or html) into ``out_dir``.
+
+    Sharded results get the shard in the file name, e.g.
+    ``analysis.shard-0-of-4.json``.
+    """
+    fmt = fmt.lower() if fmt.lower() in REPORT_FORMATS else "json"
+    out_dir = Path(out_dir)
+
+    def _write(result: AuditResult) -> Path:
+        suffix = f".{shard_suffix(result.shard)}" if result.shard else ""
+        if fmt == "sarif":
+            sarif = stream_sarif(
+                result.code,
+                result.dependencies,
+                repo_root=result.path,
+                dep_artifact_hint="requirements.txt",
+            )
+            props = sarif["runs"][0].setdefault("properties", {})
+            if result.shard:
+                props["shard"] = {"index": result.shard[0], "count": result.shard[1]}
+            if result.time_budget:
+                props["partial"] = result.partial
+                props["coverage"] = result.coverage
+            elif result.failed_fast:
+                props["partial"] = True
+            if result.failed_fast:
+                props["failed_fast"] = result.failure
+            if not props:
+                del sarif["runs"][0]["properties"]
+            return write_sarif(sarif, out_dir / f"report{suffix}.sarif")
+        if fmt == "html":
+            notice = None
+            if result.failed_fast:
+                notice = f"Partial report: stopped at the first gate failure ({result.failure})."
+            elif result.partial and result.time_budget:
+                cov = result.coverage
+                notice = (
+                    f"Partial report: time budget of {result.time_budget:g}s reached after "
+                    f"analyzing {cov.get('files_analyzed', 0)} of {cov.get('files_total', 0)} files."
+                )
+            return write_html(
+                result.code, result.dependencies, out_dir / f"report{suffix}.html", notice=notice
+            )
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out = out_dir / f"analysis{suffix}.json"
+        with open(out, "w") as fh:
+            dump_json(result.to_report(), fh)
+        return out
+
+    return _write
+
+
+def last_run_writer(out_dir: Path) -> Reporter:
+    """Reporter saving ``last_run.json`` for delta reporting and budget ordering.
+
+    Sharded runs are skipped (``audit merge`` writes it), and so are partial
+    runs, which keep the previous one.
+    """
+
+    def _write(result: AuditResult) -> Optional[Path]:
+        if result.shard or result.partial:
+            return None
+        return save_last_run({"code": result.code, "dependencies": result.dependencies}, out_dir)
+
+    return _write
+
+
+def audit(
+    path: Path,
+    config: Optional[SpecKitConfig] = None,
+    *,
+    fail_on: Optional[str] = None,
+    respect_baseline: Optional[bool] = None,
+    changed_only: Optional[bool] = None,
+    bandit: Optional[bool] = None,
+    safety: Optional[bool] = None,
+    analyzers: Optional[Sequence[str]] = None,
+    advisory_db: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    max_workers: Union[int, str, None] = None,
+    max_memory: Union[int, str, None] = None,
+    shard: Optional[Shard] = None,
+    time_budget: Optional[float] = None,
+    checkpoint: bool = False,
+    resume: bool = False,
+    strict: bool = False,
+    fail_fast: bool = False,
+    max_findings: Optional[int] = None,
+    baseline_path: Optional[Path] = None,
+    shared_baseline: Optional[Path] = None,
+    reporters: Sequence[Reporter] = (),
+    sinks: Sequence[Callable[[str, List[dict]], None]] = (),
+    workers: Optional[WorkerPool] = None,
+) -> AuditResult:
+    """Run an audit and return its findings and gate status.
+
+    Keyword arguments override the matching ``.speckit.toml`` settings,
+    like the flags of ``specify audit run``. Unavailable analyzers are
+    skipped unless ``strict`` is set.
+
+    Args:
+        path: Repository to audit
+        config: Configuration (default: loaded from ``path``)
+        fail_on: Severity threshold for the gate
+        respect_baseline: Drop findings recorded in the baseline
+        changed_only: Limit analysis to changed files
+        bandit: Run Bandit
+        safety: Run Safety
+        analyzers: Extra analyzer plugins by name
+        advisory_db: Check dependencies against an offline advisory DB, relative
+            to ``path`` unless absolute
+        timeout: Overall deadline in seconds
+        use_cache: Reuse per-file results for unchanged files
+        cache_dir: Result cache location (default: under ``path``)
+        max_workers: Worker count or ``"auto"`` (default: ``[performance]``)
+        max_memory: Bytes (or a size like ``"512M"``) of findings to keep in
+            memory; beyond it findings spill to a segment file in the output
+            directory and ``AuditResult.code`` is a ``SpillList``
+            (default: ``[performance]``, unlimited)
+        shard: Scan one ``(index, count)`` shard of the files
+        time_budget: Seconds to spend, riskiest files first
+        checkpoint: Checkpoint progress into the output directory
+        resume: Reuse results from the last checkpoint
+        strict: Require every requested analyzer; incomplete or partial
+            results exit with 2
+        fail_fast: Evaluate the gate as findings arrive and cancel the rest
+            of the run once it fails; the result is partial
+        max_findings: Fail the gate above this many findings, -1 for no
+            limit (default: ``[ci].max_findings``)
+        baseline_path: Baseline file (default: ``<path>/.speckit/baseline.json``)
+        shared_baseline: Organization-wide baseline consulted after it, relative
+            to ``path`` unless absolute (default: ``[analysis].shared_baseline``)
+        reporters: Called with the result once analysis is done; paths they
+            return are listed in ``AuditResult.reports``
+        sinks: Called with ``(analyzer, findings)`` as findings arrive
+        workers: Shared worker pool (see ``run_all``)
+
+    Returns:
+        The audit result
+
+    Raises:
+        AuditError: ``strict`` is set and a requested analyzer is unavailable
+        ConfigError: Invalid ``max_workers`` or ``max_memory``
+    """
+    start = time.monotonic()
+    path = Path(path)
+    cfg = config or load_config(path)
+    assert cfg.output is not None
+    assert cfg.analysis is not None
+    assert cfg.analyzers is not None
+    assert cfg.performance is not None
+    assert cfg.ci is not None
+    threshold = fail_on or cfg.analysis.fail_on
+    use_baseline = cfg.analysis.respect_baseline if respect_baseline is None else respect_baseline
+    out_dir = path / cfg.output.directory
+    memory = cfg.performance.max_memory if max_memory is None else max_memory
+    limit = cfg.ci.max_findings if max_findings is None else max_findings
+    shared = shared_baseline or cfg.analysis.shared_baseline
+    advisory_db = path / advisory_db if advisory_db else None
+    cancel = threading.Event() if fail_fast else None
+    early = Gate(threshold, limit)
+
+    def _gate_sink(name: str, findings: List[dict]) -> None:
+        if early.add(findings).code and cancel is not None:
+            cancel.set()
+
+    run_cfg = RunConfig(
+        path=path,
+        changed_only=cfg.analysis.changed_only if changed_only is None else changed_only,
+        use_bandit=cfg.analyzers.bandit if bandit is None else bandit,
+        use_safety=cfg.analyzers.safety if safety is None else safety,
+        exclude_globs=list(cfg.exclude_paths or []),
+        advisory_db=advisory_db,
+        timeout=timeout,
+        analyzers=list(cfg.analyzers.plugins or [] if analyzers is None else analyzers),
+        baseline=(
+            load_baseline(
+                baseline_path or path / BASELINE_PATH,
+                root=path,
+                shared=path / shared if shared else None,
+            )
+            if use_baseline
+            else None
+        ),
+        sinks=list(sinks) + ([_gate_sink] if fail_fast else []),
+        use_cache=use_cache,
+        cache_dir=cache_dir,
+        max_workers=cfg.performance.max_workers if max_workers is None else max_workers,
+        shard=shard,
+        time_budget=time_budget,
+        history_dir=out_dir,
+        checkpoint_dir=(
+            (out_dir / shard_suffix(shard) if shard else out_dir) if checkpoint else None
+        ),
+        resume=resume,
+        max_memory=parse_size(memory) if memory is not None else None,
+        spill_dir=out_dir,
+        cancel=cancel,
+    )
+    if strict:
+        missing = [n for n in run_cfg.enabled_analyzers() if not analyzer_available(n, advisory_db)]
+        if missing:
+            raise AuditError(f"Missing analyzers: {', '.join(missing)}")
+
+    try:
+        results = run_all(run_cfg, workers)
+    finally:
+        close_baseline(run_cfg.baseline)  # memory-mapped; sessions like the daemon's live long
+
+    plugins = discover_plugins()
+    code: Union[List[dict], SpillList] = []
+    if run_cfg.max_memory is not None:
+        code = SpillList(run_cfg.max_memory, out_dir, key=canonical_key)
+    deps: List[dict] = []
+    for name, findings in results.items():
+        kind = plugins[name].kind if name in plugins else "code"
+        (deps if kind == "dependency" else code).extend(findings)
+        if isinstance(findings, SpillList):
+            findings.close()
+    result = AuditResult(
+        path=path,
+        # Canonical order, so sharded reports merge to exactly this output
+        code=code if isinstance(code, SpillList) else canonical_order(code),
+        dependencies=deps,
+        threshold=threshold,
+        timings=dict(getattr(results, "timings", {})),
+        stages=dict(getattr(results, "stages", {})),
+        incomplete=list(getattr(results, "incomplete", [])),
+        partial=bool(getattr(results, "partial", False)),
+        coverage=dict(getattr(results, "coverage", {})),
+        suppressed=sum(getattr(results, "suppressed", {}).values()),
+        cached=getattr(results, "cached", 0),
+        resumed=getattr(results, "resumed", 0),
+        shard=shard,
+        time_budget=time_budget,
+    )
+    gate = Gate(threshold, limit).add(result.code).add(deps)
+    result.exit_code = gate.code
+    result.failure = gate.reason
+    if getattr(results, "cancelled", False):
+        result.failed_fast = result.partial = True
+    if strict and (result.incomplete or result.partial) and not result.failed_fast:
+        result.exit_code = 2
+
+    for reporter in reporters:
+        written = reporter(result)
+        if written is not None:
+            result.reports.append(written)
+    if checkpoint and not result.partial and not result.incomplete:
+        assert run_cfg.checkpoint_dir is not None
+        clear_checkpoint(run_cfg.checkpoint_dir)
+    result.seconds = round(time.monotonic() - start, 3)
+    return result
@@ -0,0 +1,285 @@
+"""Asyncio counterpart of ``run_all`` for services running on an event loop.
+
+``run_all_async`` streams findings as an async iterator without blocking
+the loop: file reads, hashing and result-cache access run on the loop's
+default thread executor, CPU-bound analyzers on a process pool, and
+analyzers that declare an ``async_target`` (Safety, which drives its CLI
+through ``asyncio.create_subprocess_exec``) are awaited directly. Many
+audits can therefore share one loop and one executor.
+
+Cancelling the consuming task, or closing the iterator early, cancels all
+outstanding analysis and kills external tools. Work already running inside
+a worker process finishes in the background.
+
+Example:
+    >>> async for analyzer, findings in run_all_async(RunConfig(path=repo)):
+    ...     publish(analyzer, findings)
+"""
+
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from specify_cli.analyzers.registry import AnalyzerContext, AnalyzerPlugin
+from specify_cli.baseline import filter_with_baseline, stamp_fingerprints
+from specify_cli.discovery import iter_python_files
+from specify_cli.import_index import ImportIndex, tag_reachability
+from specify_cli.logging import get_logger
+from specify_cli.resources import resolve_workers
+from specify_cli.result_cache import CACHE_DIR, ResultCache
+from specify_cli.runner import (
+    FileWork,
+    RunConfig,
+    RunResults,
+    _FileSteps,
+    _run_plugin,
+    _sink,
+    open_checkpoint,
+    select_plugins,
+)
+
+log = get_logger(__name__)
+
+Chunk = Tuple[str, List[dict]]
+
+
+class AsyncRun:
+    """Async iterator of ``(analyzer, findings)`` chunks for one run.
+
+    Code findings arrive per file as batches complete, in discovery order;
+    project-level analyzers follow. Run metadata (``incomplete``,
+    ``timings``, ``suppressed``, ``cached``, ``resumed``) accumulates in
+    ``results`` and is complete once iteration ends.
+    """
+
+    def __init__(self, cfg: RunConfig, executor: Optional[Executor] = None):
+        """Prepare a run; nothing starts until iteration begins.
+
+        Args:
+            cfg: Run configuration (``time_budget`` is not supported)
+            executor: Executor for CPU-bound analyzers, e.g. one shared by
+                concurrent audits (default: a process pool for this run)
+        """
+        self.cfg = cfg
+        self.executor = executor
+        self.results = RunResults()
+        self._gen: Optional[AsyncIterator[Chunk]] = None
+
+    def __aiter__(self) -> AsyncRun:
+        return self
+
+    async def __anext__(self) -> Chunk:
+        if self._gen is None:
+            self._gen = self._stream()
+        return await self._gen.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop early, cancelling outstanding analysis."""
+        if self._gen is not None:
+            await self._gen.aclose()  # type: ignore[attr-defined]
+
+    async def collect(self) -> RunResults:
+        """Run to completion; the async equivalent of ``run_all``."""
+        file_plugins, project_plugins = select_plugins(self.cfg)
+        share = len(file_plugins) + len(project_plugins)
+        for p in file_plugins:
+            self.results[p.name] = self.cfg.findings_list(share)
+        async for name, findings in self:
+            self.results.setdefault(name, self.cfg.findings_list(share)).extend(findings)
+        for name in self.results.incomplete:
+            self.results.pop(name, None)
+        return self.results
+
+    async def _stream(self) -> AsyncIterator[Chunk]:
+        cfg = self.cfg
+        out = self.results
+        root = Path(cfg.path)
+        excludes = cfg.exclude_globs or []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + cfg.timeout if cfg.timeout else None
+        if cfg.time_budget:
+            log.warning("time_budget is not supported by run_all_async; ignoring")
+
+        file_plugins, project_plugins = select_plugins(cfg)
+        dependency = any(p.kind == "dependency" for p in file_plugins + project_plugins)
+        owned = self.executor is None and any(p.cost == "cpu" for p in file_plugins)
+        workers = resolve_workers(cfg.max_workers, cfg.history_dir)
+        executor = _process_pool(workers) if owned else self.executor
+        checkpoint = open_checkpoint(cfg, file_plugins)
+
+        def _remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        def _ctx(files: List[Path]) -> AnalyzerContext:
+            return AnalyzerContext(
+                root=root,
+                files=files,
+                exclude_globs=excludes,
+                timeout=_remaining(),
+                advisory_db=cfg.advisory_db,
+            )
+
+        async def _call(plugin: AnalyzerPlugin, files: List[Path]) -> List[dict]:
+            coro = plugin.load_async()
+            if coro is not None:
+                return await coro(_ctx(files))
+            pool = executor if plugin.cost == "cpu" else None
+            return await loop.run_in_executor(pool, _run_plugin, plugin, _ctx(files))
+
+        started = time.monotonic()
+        project: Dict[str, asyncio.Task] = {}
+        inflight: Deque[asyncio.Task] = deque()
+        try:
+            for p in project_plugins:
+                task = asyncio.create_task(_call(p, []))
+                task.add_done_callback(
+                    lambda _t, name=p.name: out.timings.__setitem__(
+                        name, time.monotonic() - started
+                    )
+                )
+                project[p.name] = task
+
+            index: Optional[ImportIndex] = None
+            if file_plugins or dependency:
+                index = ImportIndex(root) if dependency else None
+                cache = ResultCache(cfg.cache_dir or root / CACHE_DIR) if cfg.use_cache else None
+                steps = _FileSteps(cfg, file_plugins, cache, index, checkpoint)
+                io_lock = asyncio.Lock()  # steps are not safe to run concurrently
+
+                async def _batch(paths: List[Path]) -> List[FileWork]:
+                    async with io_lock:
+                        batch = await asyncio.to_thread(_prepare, steps, paths)
+                    active = [p for p in file_plugins if any(p in w.pending for w in batch)]
+                    found = await asyncio.gather(
+                        *(_call(p, [w.path for w in batch if p in w.pending]) for p in active)
+                    )
+                    async with io_lock:
+                        await asyncio.to_thread(_finish, steps, batch, active, found)
+                    return batch
+
+                files = await asyncio.to_thread(lambda: list(iter_python_files(root, excludes)))
+                limit = workers * 2
+                timed_out = False
+                for i in range(0, len(files) + cfg.batch_size, cfg.batch_size):
+                    if i < len(files):
+                        inflight.append(asyncio.create_task(_batch(files[i : i + cfg.batch_size])))
+                    # Batches are yielded in submission order so output order is
+                    # stable; wait only while more than ``limit`` are in flight
+                    while inflight and (
+                        len(inflight) > limit or i >= len(files) or inflight[0].done()
+                    ):
+                        done, _ = await asyncio.wait([inflight[0]], timeout=_remaining())
+                        if not done:
+                            timed_out = True
+                            break
+                        for work in inflight.popleft().result():
+                            for name, findings in work.results.items():
+                                if findings:
+                                    _sink(cfg, name, findings)
+                                    yield name, findings
+                    if timed_out:
+                        break
+
+                out.suppressed.update(steps.suppressed)
+                out.cached = cache.hits if cache else 0
+                if timed_out:
+                    out.incomplete.extend(p.name for p in file_plugins)
+                    index = None
+                else:
+                    for p in file_plugins:
+                        out.timings[p.name] = time.monotonic() - started
+                    if index is not None:
+                        index.prune(steps.seen)
+                        await asyncio.to_thread(index.save)
+
+            if project:
+                await asyncio.wait(project.values(), timeout=_remaining())
+            for p in project_plugins:
+                task = project[p.name]
+                if not task.done() or _timed_out(task):
+                    out.incomplete.append(p.name)
+                    out.timings.pop(p.name, None)
+                    continue
+                findings = task.result()
+                if p.kind == "dependency" and index is not None:
+                    findings = tag_reachability(findings, index)
+                stamp_fingerprints(findings, root=root)
+                if p.kind == "code" and cfg.baseline:
+                    kept = filter_with_baseline(findings, cfg.baseline)
+                    out.suppressed[p.name] = len(findings) - len(kept)
+                    findings = kept
+                _sink(cfg, p.name, findings)
+                yield p.name, findings
+        finally:
+            pending = list(inflight) + list(project.values())
+            for task in pending:
+                task.cancel()
+            # Let cancelled analyzers clean up (e.g. kill safety) before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+            if checkpoint is not None:
+                await asyncio.to_thread(checkpoint.flush)
+                out.resumed = checkpoint.resumed
+            if owned and executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if out.incomplete:
+            log.warning(
+                f"Analyzers did not finish before the deadline: {', '.join(out.incomplete)}"
+            )
+
+
+def run_all_async(cfg: RunConfig, executor: Optional[Executor] = None) -> AsyncRun:
+    """Run all enabled analyzers without blocking the event loop.
+
+    Iterate the result for ``(analyzer, findings)`` chunks as they are
+    produced, or await ``collect()`` for the same ``RunResults`` that
+    ``run_all`` returns. Honors ``timeout``, ``shard``, the result cache,
+    the baseline, sinks and checkpoints like ``run_all``.
+
+    Args:
+        cfg: Run configuration
+        executor: Executor for CPU-bound analyzers (default: a process pool
+            owned by this run); IO-bound analyzers use the loop's default
+            executor
+
+    Returns:
+        An async iterator over the run's findings
+    """
+    return AsyncRun(cfg, executor)
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # The event loop already runs threads, which forking would copy mid-flight
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def _prepare(steps: _FileSteps, paths: List[Path]) -> List[FileWork]:
+    return [ready for path in paths for work in steps.read(path) for ready in steps.lookup(work)]
+
+
+def _finish(
+    steps: _FileSteps,
+    batch: List[FileWork],
+    plugins: List[AnalyzerPlugin],
+    found: List[List[dict]],
+) -> None:
+    for plugin, findings in zip(plugins, found):
+        steps._assign(plugin.name, batch, findings)
+    for work in batch:
+        steps.release(work)
+        for _ in steps.filter(work):
+            pass
+
+
+def _timed_out(task: asyncio.Task) -> bool:
+    """True if a finished analyzer failed only because it hit its deadline."""
+    exc = task.exception()
+    return isinstance(exc, (asyncio.TimeoutError, subprocess.TimeoutExpired))
@@ -1,35 +1,155 @@
 """Baseline management for Spec-Kit.
 
 Create and manage baselines to suppress existing findings during adoption.
+
+Every baseline identifies findings by ``fingerprint``. Runs consult the
+compiled index (see ``specify_cli.baseline_index``) that ``load_baseline``
+builds from either JSON format.
+
+The runners store each finding's fingerprint, with its path relative to the
+scan root, on it when it arrives (``stamp_fingerprints``); baseline filtering, delta reports, SARIF and the
+run store read it back with ``finding_fingerprint`` instead of hashing
+again. Where the file's source is at hand they also store its context
+fingerprint (``specify_cli.source_context``), which leaves out the line
+number: ``write_baseline`` records that one, and filtering accepts either,
+so findings that only moved stay baselined.
+
+``Baseline.save`` does not rewrite the JSON snapshot for every change: it
+appends the changes to a journal next to it (``baseline.json`` →
+``baseline.journal``, one JSON record per line, fsynced), and readers
+replay the journal over the snapshot. ``Baseline.compact`` folds the
+journal back into the snapshot, explicitly or once the journal reaches
+``compact_threshold`` records.
+
+Large repositories can split the fingerprint list by directory instead
+(``write_sharded_baseline``): ``baseline.json`` → ``baseline/`` holding a
+``manifest.json`` and one fingerprint list per top-level directory (or
+deeper prefix). ``ShardedBaseline`` opens a shard the first time a finding
+under it is looked up, so a changed-only or sharded scan only reads the
+shards its findings fall in.
+
+An organization-wide shared baseline (``specify_cli.baseline_shared``) can
+be layered on top with ``load_baseline(..., shared=path)``.
 """
 
 import json
 import hashlib
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+import os
+import tempfile
+from pathlib import Path, PurePath
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import quote
 from datetime import datetime
 
+from specify_cli.baseline_index import (
+    NO_SOURCE,
+    BaselineIndex,
+    index_path,
+    open_index,
+    source_stamp,
+    write_index,
+)
+from specify_cli.baseline_shared import open_shared_baseline
+from specify_cli.logging import get_logger
+from specify_cli.source_context import CONTEXT_FIELD, stamp_context
+
+log = get_logger(__name__)
+
+BASELINE_VERSION = "2.0"  # 1.0 files are keyed by the legacy "|"-joined hash
+COMPACT_THRESHOLD = 1000  # journal records before save() rewrites the snapshot
+
+
+def fingerprint(finding: Dict[str, Any], root: Optional[Path] = None) -> str:
+    """Stable fingerprint of a finding: SHA-256 of ``path:line:rule_id:message``.
+
+    The path is ``file_path``, or ``file`` for findings that only have that;
+    with ``root`` it is made relative to it, so the fingerprint does not
+    depend on where the tree is checked out. Dependency findings have no
+    path and are keyed by ``package:installed_version:advisory_id``.
+    """
+    path = finding.get("file_path", finding.get("file"))
+    if path is None and "package" in finding:
+        version, advisory = finding.get("installed_version"), finding.get("advisory_id")
+        key = f"{finding['package']}:{version}:{advisory}"
+    else:
+        if path is not None and root is not None:
+            path = _relative(finding, root)
+        key = f"{path}:{finding.get('line')}:{finding.get('rule_id')}:{finding.get('message')}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def stamp_fingerprints(
+    findings: Iterable[Dict[str, Any]],
+    source: Optional[bytes] = None,
+    path: Optional[str] = None,
+    root: Path = Path("."),
+) -> None:
+    """Store ``fingerprint`` on each finding as its ``"fingerprint"`` field.
+
+    Called once per finding per run, after its ``file_path`` is final.
+
+    Args:
+        findings: Findings to stamp
+        source: Content of the file ``path``; findings in it also get their
+            context fingerprint
+        path: ``file_path`` of the findings ``source`` belongs to (default:
+            all of them)
+        root: Scan root; fingerprints use paths relative to it
+    """
+    findings = list(findings)
+    for f in findings:
+        f["fingerprint"] = fingerprint(f, root)
+    if source is not None:
+        own = [f for f in findings if path is None or f.get("file_path") == path]
+        if own:
+            stamp_context(own, source, _relative(own[0], root))
+
+
+def finding_fingerprint(finding: Dict[str, Any], root: Optional[Path] = None) -> str:
+    """Stored fingerprint of a finding, computed relative to ``root`` only if never stamped."""
+    return finding.get("fingerprint") or fingerprint(finding, root)
+
+
+def baseline_keys(finding: Dict[str, Any]) -> List[str]:
+    """Fingerprints a baseline may know a finding by: line-based, then context."""
+    keys = [finding_fingerprint(finding)]
+    if finding.get(CONTEXT_FIELD):
+        keys.append(finding[CONTEXT_FIELD])
+    return keys
+
 
 class Baseline:
     """Baseline manager for suppressing known findings."""
 
-    def __init__(self, baseline_path: Path):
+    def __init__(self, baseline_path: Path, compact_threshold: int = COMPACT_THRESHOLD):
         """Initialize baseline manager.
 
         Args:
             baseline_path: Path to baseline JSON file
+            compact_threshold: Journal records at which ``save`` compacts
+                (0 rewrites the snapshot on every save)
         """
         self.baseline_path = baseline_path
+        self.compact_threshold = compact_threshold
         self.findings: Dict[str, Dict[str, Any]] = {}
         self.metadata: Dict[str, Any] = {}
+        self._legacy = False  # loaded from a 1.0 file; rekeyed on save
+        self._pending: List[Dict[str, Any]] = []  # journal records not yet saved
+        self._journaled = 0  # records in the journal on disk
 
-        if baseline_path.exists():
+        if baseline_path.exists() or self.journal_path.exists():
             self.load()
 
+    @property
+    def journal_path(self) -> Path:
+        """Journal of changes made since the snapshot was last compacted."""
+        return journal_path(self.baseline_path)
+
     def _finding_hash(self, finding: Dict[str, Any]) -> str:
         """Generate stable hash for a finding.
 
-        Hash is based on: file path, line, rule ID, and message.
+        Hash is based on: file path, line, rule ID, and message (see
+        ``fingerprint``), so it matches ``load_baseline`` and the index.
         This ensures findings are matched even if column changes slightly.
 
         Args:
@@ -38,6 +158,11 @@ class Baseline:
         Returns:
             SHA256 hash as hex string
         """
+        return finding_fingerprint(finding)
+
+    @staticmethod
+    def _legacy_hash(finding: Dict[str, Any]) -> str:
+        """Hash used as the key in 1.0 baseline files."""
         key_parts = [
             finding.get("file", ""),
             str(finding.get("line", 0)),
@@ -65,12 +190,14 @@ class Baseline:
         """
         finding_hash = self._finding_hash(finding)
 
-        self.findings[finding_hash] = {
+        entry = {
             "finding": finding,
             "reason": reason,
             "created_at": datetime.now().isoformat(),
             "created_by": created_by or "unknown",
         }
+        self.findings[finding_hash] = entry
+        self._pending.append({"op": "add", "fingerprint": finding_hash, "entry": entry})
 
         return finding_hash
 
@@ -83,8 +210,9 @@ class Baseline:
         Returns:
             True if finding is baselined
         """
-        finding_hash = self._finding_hash(finding)
-        return finding_hash in self.findings
+        if self._finding_hash(finding) in self.findings:
+            return True
+        return self._legacy and self._legacy_hash(finding) in self.findings
 
     def get_baselined_hashes(self) -> Set[str]:
         """Get set of all baselined finding hashes.
@@ -103,33 +231,112 @@ class Baseline:
         Returns:
             True if finding was removed
         """
-        finding_hash = self._finding_hash(finding)
+        removed = False
+        keys = [self._finding_hash(finding)]
+        if self._legacy:
+            keys.append(self._legacy_hash(finding))
+        for key in keys:
+            if key in self.findings:
+                del self.findings[key]
+                self._pending.append({"op": "remove", "fingerprint": key})
+                removed = True
+        return removed
+
+    def rematch(self, findings: Iterable[Dict[str, Any]]) -> int:
+        """Re-key entries whose finding moved to another line.
+
+        A finding that is not baselined under its current fingerprint but
+        whose context fingerprint matches an entry's takes over that entry
+        (reason and author are kept). One pass over the entries and one over
+        the findings. Call ``save`` to persist the result.
 
-        if finding_hash in self.findings:
-            del self.findings[finding_hash]
-            return True
+        Args:
+            findings: Current findings, stamped with context fingerprints
 
-        return False
+        Returns:
+            Number of entries moved
+        """
+        by_context = {
+            e["finding"][CONTEXT_FIELD]: key
+            for key, e in self.findings.items()
+            if isinstance(e.get("finding"), dict) and e["finding"].get(CONTEXT_FIELD)
+        }
+        moved = 0
+        for f in findings:
+            old = by_context.pop(f.get(CONTEXT_FIELD), None)
+            key = self._finding_hash(f)
+            if old is None or old == key or old not in self.findings or key in self.findings:
+                continue
+            entry = dict(self.findings.pop(old), finding=f)
+            self.findings[key] = entry
+            self._pending.append({"op": "remove", "fingerprint": old})
+            self._pending.append({"op": "add", "fingerprint": key, "entry": entry})
+            moved += 1
+        return moved
 
     def save(self) -> None:
-        """Save baseline to file."""
+        """Save changes made since the last save, and update the compiled index.
+
+        Changes are appended to the journal and fsynced. The snapshot is
+        rewritten (see ``compact``) instead when there is none yet, when it is
+        a 1.0 file, or when the journal would reach ``compact_threshold``
+        records.
+        """
+        if (
+            self._legacy
+            or not self.baseline_path.exists()
+            or self._journaled + len(self._pending) >= self.compact_threshold
+        ):
+            self.compact()
+            return
+        if not self._pending:
+            return
+        _append_journal(self.journal_path, self._pending)
+        self._journaled += len(self._pending)
+        self._pending = []
+        _compile(self.baseline_path, self.findings)
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with all changes applied and remove the journal.
+
+        The snapshot is replaced atomically before the journal is removed, so
+        an interrupted compaction leaves a journal whose replay is a no-op.
+        Entries of a 1.0 file are rekeyed by ``fingerprint`` of their finding.
+        """
         self.baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._legacy:
+            self.findings = {
+                finding_fingerprint(e["finding"]) if isinstance(e.get("finding"), dict) else k: e
+                for k, e in self.findings.items()
+            }
+            self._legacy = False
 
         data = {
-            "version": "1.0",
-            "created_at": self.metadata.get("created_at", datetime.now().isoformat()),
+            "version": BASELINE_VERSION,
+            "created_at": self.metadata.get("created_at") or datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
             "finding_count": len(self.findings),
             "findings": self.findings,
         }
 
-        with open(self.baseline_path, "w", encoding="utf-8") as f:
+        fd, tmp = tempfile.mkstemp(dir=self.baseline_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.baseline_path)
+        self.journal_path.unlink(missing_ok=True)
+        self._pending = []
+        self._journaled = 0
+        self.metadata.update({k: v for k, v in data.items() if k != "findings"})
+        _compile(self.baseline_path, self.findings)
 
     def load(self) -> None:
-        """Load baseline from file."""
-        with open(self.baseline_path, encoding="utf-8") as f:
-            data = json.load(f)
+        """Load baseline from file, replaying its journal over the snapshot."""
+        data: Dict[str, Any] = {"version": BASELINE_VERSION}
+        if self.baseline_path.exists():
+            with open(self.baseline_path, encoding="utf-8") as f:
+                data = json.load(f)
 
         self.metadata = {
             "version": data.get("version", "1.0"),
@@ -139,6 +346,11 @@ class Baseline:
         }
 
         self.findings = data.get("findings", {})
+        self._legacy = not str(self.metadata["version"]).startswith("2.")
+        self._pending = []
+        self._journaled = _replay(self.journal_path, self.findings)
+        if self._journaled:
+            self.metadata["finding_count"] = len(self.findings)
 
     def filter_findings(
         self,
@@ -279,37 +491,349 @@ def check_inline_suppression(
 # Convenience functions for simple baseline usage
 BASELINE_PATH = Path(".speckit/baseline.json")
 
+_fingerprint = fingerprint  # former name, still imported by callers
 
-def _fingerprint(item: Dict) -> str:
-    """Generate stable fingerprint for a finding."""
-    key = f"{item.get('file_path')}:{item.get('line')}:{item.get('rule_id')}:{item.get('message')}"
-    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+def journal_path(baseline_path: Path) -> Path:
+    """Journal of changes appended to a JSON baseline."""
+    return Path(baseline_path).with_suffix(".journal")
+
+
+def _append_journal(path: Path, records: List[Dict[str, Any]]) -> None:
+    """Append journal records and fsync them."""
+    lines = "".join(json.dumps(r) + "\n" for r in records).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as fh:
+        if fh.seek(0, os.SEEK_END):
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                lines = b"\n" + lines  # don't extend a record torn by an earlier crash
+        fh.write(lines)
+        fh.flush()
+        os.fsync(fh.fileno())
 
 
-def load_baseline(path: Path = BASELINE_PATH) -> Set[str]:
-    """Load baseline fingerprints from JSON file."""
-    if not path.exists():
-        return set()
+def _replay(path: Path, entries: Dict[str, Any]) -> int:
+    """Apply a journal to ``entries`` (fingerprint → entry) in place.
+
+    Returns:
+        Number of records applied
+    """
+    applied = 0
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    key = record["fingerprint"]
+                    if record["op"] == "add":
+                        entries[key] = record.get("entry")
+                    else:
+                        entries.pop(key, None)
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # torn write at the moment of a crash
+                applied += 1
+    except OSError:
+        pass
+    return applied
+
+
+def shards_path(baseline_path: Path) -> Path:
+    """Directory holding the shards of a sharded baseline."""
+    return Path(baseline_path).with_suffix("")
+
+
+def baseline_stamp(path: Path) -> Tuple[int, int]:
+    """Changes whenever the baseline at ``path`` does, in any layout."""
+    stamps = [_stamp(path), source_stamp(shards_path(path) / SHARD_MANIFEST)]
+    stamps = [s for s in stamps if s != NO_SOURCE]
+    if not stamps:
+        return NO_SOURCE
+    return sum(s[0] for s in stamps), max(s[1] for s in stamps)
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    """``source_stamp`` covering a JSON baseline and its journal."""
+    stamps = [s for s in (source_stamp(path), source_stamp(journal_path(path))) if s != NO_SOURCE]
+    if not stamps:
+        return NO_SOURCE
+    return sum(s[0] for s in stamps), max(s[1] for s in stamps)
+
+
+def _read_fingerprints(path: Path) -> List[str]:
+    """Fingerprints of a JSON baseline in either format and its journal; empty if unreadable."""
+    data: Any = {}
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, IOError, json.JSONDecodeError, UnicodeDecodeError):
+            # File read error, invalid JSON, or encoding issue
+            return []
+    if not isinstance(data, dict):
+        return []
+    if "fingerprints" in data:
+        entries = dict.fromkeys(str(fp) for fp in data.get("fingerprints") or [])
+    else:
+        entries = dict(data.get("findings") or {})
+    _replay(journal_path(path), entries)
+    # Baseline.save format: recompute from the stored findings, so 1.0 keys migrate
+    out = []
+    for key, entry in entries.items():
+        finding = entry.get("finding") if isinstance(entry, dict) else None
+        out.append(finding_fingerprint(finding) if isinstance(finding, dict) else str(key))
+        if isinstance(finding, dict) and finding.get(CONTEXT_FIELD):
+            out.append(str(finding[CONTEXT_FIELD]))
+    return out
+
+
+def _compile(path: Path, fingerprints: Collection[str]) -> Optional[BaselineIndex]:
+    """Write the index for the JSON baseline at ``path`` and open it."""
+    stamp = _stamp(path)
     try:
-        data = json.loads(path.read_text())
-        return set(data.get("fingerprints", []))
-    except (OSError, IOError, json.JSONDecodeError, UnicodeDecodeError):
-        # File read error, invalid JSON, or encoding issue
-        return set()
+        write_index(index_path(path), fingerprints, stamp)
+    except OSError as e:
+        # Read-only checkout: fall back to an in-memory index
+        log.debug(f"Could not write baseline index for {path}: {e}")
+        return None
+    return open_index(index_path(path), stamp)
+
+
+SHARD_MANIFEST = "manifest.json"
+SHARD_VERSION = 1
+_ROOT_SHARD = "@root"  # files above the shard depth; "@" is quoted in directory names
+
+
+def _relative(finding: Dict[str, Any], root: Path) -> str:
+    path = str(finding.get("file_path", finding.get("file")) or "")
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    return PurePath(path if rel.startswith("..") else rel).as_posix()
+
+
+def shard_key(rel: str, depth: int = 1) -> str:
+    """Shard of a root-relative path: its first ``depth`` directories."""
+    parts = PurePath(rel).parts[:-1][:depth]
+    return "/".join(parts) if parts else _ROOT_SHARD
+
+
+def _shard_file(key: str) -> str:
+    return f"{key if key == _ROOT_SHARD else quote(key, safe='')}.json"
+
+
+class ShardedBaseline:
+    """Baseline split into per-directory shards, each opened on first use.
+
+    Use ``contains_finding`` (as ``filter_with_baseline`` does) to consult
+    only the finding's shard. ``in`` with a bare fingerprint, ``len`` and
+    iteration work too but open every shard.
+    """
+
+    def __init__(self, directory: Path, root: Path = Path(".")):
+        """Read the manifest of a sharded baseline.
+
+        Args:
+            directory: Directory with ``manifest.json`` and the shard files
+            root: Scan root that finding paths are made relative to
+
+        Raises:
+            OSError: The manifest cannot be read
+            ValueError: The manifest is not valid JSON
+        """
+        self.directory = Path(directory)
+        self.root = Path(root)
+        manifest = json.loads((self.directory / SHARD_MANIFEST).read_text())
+        self.depth = int(manifest.get("depth", 1))
+        self.shards: Dict[str, Dict[str, Any]] = manifest.get("shards") or {}
+        self._open: Dict[str, BaselineIndex] = {}
+
+    @property
+    def loaded(self) -> List[str]:
+        """Keys of the shards opened so far."""
+        return sorted(self._open)
+
+    def _shard(self, key: str) -> Optional[BaselineIndex]:
+        if key not in self._open:
+            if key not in self.shards:
+                return None
+            self._open[key] = load_baseline(self.directory / self.shards[key]["file"])
+        return self._open[key]
+
+    def contains_finding(self, finding: Dict[str, Any]) -> bool:
+        """Whether the finding is baselined, opening only its directory's shard."""
+        shard = self._shard(shard_key(_relative(finding, self.root), self.depth))
+        return shard is not None and any(key in shard for key in baseline_keys(finding))
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return any(fingerprint in (self._shard(key) or ()) for key in self.shards)
+
+    def __len__(self) -> int:
+        return sum(int(s.get("count", 0)) for s in self.shards.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.shards)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.shards:
+            yield from self._shard(key) or ()
+
+    def close(self) -> None:
+        """Unmap the shards opened so far."""
+        for index in self._open.values():
+            index.close()
+        self._open.clear()
+
+
+class CombinedBaseline:
+    """A repository's baseline plus shared ones; a finding in any of them is baselined."""
+
+    def __init__(self, *parts: Collection[str]):
+        self.parts = list(parts)
+
+    def contains_finding(self, finding: Dict[str, Any]) -> bool:
+        """Whether any part baselines the finding (the repository's own first)."""
+        return any(_baselined(finding, part) for part in self.parts)
+
+    def __contains__(self, fingerprint: object) -> bool:
+        return any(fingerprint in part for part in self.parts)
+
+    def __len__(self) -> int:
+        """Entries across all parts (a fingerprint in two parts counts twice)."""
+        return sum(len(part) for part in self.parts)
+
+    def __bool__(self) -> bool:
+        return any(self.parts)
+
+    def __iter__(self) -> Iterator[str]:
+        for part in self.parts:
+            yield from part
+
+    def close(self) -> None:
+        """Unmap every part."""
+        for part in self.parts:
+            close_baseline(part)
+
+
+def close_baseline(baseline: Optional[Collection[str]]) -> None:
+    """Unmap a baseline from ``load_baseline``; plain sets and None are left alone."""
+    close = getattr(baseline, "close", None)
+    if close is not None:
+        close()
+
+
+def load_baseline(
+    path: Path = BASELINE_PATH,
+    root: Path = Path("."),
+    shared: Optional[Path] = None,
+) -> Union[BaselineIndex, ShardedBaseline, CombinedBaseline]:
+    """Load baseline fingerprints.
+
+    ``path`` is a JSON baseline in either format (``write_baseline``'s
+    fingerprint list or a ``Baseline`` file) or an index file. The JSON and
+    its journal are compiled to ``index_path(path)`` the first time and
+    whenever either changes; later loads only memory-map the index.
+
+    Without a JSON baseline, a sharded one in ``shards_path(path)`` is used
+    (a ``ShardedBaseline`` resolving finding paths against ``root``), and
+    otherwise an index written on its own.
+
+    ``shared`` names an organization-wide baseline published with
+    ``specify_cli.baseline_shared.publish_shared_baseline``; it is consulted
+    after the repository's own (a ``CombinedBaseline``). An unavailable
+    shared baseline is skipped with a warning.
+    """
+    local = _load_local(Path(path), root)
+    if shared is None:
+        return local
+    org = open_shared_baseline(Path(shared))
+    return local if org is None else CombinedBaseline(local, org)
+
+
+def _load_local(path: Path, root: Path) -> Union[BaselineIndex, ShardedBaseline]:
+    if path.suffix == ".idx":
+        return open_index(path) or BaselineIndex()
+    stamp = _stamp(path)
+    if stamp == NO_SOURCE:
+        if (shards_path(path) / SHARD_MANIFEST).exists():
+            try:
+                return ShardedBaseline(shards_path(path), root)
+            except (OSError, ValueError) as e:
+                log.warning(f"Ignoring sharded baseline {shards_path(path)}: {e}")
+        # No JSON: only an index written on its own counts
+        return open_index(index_path(path), NO_SOURCE) or BaselineIndex()
+    index = open_index(index_path(path), stamp)
+    if index is None:
+        fingerprints = _read_fingerprints(path)
+        index = _compile(path, fingerprints) or BaselineIndex.build(fingerprints)
+    return index
 
 
 def write_baseline(findings: List[Dict], path: Path = BASELINE_PATH) -> Path:
-    """Write baseline fingerprints to JSON file."""
-    fp = [_fingerprint(f) for f in findings]
+    """Write baseline fingerprints to JSON file, and its compiled index.
+
+    Findings stamped with a context fingerprint are recorded by it, so they
+    stay baselined when lines are added or removed above them.
+    """
+    fp = [f.get(CONTEXT_FIELD) or finding_fingerprint(f) for f in findings]
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps({"algo": "speckit-sha256-v1", "fingerprints": fp}, indent=2))
+    path.write_text(json.dumps({"algo": "speckit-sha256-v2", "fingerprints": fp}, indent=2))
+    journal_path(path).unlink(missing_ok=True)  # superseded by the new snapshot
+    _compile(path, fp)
     return path
 
 
-def filter_with_baseline(findings: List[Dict], baseline: Set[str]) -> List[Dict]:
-    """Filter out findings that exist in baseline."""
+def write_sharded_baseline(
+    findings: List[Dict], path: Path = BASELINE_PATH, root: Path = Path("."), depth: int = 1
+) -> Path:
+    """Write baseline fingerprints as per-directory shards and a manifest.
+
+    Args:
+        findings: Findings to baseline
+        path: JSON baseline path the shards replace (shards go to ``shards_path(path)``)
+        root: Scan root that finding paths are made relative to
+        depth: Directory levels in a shard key (1: one shard per top-level directory)
+
+    Returns:
+        Directory holding the manifest and shards
+    """
+    directory = shards_path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    groups: Dict[str, List[Dict]] = {}
+    for f in findings:
+        groups.setdefault(shard_key(_relative(f, root), depth), []).append(f)
+    try:
+        previous = json.loads((directory / SHARD_MANIFEST).read_text()).get("shards") or {}
+    except (OSError, ValueError):
+        previous = {}
+    shards = {}
+    for key in sorted(groups):
+        name = _shard_file(key)
+        write_baseline(groups[key], directory / name)
+        shards[key] = {"file": name, "count": len(groups[key])}
+    manifest = {"version": SHARD_VERSION, "depth": depth, "shards": shards}
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+    os.replace(tmp, directory / SHARD_MANIFEST)
+    for key, entry in previous.items():
+        if key not in shards:
+            for stale in (directory / entry["file"], index_path(directory / entry["file"])):
+                stale.unlink(missing_ok=True)
+    return directory
+
+
+def filter_with_baseline(findings: List[Dict], baseline: Collection[str]) -> List[Dict]:
+    """Filter out findings that exist in baseline.
+
+    A ``ShardedBaseline`` is consulted per finding, so only the shards of
+    directories with findings are opened.
+    """
     out = []
     for f in findings:
-        if _fingerprint(f) not in baseline:
+        if not _baselined(f, baseline):
             out.append(f)
     return out
+
+
+def _baselined(finding: Dict[str, Any], baseline: Collection[str]) -> bool:
+    if isinstance(baseline, (ShardedBaseline, CombinedBaseline)):
+        return baseline.contains_finding(finding)
+    return any(key in baseline for key in baseline_keys(finding))
@@ -0,0 +1,224 @@
+"""Compiled, memory-mapped baseline index.
+
+Baselines are reviewed as JSON (``write_baseline``'s fingerprint list or
+``Baseline``'s annotated findings), but a run only needs membership tests.
+Both formats compile to one binary file next to the JSON
+(``baseline.json`` → ``baseline.idx``):
+
+    header  magic ``SKBI``, format version, digest size, bucket bits,
+            source size, source mtime (ns), entry count
+    buckets 2**bits + 1 little-endian uint32: index of the first digest
+            whose leading ``bits`` bits are >= the bucket number
+    body    entry count × 32-byte SHA-256 fingerprints, sorted, unique
+
+The index is memory-mapped; a lookup reads its bucket bounds and
+binary-searches the few digests between them. Opening a baseline of 500k
+entries costs a ``stat`` and an ``mmap`` instead of parsing JSON into a
+set. The header records the size and mtime of the JSON it was built
+from; ``load_baseline`` rebuilds the index when they no longer match.
+"""
+
+from __future__ import annotations
+import bisect
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+MAGIC = b"SKBI"
+FORMAT_VERSION = 1
+DIGEST_SIZE = 32  # raw SHA-256
+_HEADER = struct.Struct("<4sHHH2xqqQ")  # magic, version, digest size, bucket bits, stamp, count
+_BOUNDS = struct.Struct("<II")
+MAX_BUCKET_BITS = 20
+NO_SOURCE = (-1, -1)  # index written directly, not compiled from JSON
+
+
+def index_path(baseline_path: Path) -> Path:
+    """Index file compiled from a JSON baseline."""
+    return Path(baseline_path).with_suffix(".idx")
+
+
+def source_stamp(path: Path) -> Tuple[int, int]:
+    """``(size, mtime_ns)`` of a baseline source, or ``NO_SOURCE`` if missing."""
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return NO_SOURCE
+    return st.st_size, st.st_mtime_ns
+
+
+def _digest(fingerprint: Union[str, bytes]) -> Optional[bytes]:
+    if isinstance(fingerprint, bytes):
+        return fingerprint if len(fingerprint) == DIGEST_SIZE else None
+    try:
+        raw = bytes.fromhex(fingerprint)
+    except ValueError:
+        return None
+    return raw if len(raw) == DIGEST_SIZE else None
+
+
+def _bucket_bits(count: int) -> int:
+    # About four digests per bucket
+    return min(MAX_BUCKET_BITS, max(0, (count // 4).bit_length()))
+
+
+def _encode(digests: List[bytes], stamp: Tuple[int, int]) -> Iterator[bytes]:
+    """Index file contents for sorted, unique digests."""
+    bits = _bucket_bits(len(digests))
+    yield _HEADER.pack(MAGIC, FORMAT_VERSION, DIGEST_SIZE, bits, *stamp, len(digests))
+    starts = array("I", [0] * ((1 << bits) + 1))
+    for d in digests:
+        starts[(int.from_bytes(d[:4], "big") >> (32 - bits)) + 1] += 1
+    for i in range(1, len(starts)):
+        starts[i] += starts[i - 1]
+    if sys.byteorder != "little":
+        starts.byteswap()
+    yield starts.tobytes()
+    yield from digests
+
+
+def _sorted_digests(fingerprints: Iterable[Union[str, bytes]]) -> List[bytes]:
+    return sorted({d for d in map(_digest, fingerprints) if d is not None})
+
+
+class _Digests:
+    """Sequence view of the sorted digests, for ``bisect``."""
+
+    def __init__(self, buf: Union[bytes, mmap.mmap], offset: int, count: int):
+        self.buf = buf
+        self.offset = offset
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self.offset + i * DIGEST_SIZE
+        return self.buf[start : start + DIGEST_SIZE]
+
+
+class BaselineIndex:
+    """Set of baselined fingerprints backed by a sorted digest array.
+
+    Supports ``in`` (hex fingerprints or raw digests), ``len``, iteration
+    (hex, sorted) and truthiness, so it can stand in for the fingerprint
+    set ``filter_with_baseline`` and ``RunConfig.baseline`` take.
+    """
+
+    def __init__(self, buf: Union[bytes, mmap.mmap, None] = None, name: str = "<memory>"):
+        """Wrap index file contents.
+
+        Raises:
+            ValueError: Not an index, an unsupported version, or truncated
+        """
+        if buf is None:
+            buf = b"".join(_encode([], NO_SOURCE))
+        try:
+            magic, version, size, bits, src_size, src_mtime, count = _HEADER.unpack_from(buf, 0)
+        except struct.error:
+            raise ValueError(f"{name} is not a baseline index") from None
+        if magic != MAGIC or version != FORMAT_VERSION or size != DIGEST_SIZE:
+            raise ValueError(f"{name} is not a baseline index (or an unsupported version)")
+        body = _HEADER.size + ((1 << bits) + 1) * 4
+        if bits > MAX_BUCKET_BITS or len(buf) < body + count * DIGEST_SIZE:
+            raise ValueError(f"{name} is truncated")
+        self._buf = buf
+        self._shift = 32 - bits
+        self._digests = _Digests(buf, body, count)
+        self.stamp = (src_size, src_mtime)  # (size, mtime_ns) of the JSON compiled from
+
+    @classmethod
+    def open(cls, path: Path) -> BaselineIndex:
+        """Memory-map an index file.
+
+        Raises:
+            OSError: The file cannot be read
+            ValueError: Not an index file, or truncated
+        """
+        with open(path, "rb") as fh:
+            buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buf, str(path))
+        except ValueError:
+            buf.close()
+            raise
+
+    @classmethod
+    def build(cls, fingerprints: Iterable[Union[str, bytes]]) -> BaselineIndex:
+        """In-memory index; malformed fingerprints are skipped."""
+        return cls(b"".join(_encode(_sorted_digests(fingerprints), NO_SOURCE)))
+
+    def __contains__(self, fingerprint: object) -> bool:
+        if not isinstance(fingerprint, (str, bytes)):
+            return False
+        digest = _digest(fingerprint)
+        if digest is None:
+            return False
+        bucket = int.from_bytes(digest[:4], "big") >> self._shift
+        lo, hi = _BOUNDS.unpack_from(self._buf, _HEADER.size + bucket * 4)
+        i = bisect.bisect_left(self._digests, digest, lo, hi)
+        return i < hi and self._digests[i] == digest
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def __bool__(self) -> bool:
+        return len(self._digests) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self._digests)):
+            yield self._digests[i].hex()
+
+    def close(self) -> None:
+        """Unmap the file; the index is empty afterwards."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._buf = b"".join(_encode([], NO_SOURCE))
+        self._shift = 32
+        self._digests = _Digests(self._buf, len(self._buf), 0)
+
+
+def write_index(
+    path: Path,
+    fingerprints: Iterable[Union[str, bytes]],
+    stamp: Tuple[int, int] = NO_SOURCE,
+) -> Path:
+    """Write fingerprints as a sorted index file, atomically.
+
+    Args:
+        path: Index file to write
+        fingerprints: Hex fingerprints or raw digests; malformed ones are skipped
+        stamp: ``source_stamp`` of the JSON the index is compiled from
+
+    Returns:
+        Path to the index
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.writelines(_encode(_sorted_digests(fingerprints), stamp))
+    os.replace(tmp, path)
+    return path
+
+
+def open_index(path: Path, stamp: Optional[Tuple[int, int]] = None) -> Optional[BaselineIndex]:
+    """Open an index, or None if it is missing, unreadable or not built from ``stamp``."""
+    try:
+        index = BaselineIndex.open(path)
+    except (OSError, ValueError) as e:
+        if Path(path).exists():
+            log.debug(f"Ignoring baseline index {path}: {e}")
+        return None
+    if stamp is not None and index.stamp != stamp:
+        index.close()
+        return None
+    return index
@@ -0,0 +1,183 @@
+"""Shared, read-only baselines published for many repositories.
+
+An organization can accept findings once for hundreds of repositories by
+publishing one baseline of millions of fingerprints. ``publish_shared_baseline``
+writes two files with a common stem:
+
+``<stem>.idx``
+    the exact set, a ``specify_cli.baseline_index`` file
+``<stem>.bloom``
+    a Bloom filter over the same fingerprints: header (magic ``SKBF``,
+    format version, hash count, bit count, entry count) then the bit array
+
+``SharedBaseline`` memory-maps the filter and answers most lookups from it
+alone; only a probable hit opens and searches the exact index. At the
+default 1% false-positive rate the filter costs about 1.2 bytes per
+fingerprint, and an audit whose findings are mostly new reads a handful of
+its pages.
+
+Fingerprints are already SHA-256 digests, so the filter's bit positions
+come from the digest itself (double hashing of two 64-bit slices) rather
+than from further hashing.
+"""
+
+from __future__ import annotations
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from specify_cli.baseline_index import (
+    BaselineIndex,
+    _digest,
+    _sorted_digests,
+    index_path,
+    open_index,
+    write_index,
+)
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+BLOOM_MAGIC = b"SKBF"
+BLOOM_VERSION = 1
+_BLOOM_HEADER = struct.Struct("<4sHH4xQQ")  # magic, version, hashes, bits, count
+DEFAULT_FP_RATE = 0.01
+
+
+def bloom_path(path: Path) -> Path:
+    """Bloom filter published next to a shared baseline's exact index."""
+    return Path(path).with_suffix(".bloom")
+
+
+def _positions(digest: bytes, hashes: int, bits: int) -> Iterator[int]:
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:16], "little") | 1
+    for i in range(hashes):
+        yield (h1 + i * h2) % bits
+
+
+def _sizing(count: int, fp_rate: float) -> Tuple[int, int]:
+    """Bit count (a multiple of 64) and hash count for ``count`` entries."""
+    bits = max(64, math.ceil(-count * math.log(fp_rate) / math.log(2) ** 2))
+    bits = (bits + 63) // 64 * 64
+    hashes = max(1, round(bits / max(count, 1) * math.log(2)))
+    return bits, hashes
+
+
+def _write_bloom(path: Path, digests: List[bytes], fp_rate: float) -> None:
+    bits, hashes = _sizing(len(digests), fp_rate)
+    array = bytearray(bits // 8)
+    for d in digests:
+        for pos in _positions(d, hashes, bits):
+            array[pos >> 3] |= 1 << (pos & 7)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_BLOOM_HEADER.pack(BLOOM_MAGIC, BLOOM_VERSION, hashes, bits, len(digests)))
+        fh.write(array)
+    os.replace(tmp, path)
+
+
+def publish_shared_baseline(
+    fingerprints: Iterable[Union[str, bytes]],
+    path: Path,
+    fp_rate: float = DEFAULT_FP_RATE,
+) -> Path:
+    """Write a shared baseline: the exact index and its Bloom filter.
+
+    Args:
+        fingerprints: Hex fingerprints or raw digests; malformed ones are skipped
+        path: Stem of the published files (``.idx`` and ``.bloom`` are added)
+        fp_rate: Target false-positive rate of the filter
+
+    Returns:
+        Path to the exact index
+    """
+    digests = _sorted_digests(fingerprints)
+    exact = write_index(index_path(path), digests)
+    # The filter is replaced last, so readers never see it ahead of the index
+    _write_bloom(bloom_path(path), digests, fp_rate)
+    return exact
+
+
+class SharedBaseline:
+    """Read-only baseline answered by a Bloom filter, confirmed by the exact index.
+
+    Supports ``in`` (hex fingerprints or raw digests), ``len``, truthiness
+    and iteration (which reads the exact index).
+    """
+
+    def __init__(self, path: Path):
+        """Memory-map a published filter; the exact index is opened on first use.
+
+        Args:
+            path: Stem given to ``publish_shared_baseline`` (or either file)
+
+        Raises:
+            OSError: The filter cannot be read
+            ValueError: Not a Bloom filter, an unsupported version, or truncated
+        """
+        self.path = Path(path)
+        with open(bloom_path(self.path), "rb") as fh:
+            self._bloom = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self._hashes, self._bits, self._count = _BLOOM_HEADER.unpack_from(
+                self._bloom, 0
+            )
+        except struct.error:
+            magic = version = None
+        if magic != BLOOM_MAGIC or version != BLOOM_VERSION:
+            self._bloom.close()
+            raise ValueError(f"{bloom_path(self.path)} is not a shared baseline filter")
+        if len(self._bloom) < _BLOOM_HEADER.size + self._bits // 8:
+            self._bloom.close()
+            raise ValueError(f"{bloom_path(self.path)} is truncated")
+        self._exact: Optional[BaselineIndex] = None
+        self.exact_lookups = 0  # probable hits checked against the exact index
+
+    def _may_contain(self, digest: bytes) -> bool:
+        base = _BLOOM_HEADER.size
+        return all(
+            self._bloom[base + (pos >> 3)] >> (pos & 7) & 1
+            for pos in _positions(digest, self._hashes, self._bits)
+        )
+
+    def _index(self) -> BaselineIndex:
+        if self._exact is None:
+            self._exact = open_index(index_path(self.path)) or BaselineIndex()
+        return self._exact
+
+    def __contains__(self, fingerprint: object) -> bool:
+        if not isinstance(fingerprint, (str, bytes)):
+            return False
+        digest = _digest(fingerprint)
+        if digest is None or not self._may_contain(digest):
+            return False
+        self.exact_lookups += 1
+        return digest in self._index()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def close(self) -> None:
+        """Unmap both files."""
+        self._bloom.close()
+        if self._exact is not None:
+            self._exact.close()
+
+
+def open_shared_baseline(path: Path) -> Optional[SharedBaseline]:
+    """Open a shared baseline, or None (with a warning) if it is unavailable."""
+    try:
+        return SharedBaseline(path)
+    except (OSError, ValueError) as e:
+        log.warning(f"Shared baseline {path} not used: {e}")
+        return None
@@ -0,0 +1,123 @@
+"""Time budgets and risk-prioritized file ordering for partial audits.
+
+With a budget, files are analyzed most-likely-to-matter first: files
+changed since the last commit (or since the last run), then files with a
+high historical finding density, then larger files. Work stops being
+dispatched once the budget is nearly spent, leaving a reserve for writing
+the report.
+"""
+
+from __future__ import annotations
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from specify_cli.gitutils import uncommitted_files
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+# Share of the budget held back for collecting results and writing reports
+RESERVE_FRACTION = 0.1
+MIN_RESERVE = 0.5
+MAX_RESERVE = 5.0
+
+
+class TimeBudget:
+    """Wall-clock budget that decides whether more work can be started."""
+
+    def __init__(self, seconds: float, reserve: Optional[float] = None):
+        """Start the budget clock.
+
+        Args:
+            seconds: Total budget for the run
+            reserve: Seconds kept back for reporting (default: 10%, 0.5-5s)
+        """
+        self.seconds = seconds
+        if reserve is None:
+            reserve = min(MAX_RESERVE, max(MIN_RESERVE, seconds * RESERVE_FRACTION))
+        self.reserve = min(reserve, seconds / 2)
+        self.started = time.monotonic()
+        self.deadline = self.started + seconds - self.reserve
+        self._task_seconds = 0.0
+        self._tasks = 0
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def record(self, seconds: float) -> None:
+        """Record how long one unit of work took, to estimate the next."""
+        self._task_seconds += seconds
+        self._tasks += 1
+
+    def estimate(self) -> float:
+        """Mean duration of recorded work (0 before anything finished)."""
+        return self._task_seconds / self._tasks if self._tasks else 0.0
+
+    def can_start(self, queued: float = 0) -> bool:
+        """True if a new unit of work, behind ``queued`` others, should finish in time."""
+        return time.monotonic() + self.estimate() * (1 + queued) < self.deadline
+
+
+def load_history(out_dir: Path) -> Dict[str, int]:
+    """Count code findings per file in the last full run (``last_run.json``).
+
+    Returns:
+        Findings per normalized file path (empty without history)
+    """
+    try:
+        data = json.loads((Path(out_dir) / "last_run.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    counts: Dict[str, int] = {}
+    for f in data.get("code", []):
+        key = os.path.normpath(str(f.get("file_path", "")))
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def prioritize(
+    root: Path,
+    files: Iterable[Path],
+    history: Optional[Dict[str, int]] = None,
+    changed: Optional[Set[str]] = None,
+    since: Optional[float] = None,
+) -> List[Path]:
+    """Order files for a time-budgeted run.
+
+    Args:
+        root: Scan root
+        files: Discovered files
+        history: Findings per file path from ``load_history``
+        changed: Paths relative to ``root`` changed since the last commit
+            (default: asked from git)
+        since: Files modified after this timestamp also count as changed
+            (e.g. the previous report's mtime)
+
+    Returns:
+        Files, recently changed first (newest first), then by historical
+        findings per KiB, then by size, largest first
+    """
+    root = Path(root)
+    history = history or {}
+    if changed is None:
+        changed = {os.path.normpath(p) for p in uncommitted_files(root)}
+
+    def _key(path: Path):
+        try:
+            st = path.stat()
+            size, mtime = st.st_size, st.st_mtime
+        except OSError:
+            size, mtime = 0, 0.0
+        try:
+            rel = os.path.normpath(path.relative_to(root))
+        except ValueError:
+            rel = os.path.normpath(path)
+        recent = rel in changed or (since is not None and mtime > since)
+        hits = history.get(os.path.normpath(path), 0) or history.get(rel, 0)
+        density = hits / max(size / 1024, 1.0)
+        return (not recent, -mtime if recent else 0.0, -density, -size, rel)
+
+    return sorted(files, key=_key)
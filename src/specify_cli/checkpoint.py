@@ -0,0 +1,186 @@
+"""Checkpoints of per-file results so interrupted audits can resume.
+
+While a run is in progress, completed file results are appended to
+``results.jsonl`` and the files discovered but not yet completed are
+written to ``state.json``, both under ``<output dir>/checkpoint``. A run
+started with ``--resume`` reuses a checkpointed result only if the file's
+SHA-256 still matches; everything else is analyzed again. The checkpoint
+is removed once a complete report has been written.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+CHECKPOINT_DIR = "checkpoint"
+CHECKPOINT_VERSION = 1
+DEFAULT_INTERVAL = 10.0  # seconds between flushes
+
+
+def checkpoint_key(root: Path, analyzers: List[Tuple[str, str]], **scope) -> str:
+    """Identify the work a checkpoint belongs to.
+
+    Args:
+        root: Scan root
+        analyzers: ``(name, version)`` of the file-level analyzers
+        **scope: Other settings that change which files or results a run
+            produces (excludes, shard, ...)
+    """
+    raw = json.dumps(
+        {"root": str(Path(root).resolve()), "analyzers": analyzers, **scope},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def clear_checkpoint(out_dir: Path) -> None:
+    """Delete the checkpoint under an output directory, if any."""
+    shutil.rmtree(Path(out_dir) / CHECKPOINT_DIR, ignore_errors=True)
+
+
+class Checkpoint:
+    """Periodically persisted progress of one run (thread-safe)."""
+
+    def __init__(self, out_dir: Path, key: str, interval: float = DEFAULT_INTERVAL):
+        """Initialize an empty checkpoint.
+
+        Args:
+            out_dir: Report output directory
+            key: ``checkpoint_key`` of the run
+            interval: Minimum seconds between flushes
+        """
+        self.directory = Path(out_dir) / CHECKPOINT_DIR
+        self.key = key
+        self.interval = interval
+        self.resumed = 0  # files whose results were reused
+        self._done: Dict[str, Tuple[str, Dict[str, List[dict]]]] = {}
+        self._discovered: Set[str] = set()
+        self._completed: Set[str] = set()
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()  # serializes flushes from different threads
+        self._last_flush = time.monotonic()
+
+    @property
+    def results_path(self) -> Path:
+        return self.directory / "results.jsonl"
+
+    @property
+    def state_path(self) -> Path:
+        return self.directory / "state.json"
+
+    def load(self) -> int:
+        """Read an existing checkpoint for this run.
+
+        A checkpoint written by a different configuration is discarded.
+
+        Returns:
+            Number of files with reusable results
+        """
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return 0
+        if state.get("version") != CHECKPOINT_VERSION or state.get("key") != self.key:
+            log.warning("Checkpoint was written with different settings; starting over")
+            self.reset()
+            return 0
+        try:
+            with open(self.results_path, "r+b") as fh:
+                data = fh.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    # Torn write at the moment of interruption: cut it off so
+                    # the next flush starts on a fresh line
+                    fh.truncate(complete)
+        except OSError:
+            return 0
+        for line in data[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+                self._done[entry["rel"]] = (entry["digest"], entry["results"])
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                continue  # damaged record; later ones are still good
+        return len(self._done)
+
+    def reset(self) -> None:
+        """Forget any previous checkpoint on disk."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._done.clear()
+
+    def restore(self, rel: str, digest: str, file_path: str) -> Optional[Dict[str, List[dict]]]:
+        """Checkpointed results for a file, if its content hash is unchanged."""
+        entry = self._done.get(rel)
+        if entry is None or entry[0] != digest:
+            return None
+        results = {
+            name: [dict(f, file_path=file_path) for f in fs] for name, fs in entry[1].items()
+        }
+        with self._lock:
+            self._completed.add(rel)
+            self.resumed += 1
+        return results
+
+    def discovered(self, rel: str) -> None:
+        """Note a file that this run will analyze."""
+        with self._lock:
+            self._discovered.add(rel)
+
+    def record(self, rel: str, digest: str, results: Dict[str, List[dict]]) -> None:
+        """Record a file's completed results; flushes when the interval has passed."""
+        with self._lock:
+            if rel in self._completed:
+                return  # restored from the checkpoint, already on disk
+            self._completed.add(rel)
+            stripped = {
+                name: [{k: v for k, v in f.items() if k != "file_path"} for f in fs]
+                for name, fs in results.items()
+            }
+            self._lines.append(json.dumps({"rel": rel, "digest": digest, "results": stripped}))
+            due = time.monotonic() - self._last_flush >= self.interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered results and rewrite the pending list."""
+        with self._io_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            lines, self._lines = self._lines, []
+            pending = sorted(self._discovered - self._completed)
+            completed = len(self._completed)
+            self._last_flush = time.monotonic()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if lines:
+                with open(self.results_path, "a", encoding="utf-8") as fh:
+                    fh.write("\n".join(lines) + "\n")
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "key": self.key,
+                "completed": completed,
+                "pending": pending,
+                "updated": time.time(),
+            }
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump(state, fh)
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            log.warning(f"Could not write checkpoint to {self.directory}: {e}")
@@ -6,6 +6,9 @@ import typer
 # Import sub-commands
 from specify_cli.commands.audit import app as audit_app
 from specify_cli.commands.doctor import app as doctor_app
+from specify_cli.commands.advisories import app as advisories_app
+from specify_cli.commands.deps import app as deps_app
+from specify_cli.commands.daemon import app as daemon_app
 
 # Create main app
 app = typer.Typer(help="Spec-first analysis CLI")
@@ -13,6 +16,9 @@ app = typer.Typer(help="Spec-first analysis CLI")
 # Register sub-commands
 app.add_typer(audit_app, name="audit", help="Run security analysis")
 app.add_typer(doctor_app, name="doctor", help="Check environment and tools")
+app.add_typer(advisories_app, name="advisories", help="Manage offline advisory database")
+app.add_typer(deps_app, name="deps", help="Plan dependency upgrades")
+app.add_typer(daemon_app, name="daemon", help="Run a warm scan daemon")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+"""Advisory database commands for offline dependency scanning."""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import List
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from specify_cli.advisories import AdvisoryStore, DB_PATH
+from specify_cli.errors import SpecKitError
+
+app = typer.Typer(help="Manage the offline advisory database")
+
+
+@app.command("import")
+def import_dump(
+    dump: Path = typer.Argument(..., help="Full advisory dump (JSON)"),
+    path: Path = typer.Option(Path.cwd(), "--path", help="Project folder"),
+    db: Path = typer.Option(
+        None, "--db", help="Advisory database path (default: .speckit/advisories.db under --path)"
+    ),
+):
+    """Replace the advisory database with a full dump."""
+    console = Console()
+    db = db or path / DB_PATH
+    try:
+        with AdvisoryStore(db) as store:
+            count = store.import_full(dump)
+            version = store.version
+    except SpecKitError as e:
+        e.display()
+        raise typer.Exit(code=2)
+    console.print(f"[green]Imported {count} advisories[/green] (version {version})")
+
+
+@app.command("update")
+def apply_deltas(
+    deltas: List[Path] = typer.Argument(..., help="Delta files, applied in the given order"),
+    path: Path = typer.Option(Path.cwd(), "--path", help="Project folder"),
+    db: Path = typer.Option(
+        None, "--db", help="Advisory database path (default: .speckit/advisories.db under --path)"
+    ),
+):
+    """Apply one or more delta files transactionally."""
+    console = Console()
+    db = db or path / DB_PATH
+    try:
+        with AdvisoryStore(db) as store:
+            for delta in deltas:
+                r = store.apply_delta(delta)
+                console.print(
+                    f"[green]{delta.name}[/green]: v{r.from_version} → v{r.version} "
+                    f"(+{r.added} ~{r.changed} -{r.withdrawn}; "
+                    f"{len(r.touched_packages)} packages touched, "
+                    f"{r.invalidated_results} cached results invalidated)"
+                )
+    except SpecKitError as e:
+        e.display()
+        raise typer.Exit(code=2)
+
+
+@app.command("status")
+def status(
+    path: Path = typer.Option(Path.cwd(), "--path", help="Project folder"),
+    db: Path = typer.Option(
+        None, "--db", help="Advisory database path (default: .speckit/advisories.db under --path)"
+    ),
+):
+    """Show advisory database version and size."""
+    console = Console()
+    db = db or path / DB_PATH
+    if not db.exists():
+        console.print(f"[yellow]No advisory database at {db}[/yellow]")
+        raise typer.Exit(code=1)
+    with AdvisoryStore(db) as store:
+        stats = store.stats()
+
+    t = Table(title="Advisory Database")
+    t.add_column("Field")
+    t.add_column("Value")
+    for key, value in stats.items():
+        t.add_row(key, str(value))
+    console.print(t)
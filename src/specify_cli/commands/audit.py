@@ -2,48 +2,35 @@
 
 from __future__ import annotations
 import json
+import signal
+import threading
+import time
 from pathlib import Path
-from shutil import which as _which
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 
-from specify_cli.runner import run_all, RunConfig
-from specify_cli.reporters.sarif import combine_to_sarif, write_sarif
-from specify_cli.reporters.html import write_html
-from specify_cli.baseline import load_baseline, filter_with_baseline
+from specify_cli import api
+from specify_cli.api import analyzer_available, gate_code as _gate_code
+from specify_cli.runner import RunConfig
+from specify_cli.reporters.sarif import write_sarif
+from specify_cli.baseline import BASELINE_PATH, load_baseline
 from specify_cli.store import save_last_run
 from specify_cli.config import load_config
-from specify_cli.analyzers.bandit_analyzer import BANDIT as _BANDIT_OK
+from specify_cli.errors import ConfigError
+from specify_cli.analyzers.registry import discover_plugins
+from specify_cli.sharding import (
+    ShardError,
+    merge_json_reports,
+    merge_sarif_reports,
+    parse_shard,
+)
 from specify_cli.verbose import VerboseLogger
 
 app = typer.Typer(help="Run static analysis")
 
 
-def _gate_code(findings, threshold: str) -> int:
-    """Check if findings exceed severity threshold.
-
-    Args:
-        findings: List of finding dictionaries
-        threshold: Severity threshold (HIGH, MEDIUM, LOW)
-
-    Returns:
-        1 if threshold exceeded, 0 otherwise
-    """
-    sev = [str(f.get("severity", "")).upper() for f in findings]
-    high = sev.count("HIGH") + sev.count("CRITICAL")
-    med = sev.count("MEDIUM")
-    low = sev.count("LOW")
-    t = threshold.upper()
-    if t == "HIGH" and high > 0:
-        return 1
-    if t == "MEDIUM" and (high + med) > 0:
-        return 1
-    if t == "LOW" and (high + med + low) > 0:
-        return 1
-    return 0
-
-
 @app.command("run")
 def audit(
     path: Path = typer.Option(Path.cwd(), "--path", help="Folder to analyze"),
@@ -53,9 +40,49 @@ def audit(
     changed_only: bool = typer.Option(None, "--changed-only"),
     bandit: bool = typer.Option(None, "--bandit/--no-bandit"),
     safety: bool = typer.Option(None, "--safety/--no-safety"),
+    analyzer: list[str] = typer.Option(
+        None, "--analyzer", help="Also run a registered analyzer plugin (repeatable)"
+    ),
+    advisory_db: Path = typer.Option(
+        None,
+        "--advisory-db",
+        help="Check dependencies against an offline advisory DB (relative to --path)",
+    ),
+    timeout: float = typer.Option(
+        None, "--timeout", help="Overall deadline in seconds; unfinished analyzers are cancelled"
+    ),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse per-file results for unchanged files"
+    ),
+    shard: str = typer.Option(
+        None, "--shard", help="Scan one shard of the files, as INDEX/COUNT (e.g. 0/8)"
+    ),
+    time_budget: float = typer.Option(
+        None,
+        "--time-budget",
+        help="Seconds to spend; riskiest files first, then write a partial report",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue from the last checkpoint of an interrupted run"
+    ),
+    max_workers: str = typer.Option(
+        None,
+        "--max-workers",
+        help="Analysis workers, or 'auto' to fit the container's CPU quota and memory",
+    ),
+    max_memory: str = typer.Option(
+        None,
+        "--max-memory",
+        help="Keep at most this much of the findings in memory (e.g. 512M); spill the rest to disk",
+    ),
     strict: bool = typer.Option(
         False, "--strict", help="Fail if a requested analyzer is unavailable"
     ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Stop at the first gate failure ([ci].max_findings or --fail-on) and write a partial report",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
 ):
     """Run security analysis with Bandit and Safety."""
@@ -77,41 +104,56 @@ def audit(
     eff_changed = cfg.analysis.changed_only if changed_only is None else changed_only
     use_bandit = cfg.analyzers.bandit if bandit is None else bandit
     use_safety = cfg.analyzers.safety if safety is None else safety
+    extra = list(analyzer or cfg.analyzers.plugins or [])
+    try:
+        eff_shard = parse_shard(shard) if shard else None
+    except ShardError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
 
     logger.detail("Output format", eff_output)
     logger.detail("Fail threshold", eff_fail)
+    assert cfg.ci is not None
+    if cfg.ci.max_findings >= 0:
+        logger.detail("Max findings", str(cfg.ci.max_findings))
+    if fail_fast:
+        logger.detail("Fail fast", "True")
     logger.detail("Baseline filtering", str(eff_baseline))
     logger.detail("Changed files only", str(eff_changed))
     logger.detail("Use Bandit", str(use_bandit))
     logger.detail("Use Safety", str(use_safety))
+    if advisory_db:
+        logger.detail("Offline advisory DB", str(advisory_db))
+    if time_budget:
+        logger.detail("Time budget", f"{time_budget:g}s")
+    if max_memory:
+        logger.detail("Finding memory limit", max_memory)
     logger.detail("Exclude patterns", str(cfg.exclude_paths))
+    out_dir = path / cfg.output.directory
+    enabled = RunConfig(
+        path=path, use_bandit=use_bandit, use_safety=use_safety, analyzers=extra
+    ).enabled_analyzers()
 
     # Check analyzer availability in strict mode
     logger.section("Analyzer Availability", "🔍")
     if strict:
         logger.info("Strict mode enabled - checking analyzer availability")
         missing = []
-        if use_bandit and not _BANDIT_OK:
-            missing.append("bandit")
-            logger.error("Bandit not available")
-        else:
-            logger.success("Bandit available")
-        if use_safety and not _which("safety"):
-            missing.append("safety")
-            logger.error("Safety not available")
-        else:
-            logger.success("Safety available")
+        for name in enabled:
+            if analyzer_available(name, advisory_db):
+                logger.success(f"{name} available")
+            else:
+                missing.append(name)
+                logger.error(f"{name} not available")
         if missing:
             console.print(f"[red]Missing analyzers:[/red] {', '.join(missing)}")
             raise typer.Exit(code=2)
     else:
         logger.info("Checking available analyzers")
-        if use_bandit:
-            status = "✅ available" if _BANDIT_OK else "⚠️ unavailable (will skip)"
-            logger.info(f"Bandit: {status}")
-        if use_safety:
-            status = "✅ available" if _which("safety") else "⚠️ unavailable (will skip)"
-            logger.info(f"Safety: {status}")
+        for name in enabled:
+            available = analyzer_available(name, advisory_db)
+            status = "✅ available" if available else "⚠️ unavailable (will skip)"
+            logger.info(f"{name}: {status}")
 
     logger.section("Running Analysis", "🔬")
     console.print(
@@ -123,70 +165,408 @@ def audit(
 
     # Run analyzers
     logger.info("Executing analyzers...")
-    results = run_all(
-        RunConfig(
-            path=path,
+
+    def _terminate(signum, frame):
+        # Preemption: unwind through run_all so the checkpoint is flushed
+        raise KeyboardInterrupt
+
+    on_main = threading.current_thread() is threading.main_thread()
+    previous = signal.signal(signal.SIGTERM, _terminate) if on_main else None
+    try:
+        result = api.audit(
+            path,
+            cfg,
+            fail_on=eff_fail,
+            respect_baseline=eff_baseline,
             changed_only=eff_changed,
-            use_bandit=use_bandit,
-            use_safety=use_safety,
-            exclude_globs=list(cfg.exclude_paths or []),
+            bandit=use_bandit,
+            safety=use_safety,
+            analyzers=extra,
+            advisory_db=advisory_db,
+            timeout=timeout,
+            use_cache=cache,
+            max_workers=max_workers,
+            max_memory=max_memory,
+            shard=eff_shard,
+            time_budget=time_budget,
+            checkpoint=True,
+            resume=resume,
+            strict=strict,
+            fail_fast=fail_fast,
+            baseline_path=BASELINE_PATH,
+            reporters=[api.report_writer(eff_output, out_dir), api.last_run_writer(out_dir)],
         )
-    )
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted;[/yellow] continue with 'specify audit run --resume'")
+        raise typer.Exit(code=130)
+    except ConfigError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
+    finally:
+        if on_main:
+            signal.signal(signal.SIGTERM, previous)
     logger.success(f"Analysis complete in {logger.elapsed()}")
-
-    code_findings = results.get("bandit", [])
-    dep_findings = results.get("safety", [])
+    for name, secs in result.timings.items():
+        logger.detail(f"{name} time", f"{secs:.2f}s")
+    for name, stats in result.stages.items():
+        logger.detail(
+            f"stage {name}", f"{stats.items_in or stats.items_out} items, {stats.throughput:.0f}/s"
+        )
+    if result.cached:
+        logger.detail("Cached file results", str(result.cached))
+    if result.resumed:
+        console.print(f"[green]Resumed:[/green] {result.resumed} files from checkpoint")
+    incomplete = result.incomplete
+    coverage = result.coverage
+    if result.failed_fast:
+        console.print(
+            f"[red]Gate failed:[/red] {escape(result.failure or '')}; remaining analysis cancelled"
+        )
+    elif incomplete and not time_budget:
+        console.print(f"[yellow]Did not finish within {timeout}s:[/yellow] {', '.join(incomplete)}")
+    if result.partial and not result.failed_fast:
+        console.print(
+            f"[yellow]Time budget reached:[/yellow] analyzed {coverage.get('files_analyzed', 0)} "
+            f"of {coverage.get('files_total', 0)} files ({coverage.get('percent', 0)}%)"
+            + (f"; unfinished: {', '.join(incomplete)}" if incomplete else "")
+        )
 
     logger.section("Results Summary", "📊")
-    logger.info(f"Code findings: {len(code_findings)}")
-    logger.info(f"Dependency findings: {len(dep_findings)}")
-
-    # Apply baseline filtering
-    if eff_baseline and code_findings:
-        logger.info("Applying baseline filtering...")
-        base = load_baseline()
-        original_count = len(code_findings)
-        code_findings = filter_with_baseline(code_findings, base)
-        filtered = original_count - len(code_findings)
-        logger.success(f"Filtered {filtered} findings using baseline")
-
-    # Write output
+    logger.info(f"Code findings: {len(result.code)}")
+    logger.info(f"Dependency findings: {len(result.dependencies)}")
+    if result.dependencies:
+        imported = sum(1 for d in result.dependencies if d.get("imported"))
+        logger.detail("Imported by project code", str(imported))
+        logger.detail("Not imported", str(len(result.dependencies) - imported))
+    if eff_baseline:
+        logger.success(f"Filtered {result.suppressed} findings using baseline")
+
     logger.section("Output Generation", "📝")
-    assert cfg.output is not None
-    out_dir = path / cfg.output.directory
-    out_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Output directory: {out_dir}")
-
-    if eff_output.lower() == "sarif":
-        logger.info("Generating SARIF report...")
-        sarif = combine_to_sarif(
-            code_findings, dep_findings, repo_root=path, dep_artifact_hint="requirements.txt"
-        )
-        out = write_sarif(sarif, out_dir / "report.sarif")
-        console.print(f"[green]SARIF written:[/green] {out}")
-        logger.success(f"SARIF report: {out}")
-    elif eff_output.lower() == "html":
-        logger.info("Generating HTML report...")
-        out = write_html(code_findings, dep_findings, out_dir / "report.html")
-        console.print(f"[green]HTML written:[/green] {out}")
-        logger.success(f"HTML report: {out}")
-    else:
-        logger.info("Generating JSON report...")
-        out = out_dir / "analysis.json"
-        out.write_text(json.dumps({"code": code_findings, "dependencies": dep_findings}, indent=2))
-        console.print(f"[green]JSON written:[/green] {out}")
-        logger.success(f"JSON report: {out}")
-
-    # Save last run
-    logger.info("Saving run metadata...")
-    save_last_run({"code": code_findings, "dependencies": dep_findings}, out_dir)
-    logger.success("Metadata saved")
+    label = {"sarif": "SARIF", "html": "HTML"}.get(eff_output.lower(), "JSON")
+    console.print(f"[green]{label} written:[/green] {result.reports[0]}")
+    logger.success(f"{label} report: {result.reports[0]}")
+    if len(result.reports) > 1:
+        logger.success("Metadata saved")
 
     # Check severity threshold
     logger.section("Exit Code Determination", "🚦")
-    rc = max(_gate_code(code_findings, eff_fail), _gate_code(dep_findings, eff_fail))
+    rc = result.exit_code
+    if result.failure and not result.failed_fast:
+        console.print(f"[red]Gate failed:[/red] {escape(result.failure)}")
+    if incomplete and strict and not result.failed_fast:
+        logger.error(f"Incomplete analyzers in strict mode: {', '.join(incomplete)}")
+    if result.partial and strict and not result.failed_fast:
+        logger.error("Partial results in strict mode")
     if rc == 0:
         logger.success(f"No issues above threshold '{eff_fail}' - exiting with code 0")
     else:
         logger.warning(f"Found issues above threshold '{eff_fail}' - exiting with code {rc}")
     raise typer.Exit(code=rc)
+
+
+@app.command("merge")
+def merge(
+    reports: list[Path] = typer.Argument(..., help="Shard reports written by 'audit run --shard'"),
+    path: Path = typer.Option(Path.cwd(), "--path", help="Project root (for config)"),
+    out_file: Path = typer.Option(
+        None, "--out", help="Merged report path (default: the unsharded report name)"
+    ),
+    fail_on: str = typer.Option(None, "--fail-on", help="HIGH or MEDIUM or LOW"),
+    strict: bool = typer.Option(False, "--strict", help="Fail if any shard was incomplete"),
+):
+    """Merge JSON or SARIF shard reports into one report and one exit code."""
+    console = Console()
+    cfg = load_config(path)
+    assert cfg.output is not None
+    assert cfg.analysis is not None
+    eff_fail = fail_on or cfg.analysis.fail_on
+
+    try:
+        docs = [json.loads(p.read_text()) for p in reports]
+    except (OSError, json.JSONDecodeError) as e:
+        console.print(f"[red]Cannot read shard report:[/red] {e}")
+        raise typer.Exit(code=2)
+
+    out_dir = path / cfg.output.directory
+    is_sarif = all("runs" in d for d in docs)
+    try:
+        if is_sarif:
+            merged = merge_sarif_reports(docs)
+            out = write_sarif(merged, out_file or out_dir / "report.sarif")
+            findings = [
+                {"severity": {"error": "HIGH", "warning": "MEDIUM"}.get(r["level"], "LOW")}
+                for r in merged["runs"][0]["results"]
+            ]
+            incomplete: list[str] = []
+            partial = bool(merged["runs"][0].get("properties", {}).get("partial"))
+        else:
+            merged = merge_json_reports(docs)
+            out = out_file or out_dir / "analysis.json"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(json.dumps(merged, indent=2))
+            partial = bool(merged.get("partial"))
+            if not partial:
+                save_last_run(
+                    {"code": merged["code"], "dependencies": merged["dependencies"]}, out_dir
+                )
+            findings = merged["code"] + merged["dependencies"]
+            incomplete = merged.get("incomplete", [])
+    except ShardError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
+    except (KeyError, IndexError, TypeError) as e:
+        console.print(f"[red]Malformed shard report:[/red] {e}")
+        raise typer.Exit(code=2)
+
+    console.print(f"[green]Merged {len(docs)} shards:[/green] {out}")
+    rc = _gate_code(findings, eff_fail)
+    if incomplete:
+        console.print(f"[yellow]Incomplete analyzers:[/yellow] {', '.join(incomplete)}")
+        if strict:
+            rc = 2
+    if partial:
+        console.print("[yellow]Partial results:[/yellow] some shards ran out of time budget")
+        if strict:
+            rc = 2
+    raise typer.Exit(code=rc)
+
+
+def _finding_line(f: dict) -> str:
+    return f"{f.get('file_path')}:{f.get('line')} {f.get('rule_id')} [{f.get('severity')}] {f.get('message')}"
+
+
+@app.command("watch")
+def watch(
+    path: Path = typer.Option(Path.cwd(), "--path", help="Folder to watch"),
+    interval: float = typer.Option(0.5, "--interval", help="Seconds between change checks"),
+    poll: bool = typer.Option(False, "--poll", help="Always poll instead of using inotify"),
+    respect_baseline: bool = typer.Option(None, "--respect-baseline/--no-baseline"),
+    analyzer: list[str] = typer.Option(
+        None, "--analyzer", help="Also run a registered analyzer plugin (repeatable)"
+    ),
+):
+    """Re-scan changed files on save and print what changed.
+
+    Only file-level analyzers run in watch mode; dependency scanning stays
+    with 'audit run'.
+    """
+    from specify_cli.watch import ChangeWaiter, WatchSession
+
+    console = Console()
+    cfg = load_config(path)
+    assert cfg.analysis is not None
+    assert cfg.analyzers is not None
+    eff_baseline = cfg.analysis.respect_baseline if respect_baseline is None else respect_baseline
+    names = RunConfig(
+        path=path,
+        use_bandit=cfg.analyzers.bandit,
+        use_safety=False,
+        analyzers=list(analyzer or cfg.analyzers.plugins or []),
+    ).enabled_analyzers()
+    plugins = discover_plugins()
+    selected = [
+        plugins[n]
+        for n in names
+        if n in plugins and plugins[n].scope == "file" and plugins[n].available()
+    ]
+    if not selected:
+        console.print("[red]No file-level analyzers available to watch[/red]")
+        raise typer.Exit(code=2)
+
+    session = WatchSession(
+        path,
+        selected,
+        exclude_globs=list(cfg.exclude_paths or []),
+        baseline_path=path / BASELINE_PATH if eff_baseline else None,
+        shared_baseline=(
+            path / cfg.analysis.shared_baseline if cfg.analysis.shared_baseline else None
+        ),
+    )
+    waiter = ChangeWaiter(use_inotify=not poll)
+    started = time.monotonic()
+    count = session.start()
+    waiter.track(path, session.snap)
+    console.print(
+        f"[bold]Watching[/bold] {count} files with {', '.join(p.name for p in selected)} "
+        f"({waiter.mode}); {len(session.findings())} findings "
+        f"[dim]({time.monotonic() - started:.2f}s)[/dim]. Ctrl-C to stop."
+    )
+    try:
+        while True:
+            waiter.wait(interval)
+            delta = session.poll()
+            if delta is None:
+                continue
+            waiter.track(path, delta.files)
+            for f in delta.added:
+                console.print(f"[red]+ {escape(_finding_line(f))}[/red]")
+            for f in delta.fixed:
+                console.print(f"[green]- {escape(_finding_line(f))}[/green]")
+            console.print(
+                f"[dim]{len(delta.files)} file(s) re-scanned in {delta.seconds * 1000:.0f} ms; "
+                f"{delta.total} findings[/dim]"
+            )
+    except KeyboardInterrupt:
+        console.print("Stopped watching")
+    finally:
+        waiter.close()
+        session.close()
+
+
+@app.command("staged")
+def staged(
+    path: Path = typer.Option(Path.cwd(), "--path", help="Any folder inside the repository"),
+    fail_on: str = typer.Option(None, "--fail-on", help="HIGH or MEDIUM or LOW"),
+    respect_baseline: bool = typer.Option(None, "--respect-baseline/--no-baseline"),
+    analyzer: list[str] = typer.Option(
+        None, "--analyzer", help="Also run a registered analyzer plugin (repeatable)"
+    ),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse per-file results for unchanged content"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print findings as JSON"),
+):
+    """Scan what is staged for commit (for pre-commit hooks).
+
+    Reads file contents from the git index rather than the working tree, so
+    unstaged edits neither hide nor add findings. Only analyzers that can
+    scan in-memory content run here.
+    """
+    from specify_cli.errors import GitError
+    from specify_cli.gitutils import repo_toplevel
+    from specify_cli.staged import scan_staged
+
+    console = Console()
+    try:
+        root = repo_toplevel(path)
+    except GitError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
+    cfg = load_config(root)
+    assert cfg.analysis is not None
+    assert cfg.analyzers is not None
+    eff_fail = fail_on or cfg.analysis.fail_on
+    eff_baseline = cfg.analysis.respect_baseline if respect_baseline is None else respect_baseline
+    names = RunConfig(
+        path=root,
+        use_bandit=cfg.analyzers.bandit,
+        use_safety=False,
+        analyzers=list(analyzer or cfg.analyzers.plugins or []),
+    ).enabled_analyzers()
+    plugins = discover_plugins()
+    selected = [
+        plugins[n]
+        for n in names
+        if n in plugins
+        and plugins[n].scope == "file"
+        and plugins[n].in_memory
+        and plugins[n].available()
+    ]
+    if not selected:
+        console.print("[red]No analyzers available that can scan staged content[/red]")
+        raise typer.Exit(code=2)
+
+    shared = cfg.analysis.shared_baseline
+    try:
+        result = scan_staged(
+            root,
+            selected,
+            exclude_globs=list(cfg.exclude_paths or []),
+            baseline=(
+                load_baseline(
+                    root / BASELINE_PATH, root=root, shared=root / shared if shared else None
+                )
+                if eff_baseline
+                else None
+            ),
+            use_cache=cache,
+        )
+    except GitError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
+
+    rc = _gate_code(result.findings, eff_fail)
+    if as_json:
+        typer.echo(
+            json.dumps({"files": result.files, "code": result.findings, "exit_code": rc}, indent=2)
+        )
+    else:
+        for f in result.findings:
+            console.print(escape(_finding_line(f)))
+        console.print(
+            f"[dim]{len(result.files)} staged file(s), {len(result.findings)} findings "
+            f"({result.suppressed} baselined) in {result.seconds * 1000:.0f} ms[/dim]"
+        )
+    raise typer.Exit(code=rc)
+
+
+@app.command("fleet")
+def fleet(
+    manifest: Path = typer.Option(
+        ..., "--manifest", help="File listing repository checkouts, one per line"
+    ),
+    out: Path = typer.Option(Path("fleet-reports"), "--out", help="Directory for all reports"),
+    output: str = typer.Option("json", "--output", help="sarif or html or json"),
+    fail_on: str = typer.Option(
+        None, "--fail-on", help="HIGH or MEDIUM or LOW (default: each repo's config)"
+    ),
+    safety: bool = typer.Option(None, "--safety/--no-safety"),
+    max_workers: int = typer.Option(None, "--max-workers", help="Size of the shared worker pool"),
+    cache_dir: Path = typer.Option(
+        None, "--cache-dir", help="Shared result cache (default: <out>/cache)"
+    ),
+    timeout: float = typer.Option(None, "--timeout", help="Per-repository deadline in seconds"),
+):
+    """Audit many repositories in one process with a shared pool and cache.
+
+    Writes <out>/<repo>/ reports and <out>/summary.json; the exit code is
+    the worst of all repositories (2 if any could not be audited).
+    """
+    from rich.table import Table
+
+    from specify_cli.fleet import FleetError, read_manifest, run_fleet
+
+    console = Console()
+    try:
+        repos = read_manifest(manifest)
+    except FleetError as e:
+        console.print(f"[red]{e.message}[/red]")
+        raise typer.Exit(code=2)
+
+    def _progress(r) -> None:
+        status = (
+            "[red]error[/red]" if r.error else ("[yellow]fail[/yellow]" if r.exit_code else "ok")
+        )
+        console.print(
+            f"{status} {escape(r.name)}: {r.code} code, {r.dependencies} dependency findings "
+            f"[dim]({r.seconds:.2f}s, {r.cached} cached)[/dim]"
+            + (f" - {escape(r.error)}" if r.error else "")
+        )
+
+    summary = run_fleet(
+        repos,
+        out,
+        output=output,
+        fail_on=fail_on,
+        use_safety=safety,
+        max_workers=max_workers,
+        cache_dir=cache_dir,
+        timeout=timeout,
+        on_repo=_progress,
+    )
+
+    table = Table(title=f"Fleet audit ({len(repos)} repositories)")
+    for col in ("Repository", "Code", "Dependencies", "Exit"):
+        table.add_column(col)
+    for r in summary["repositories"]:
+        table.add_row(
+            escape(r["name"]), str(r["code"]), str(r["dependencies"]), str(r["exit_code"])
+        )
+    console.print(table)
+    totals = summary["totals"]
+    console.print(
+        f"[green]Summary written:[/green] {out / 'summary.json'} "
+        f"[dim]({totals['seconds']:.1f}s, {totals['cached_files']} file results from cache)[/dim]"
+    )
+    raise typer.Exit(code=summary["exit_code"])
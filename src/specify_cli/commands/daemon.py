@@ -0,0 +1,65 @@
+"""Scan daemon commands for fast repeated audits."""
+
+from __future__ import annotations
+from pathlib import Path
+import typer
+from rich.console import Console
+
+from specify_cli.daemon import DEFAULT_IDLE_TIMEOUT, ScanDaemon
+from specify_cli.daemon_client import is_running, request, socket_path, spawn
+from specify_cli.errors import SpecKitError
+
+app = typer.Typer(help="Run a warm scan daemon for editors and pre-commit hooks")
+
+
+@app.command("start")
+def start(
+    socket: Path = typer.Option(None, "--socket", help="Unix socket path"),
+    idle_timeout: float = typer.Option(
+        DEFAULT_IDLE_TIMEOUT, "--idle-timeout", help="Exit after this many idle seconds"
+    ),
+    foreground: bool = typer.Option(False, "--foreground", help="Do not detach"),
+):
+    """Start the daemon (clients connect with 'specify-scan')."""
+    console = Console()
+    path = socket or socket_path()
+    if is_running(path):
+        console.print(f"[yellow]Daemon already running[/yellow] on {path}")
+        return
+    if foreground:
+        try:
+            ScanDaemon(path, idle_timeout).serve()
+        except SpecKitError as e:
+            e.display()
+            raise typer.Exit(code=1)
+        return
+    if not spawn(path, idle_timeout):
+        console.print(f"[red]Daemon did not start[/red]; see {path.with_suffix('.log')}")
+        raise typer.Exit(code=1)
+    console.print(f"[green]Daemon listening[/green] on {path}")
+
+
+@app.command("stop")
+def stop(socket: Path = typer.Option(None, "--socket", help="Unix socket path")):
+    """Stop a running daemon."""
+    console = Console()
+    try:
+        request({"op": "stop"}, socket, timeout=5.0)
+    except (OSError, ValueError):
+        console.print("[yellow]No daemon running[/yellow]")
+        return
+    console.print("[green]Daemon stopped[/green]")
+
+
+@app.command("status")
+def status(socket: Path = typer.Option(None, "--socket", help="Unix socket path")):
+    """Show whether the daemon is running and which repositories it holds."""
+    console = Console()
+    try:
+        info = request({"op": "ping"}, socket, timeout=2.0)
+    except (OSError, ValueError):
+        console.print("[yellow]No daemon running[/yellow]")
+        raise typer.Exit(code=1)
+    console.print(f"[green]Running[/green] pid {info['pid']}, up {info['uptime']}s")
+    for repo in info.get("repos", []):
+        console.print(f"  {repo}")
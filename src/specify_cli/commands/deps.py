@@ -0,0 +1,81 @@
+"""Dependency remediation commands."""
+
+from __future__ import annotations
+import difflib
+from pathlib import Path
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from specify_cli.advisories import AdvisoryStore, DB_PATH
+from specify_cli.manifest import find_manifest, is_requirements_file, parse_manifest
+from specify_cli.manifest import patch_requirements
+from specify_cli.remediation import plan_upgrades
+
+app = typer.Typer(help="Plan dependency upgrades")
+
+
+@app.command("plan")
+def plan(
+    path: Path = typer.Option(Path.cwd(), "--path", help="Project folder"),
+    manifest: Path = typer.Option(None, "--manifest", help="Manifest to plan (auto-detected)"),
+    db: Path = typer.Option(None, "--db", help="Offline advisory database"),
+    fmt: str = typer.Option("table", "--format", help="table, diff or manifest"),
+    write: bool = typer.Option(False, "--write", help="Patch the manifest in place"),
+):
+    """Compute the minimal version bumps that clear all known advisories."""
+    console = Console()
+    manifest = manifest or find_manifest(path)
+    db = db or path / DB_PATH
+    if manifest is None:
+        console.print(f"[red]No dependency manifest found in {path}[/red]")
+        raise typer.Exit(code=2)
+    if not db.exists():
+        console.print(f"[red]Advisory database not found:[/red] {db}")
+        console.print("Run: specify advisories import <dump.json>")
+        raise typer.Exit(code=2)
+
+    pins = parse_manifest(manifest)
+    with AdvisoryStore(db) as store:
+        upgrades = plan_upgrades(pins, store)
+
+    unresolved = [u for u in upgrades if u.target is None]
+    fmt = fmt.lower()
+    patchable = is_requirements_file(manifest)
+    if (fmt in ("diff", "manifest") or write) and not patchable:
+        console.print(f"[red]{manifest.name} cannot be patched; use --format table[/red]")
+        raise typer.Exit(code=2)
+
+    original = manifest.read_text() if patchable else ""
+    patched = original
+    if patchable:
+        bumps = {u.line: u.target for u in upgrades if u.target and u.line}
+        patched = patch_requirements(original, bumps)
+
+    if fmt == "diff":
+        diff = difflib.unified_diff(
+            original.splitlines(keepends=True),
+            patched.splitlines(keepends=True),
+            fromfile=f"a/{manifest.name}",
+            tofile=f"b/{manifest.name}",
+        )
+        typer.echo("".join(diff), nl=False)
+    elif fmt == "manifest":
+        typer.echo(patched, nl=False)
+    else:
+        t = Table(title=f"Upgrade plan for {manifest.name}")
+        t.add_column("Package")
+        t.add_column("Current")
+        t.add_column("Target")
+        t.add_column("Advisories")
+        for u in upgrades:
+            target = u.target or "[red]no known fix[/red]"
+            t.add_row(u.package, u.current, target, ", ".join(u.advisories))
+        console.print(t)
+        console.print(f"{len(upgrades)} vulnerable pins, {len(unresolved)} without a known fix")
+
+    if write and patched != original:
+        manifest.write_text(patched)
+        console.print(f"[green]Patched:[/green] {manifest}")
+
+    raise typer.Exit(code=1 if unresolved else 0)
@@ -27,6 +27,7 @@ class AnalysisCfg:
     fail_on: str = "HIGH"
     respect_baseline: bool = True
     changed_only: bool = False
+    shared_baseline: Optional[str] = None  # organization-wide baseline (see baseline_shared)
 
 
 @dataclass
@@ -40,6 +41,11 @@ class AnalyzersCfg:
     bandit: bool = True
     safety: bool = True
     secrets: bool = False
+    plugins: list[str] | None = None  # Extra analyzer plugins by entry-point name
+
+    def __post_init__(self):
+        if self.plugins is None:
+            self.plugins = []
 
 
 @dataclass
@@ -69,7 +75,8 @@ class CICfg:
 class PerformanceCfg:
     """Performance tuning configuration."""
 
-    max_workers: int = 4
+    max_workers: int | str = 4  # or "auto" to fit the container (see resources.py)
+    max_memory: int | str | None = None  # e.g. "512M": spill findings to disk past this
 
 
 @dataclass
@@ -145,6 +152,7 @@ class SpecKitConfig:
             assert cfg.performance is not None  # Initialized in __post_init__
             cfg.performance = PerformanceCfg(
                 max_workers=p.get("max_workers", cfg.performance.max_workers),
+                max_memory=p.get("max_memory", cfg.performance.max_memory),
             )
 
         # Telemetry section
@@ -155,14 +163,16 @@ class SpecKitConfig:
                 enabled=t.get("enabled", cfg.telemetry.enabled),
             )
 
-        # Analysis section
+        # Analysis section; without its own fail_on, [ci].fail_on_severity gates
+        assert cfg.analysis is not None  # Initialized in __post_init__
+        cfg.analysis.fail_on = cfg.ci.fail_on_severity
         if "analysis" in data:
             a = data["analysis"]
-            assert cfg.analysis is not None  # Initialized in __post_init__
             cfg.analysis = AnalysisCfg(
                 fail_on=a.get("fail_on", cfg.analysis.fail_on),
                 respect_baseline=a.get("respect_baseline", cfg.analysis.respect_baseline),
                 changed_only=a.get("changed_only", cfg.analysis.changed_only),
+                shared_baseline=a.get("shared_baseline", cfg.analysis.shared_baseline),
             )
 
         # Output section
@@ -182,6 +192,7 @@ class SpecKitConfig:
                 bandit=z.get("bandit", cfg.analyzers.bandit),
                 safety=z.get("safety", cfg.analyzers.safety),
                 secrets=z.get("secrets", cfg.analyzers.secrets),
+                plugins=list(z.get("plugins", cfg.analyzers.plugins)),
             )
 
         # Exclude paths
@@ -203,11 +214,15 @@ def load_config(repo_root: Path, file_path: Optional[Path] = None) -> SpecKitCon
     """
     path = file_path or (repo_root / ".speckit.toml")
     cfg = SpecKitConfig()
+    fail_on_set = False
     if path.exists():
         data = tomllib.loads(path.read_text())
         a = data.get("analysis", {})
+        fail_on_set = "fail_on" in a
         o = data.get("output", {})
         z = data.get("analyzers", {})
+        perf = data.get("performance", {})
+        ci = data.get("ci", {})
         ex = data.get("exclude", {}).get("paths", [])
         assert cfg.analysis is not None  # Initialized in __post_init__
         assert cfg.output is not None  # Initialized in __post_init__
@@ -216,6 +231,7 @@ def load_config(repo_root: Path, file_path: Optional[Path] = None) -> SpecKitCon
             fail_on=a.get("fail_on", cfg.analysis.fail_on),
             respect_baseline=a.get("respect_baseline", cfg.analysis.respect_baseline),
             changed_only=a.get("changed_only", cfg.analysis.changed_only),
+            shared_baseline=a.get("shared_baseline", cfg.analysis.shared_baseline),
         )
         cfg.output = OutputCfg(
             format=o.get("format", cfg.output.format),
@@ -225,23 +241,46 @@ def load_config(repo_root: Path, file_path: Optional[Path] = None) -> SpecKitCon
             bandit=z.get("bandit", cfg.analyzers.bandit),
             safety=z.get("safety", cfg.analyzers.safety),
             secrets=z.get("secrets", cfg.analyzers.secrets),
+            plugins=list(z.get("plugins", cfg.analyzers.plugins)),
+        )
+        assert cfg.ci is not None  # Initialized in __post_init__
+        cfg.ci = CICfg(
+            fail_on_severity=ci.get("fail_on_severity", cfg.ci.fail_on_severity),
+            max_findings=ci.get("max_findings", cfg.ci.max_findings),
+        )
+        assert cfg.performance is not None  # Initialized in __post_init__
+        cfg.performance = PerformanceCfg(
+            max_workers=perf.get("max_workers", cfg.performance.max_workers),
+            max_memory=perf.get("max_memory", cfg.performance.max_memory),
         )
         cfg.exclude_paths = list(ex or [])
 
     # ENV overrides
     assert cfg.analysis is not None  # Initialized in __post_init__
     assert cfg.output is not None  # Initialized in __post_init__
+    assert cfg.ci is not None  # Initialized in __post_init__
+    cfg.ci.fail_on_severity = os.getenv("SPECKIT_FAIL_ON_SEVERITY", cfg.ci.fail_on_severity)
+    cfg.ci.max_findings = int(os.getenv("SPECKIT_MAX_FINDINGS", cfg.ci.max_findings))
+    # [analysis].fail_on wins; [ci].fail_on_severity is the fallback gate
+    if not fail_on_set:
+        cfg.analysis.fail_on = cfg.ci.fail_on_severity
     cfg.analysis.fail_on = os.getenv("SPECKIT_FAIL_ON", cfg.analysis.fail_on)
     cfg.analysis.respect_baseline = _env_bool(
         "SPECKIT_RESPECT_BASELINE", cfg.analysis.respect_baseline
     )
     cfg.analysis.changed_only = _env_bool("SPECKIT_CHANGED_ONLY", cfg.analysis.changed_only)
+    cfg.analysis.shared_baseline = os.getenv(
+        "SPECKIT_SHARED_BASELINE", cfg.analysis.shared_baseline
+    )
     cfg.output.format = os.getenv("SPECKIT_OUTPUT", cfg.output.format)
     cfg.output.directory = os.getenv("SPECKIT_OUT_DIR", cfg.output.directory)
     assert cfg.analyzers is not None  # Initialized in __post_init__
     cfg.analyzers.bandit = _env_bool("SPECKIT_BANDIT", cfg.analyzers.bandit)
     cfg.analyzers.safety = _env_bool("SPECKIT_SAFETY", cfg.analyzers.safety)
     cfg.analyzers.secrets = _env_bool("SPECKIT_SECRETS", cfg.analyzers.secrets)
+    assert cfg.performance is not None  # Initialized in __post_init__
+    cfg.performance.max_workers = os.getenv("SPECKIT_MAX_WORKERS", cfg.performance.max_workers)
+    cfg.performance.max_memory = os.getenv("SPECKIT_MAX_MEMORY", cfg.performance.max_memory)
     return cfg
 
 
@@ -0,0 +1,235 @@
+"""Persistent scan daemon serving warm per-repository sessions.
+
+Holds one ``WatchSession`` per repository (analyzers imported, config and
+baseline loaded, per-file results in memory) and answers scan requests from
+``specify_cli.daemon_client`` over a Unix domain socket. Shuts itself down
+after a period without requests.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from specify_cli.analyzers.registry import discover_plugins
+from specify_cli.api import gate_code
+from specify_cli.baseline import BASELINE_PATH
+from specify_cli.config import load_config
+from specify_cli.daemon_client import is_running, socket_path
+from specify_cli.errors import SpecKitError
+from specify_cli.logging import get_logger
+from specify_cli.runner import RunConfig
+from specify_cli.watch import FileSig, WatchSession
+
+log = get_logger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+
+class DaemonError(SpecKitError):
+    """The daemon could not start or serve a request."""
+
+
+@dataclass
+class _Repo:
+    session: WatchSession
+    fail_on: str
+    config_sig: Optional[FileSig]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _config_sig(root: Path) -> Optional[FileSig]:
+    try:
+        st = (root / ".speckit.toml").stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ScanDaemon:
+    """Request handler state shared by all connections."""
+
+    def __init__(self, path: Optional[Path] = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """Initialize daemon state.
+
+        Args:
+            path: Socket path (defaults to the per-user path)
+            idle_timeout: Seconds without requests before shutting down
+        """
+        self.path = Path(path or socket_path())
+        self.idle_timeout = idle_timeout
+        self.started = time.monotonic()
+        self.last_request = self.started
+        self._repos: Dict[str, _Repo] = {}
+        self._repos_lock = threading.Lock()
+        self._server: Optional[socketserver.UnixStreamServer] = None
+
+    def _repo(self, root: Path) -> _Repo:
+        key = str(root)
+        with self._repos_lock:
+            repo = self._repos.get(key)
+            if repo is not None and repo.config_sig == _config_sig(root):
+                return repo
+            if repo is not None:
+                with repo.lock:  # not while a scan is using it
+                    repo.session.close()
+            # New repository or edited config: build a fresh warm session
+            cfg = load_config(root)
+            assert cfg.analysis is not None
+            assert cfg.analyzers is not None
+            names = RunConfig(
+                path=root,
+                use_bandit=cfg.analyzers.bandit,
+                use_safety=False,
+                analyzers=list(cfg.analyzers.plugins or []),
+            ).enabled_analyzers()
+            registry = discover_plugins()
+            plugins = [
+                registry[n]
+                for n in names
+                if n in registry and registry[n].scope == "file" and registry[n].available()
+            ]
+            session = WatchSession(
+                root,
+                plugins,
+                exclude_globs=list(cfg.exclude_paths or []),
+                baseline_path=root / BASELINE_PATH if cfg.analysis.respect_baseline else None,
+                shared_baseline=(
+                    root / cfg.analysis.shared_baseline if cfg.analysis.shared_baseline else None
+                ),
+            )
+            session.start()
+            repo = _Repo(session, cfg.analysis.fail_on, _config_sig(root))
+            self._repos[key] = repo
+            log.info(f"Loaded {root} ({len(session.snap)} files)")
+            return repo
+
+    def handle(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve one decoded request."""
+        self.last_request = time.monotonic()
+        op = req.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime": round(time.monotonic() - self.started, 1),
+                "repos": sorted(self._repos),
+            }
+        if op == "stop":
+            self.shutdown()
+            return {"ok": True}
+        if op != "scan":
+            return {"error": f"unknown op {op!r}"}
+
+        start = time.monotonic()
+        root = Path(req.get("root") or "").resolve()
+        if not root.is_dir():
+            return {"error": f"not a directory: {root}"}
+        repo = self._repo(root)
+        files = req.get("files")
+        with repo.lock:
+            if files:
+                rels = [os.path.relpath(Path(f).resolve(), root) for f in files]
+                delta = repo.session.poll(rels)
+            else:
+                delta = repo.session.poll()
+            findings = repo.session.findings()
+        if files:
+            wanted = {os.path.normpath(root / rel) for rel in rels}
+            findings = [f for f in findings if os.path.normpath(str(f["file_path"])) in wanted]
+        return {
+            "findings": findings,
+            "exit_code": gate_code(findings, req.get("fail_on") or repo.fail_on),
+            "rescanned": len(delta.files) if delta else 0,
+            "seconds": round(time.monotonic() - start, 4),
+        }
+
+    def shutdown(self) -> None:
+        """Stop serving (safe to call from a request handler)."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def _watch_idle(self) -> None:
+        while self._server is not None:
+            time.sleep(min(1.0, self.idle_timeout))
+            if time.monotonic() - self.last_request > self.idle_timeout:
+                log.info("Idle timeout reached; shutting down")
+                self.shutdown()
+                return
+
+    def serve(self) -> None:
+        """Listen on the socket until stopped or idle.
+
+        Raises:
+            DaemonError: Another daemon already owns the socket
+        """
+        if self.path.exists():
+            if is_running(self.path):
+                raise DaemonError(f"A daemon is already listening on {self.path}")
+            self.path.unlink()  # stale socket from a crashed daemon
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o077)  # socket usable by this user only
+        try:
+            server = _Server(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        server.scan_daemon = self
+        self._server = server
+        threading.Thread(target=self._watch_idle, name="speckit-idle", daemon=True).start()
+        log.info(f"Listening on {self.path} (pid {os.getpid()})")
+        try:
+            server.serve_forever(poll_interval=0.2)
+        finally:
+            self._server = None
+            server.server_close()
+            with self._repos_lock:
+                for repo in self._repos.values():
+                    with repo.lock:
+                        repo.session.close()
+                self._repos.clear()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    scan_daemon: ScanDaemon
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            resp = self.server.scan_daemon.handle(json.loads(line))  # type: ignore[attr-defined]
+        except Exception as e:  # reported to the client instead of killing the daemon
+            log.exception("Request failed")
+            resp = {"error": str(e)}
+        self.wfile.write(json.dumps(resp).encode() + b"\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the daemon in the foreground (used by ``specify daemon start``)."""
+    parser = argparse.ArgumentParser(prog="python -m specify_cli.daemon")
+    parser.add_argument("--socket", type=Path, default=None)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    try:
+        ScanDaemon(args.socket, args.idle_timeout).serve()
+    except DaemonError as e:
+        print(e.message, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
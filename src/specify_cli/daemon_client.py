@@ -0,0 +1,149 @@
+"""Thin client for the scan daemon (``specify daemon start``).
+
+Standard library only and imported without the rest of the CLI, so a
+request costs little more than interpreter start-up. Requests and
+responses are single JSON documents, one per line, over a Unix socket.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV = "SPECKIT_DAEMON_SOCKET"
+
+
+def socket_path() -> Path:
+    """Per-user socket path (``$SPECKIT_DAEMON_SOCKET`` overrides)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"speckit-{os.getuid()}.sock"
+
+
+def request(payload: Dict[str, Any], path: Optional[Path] = None, timeout: float = 120.0) -> Dict:
+    """Send one request and return the decoded response.
+
+    Raises:
+        OSError: No daemon is listening on the socket
+        ValueError: The daemon sent a malformed response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path or socket_path()))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    return json.loads(b"".join(chunks))
+
+
+def is_running(path: Optional[Path] = None) -> bool:
+    """True if a daemon answers on the socket."""
+    try:
+        return bool(request({"op": "ping"}, path, timeout=2.0).get("ok"))
+    except (OSError, ValueError):
+        return False
+
+
+def spawn(path: Optional[Path] = None, idle_timeout: float = 900.0, wait: float = 10.0) -> bool:
+    """Start a detached daemon and wait until it answers.
+
+    Returns:
+        True once the daemon is reachable
+    """
+    path = path or socket_path()
+    log = path.with_suffix(".log")
+    with open(log, "ab") as out:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "specify_cli.daemon",
+                "--socket",
+                str(path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=out,
+            stderr=out,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running(path):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _format(f: Dict[str, Any]) -> str:
+    return (
+        f"{f.get('file_path')}:{f.get('line')} {f.get('rule_id')} "
+        f"[{f.get('severity')}] {f.get('message')}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """``specify-scan``: scan files through the daemon; exit code gates on severity."""
+    parser = argparse.ArgumentParser(
+        prog="specify-scan", description="Scan files through the specify daemon"
+    )
+    parser.add_argument("files", nargs="*", help="Files to report on (default: whole project)")
+    parser.add_argument("--path", default=os.getcwd(), help="Project root")
+    parser.add_argument("--fail-on", help="HIGH, MEDIUM or LOW (default: project config)")
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON response")
+    parser.add_argument(
+        "--start", action="store_true", help="Start the daemon if it is not running"
+    )
+    args = parser.parse_args(argv)
+
+    root = os.path.abspath(args.path)
+    payload: Dict[str, Any] = {
+        "op": "scan",
+        "root": root,
+        "files": [os.path.abspath(f) for f in args.files] or None,
+        "fail_on": args.fail_on,
+    }
+    try:
+        resp = request(payload)
+    except OSError:
+        if not (args.start and spawn()):
+            print(
+                "specify daemon is not running; start it with 'specify daemon start'",
+                file=sys.stderr,
+            )
+            return 2
+        resp = request(payload)
+
+    if "error" in resp:
+        print(f"specify daemon: {resp['error']}", file=sys.stderr)
+        return 2
+    if args.json:
+        print(json.dumps(resp, indent=2))
+    else:
+        for f in resp.get("findings", []):
+            print(_format(f))
+        print(
+            f"{len(resp.get('findings', []))} findings, {resp.get('rescanned', 0)} file(s) "
+            f"re-scanned in {resp.get('seconds', 0) * 1000:.0f} ms"
+        )
+    return int(resp.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
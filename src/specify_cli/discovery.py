@@ -0,0 +1,88 @@
+"""Python source discovery shared by file-level analyzers."""
+
+from __future__ import annotations
+import fnmatch
+import os
+from pathlib import Path, PurePath
+from typing import Iterator, List
+
+# Virtual environments and build artifacts are never scanned
+SKIP_DIRS = (".venv", "venv", ".tox", "build", "dist", "__pycache__")
+
+
+def is_excluded(rel: str, exclude_globs: List[str]) -> bool:
+    """Check if a relative path matches any exclude pattern.
+
+    Args:
+        rel: Path relative to the scan root
+        exclude_globs: List of glob patterns to exclude
+
+    Returns:
+        True if path should be excluded
+    """
+    return any(
+        fnmatch.fnmatch(rel, pat) or rel.startswith(pat.rstrip("/")) for pat in exclude_globs
+    )
+
+
+def in_scope(rel: str, exclude_globs: List[str] | None = None) -> bool:
+    """True if discovery would yield this path (relative to the scan root)."""
+    parts = PurePath(rel).parts
+    if not parts or not parts[-1].endswith(".py"):
+        return False
+    if any(part in SKIP_DIRS for part in parts[:-1]):
+        return False
+    return not (exclude_globs and is_excluded(PurePath(rel).as_posix(), exclude_globs))
+
+
+def iter_python_files(target: Path, exclude_globs: List[str] | None = None) -> Iterator[Path]:
+    """Lazily yield Python files under target in sorted path order.
+
+    Directory entries are visited depth-first in name order, which yields
+    the same sequence as sorting the full list, so consumers can start on
+    the first files before the walk finishes.
+
+    Args:
+        target: Directory or file to search
+        exclude_globs: List of glob patterns to exclude
+
+    Yields:
+        Python file paths
+    """
+    target = Path(target)
+    excludes = exclude_globs or []
+    if target.is_file():
+        if target.suffix == ".py":
+            yield target
+        return
+
+    def _walk(directory: Path, rel: str) -> Iterator[Path]:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            rel_name = f"{rel}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    yield from _walk(Path(entry.path), rel_name + "/")
+            elif entry.name.endswith(".py") and entry.is_file():
+                if excludes and is_excluded(rel_name, excludes):
+                    continue
+                yield Path(entry.path)
+
+    yield from _walk(target, "")
+
+
+def discover_python_files(target: Path, exclude_globs: List[str] | None = None) -> List[Path]:
+    """Find Python files under target, honouring skip dirs and exclude globs.
+
+    Args:
+        target: Directory or file to search
+        exclude_globs: List of glob patterns to exclude
+
+    Returns:
+        Sorted list of Python file paths
+    """
+    return list(iter_python_files(target, exclude_globs))
@@ -168,6 +168,24 @@ class GitError(SpecKitError):
         super().__init__(message, **kwargs)
 
 
+class AdvisoryDBError(SpecKitError):
+    """Error loading or updating the offline advisory database."""
+
+    def __init__(self, message: str, db_path: Optional[Path] = None, **kwargs):
+        """Initialize advisory database error.
+
+        Args:
+            message: Error message
+            db_path: Path to the advisory database
+            **kwargs: Additional arguments for SpecKitError
+        """
+        details = kwargs.get("details", {})
+        if db_path:
+            details["db_path"] = str(db_path)
+        kwargs["details"] = details
+        super().__init__(message, **kwargs)
+
+
 # Common error messages with helpers
 def missing_config_file(config_path: Path) -> ConfigError:
     """Create error for missing config file.
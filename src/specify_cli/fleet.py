@@ -0,0 +1,195 @@
+"""Audit many repositories from one process.
+
+Repositories listed in a manifest are scanned one after another on a
+single shared worker pool and a single content-addressed result cache, so
+interpreter start-up and analyzer imports are paid once and a file
+vendored into several repositories is analyzed only once. Each repository
+gets its own report; ``summary.json`` combines them.
+"""
+
+from __future__ import annotations
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from specify_cli.analyzers.registry import discover_plugins
+from specify_cli.api import audit, report_writer
+from specify_cli.config import load_config
+from specify_cli.errors import SpecKitError
+from specify_cli.logging import get_logger
+from specify_cli.runner import WorkerPool
+
+log = get_logger(__name__)
+
+
+class FleetError(SpecKitError):
+    """The fleet manifest could not be read."""
+
+
+def read_manifest(path: Path) -> List[Path]:
+    """Read repository paths, one per line.
+
+    Blank lines and ``#`` comments are ignored; relative paths are resolved
+    against the manifest's directory.
+
+    Raises:
+        FleetError: The manifest cannot be read
+    """
+    path = Path(path)
+    try:
+        lines = path.read_text().splitlines()
+    except OSError as e:
+        raise FleetError(f"Cannot read manifest {path}: {e}") from None
+    repos = []
+    for line in lines:
+        entry = line.split("#", 1)[0].strip()
+        if entry:
+            repo = Path(entry).expanduser()
+            repos.append(repo if repo.is_absolute() else path.parent / repo)
+    return repos
+
+
+@dataclass
+class RepoResult:
+    """Outcome of auditing one repository."""
+
+    name: str
+    path: str
+    exit_code: int = 0
+    code: int = 0
+    dependencies: int = 0
+    severities: Dict[str, int] = field(default_factory=dict)
+    cached: int = 0
+    seconds: float = 0.0
+    report: Optional[str] = None
+    incomplete: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _unique_name(repo: Path, taken: Dict[str, int]) -> str:
+    base = repo.resolve().name or "repo"
+    taken[base] = taken.get(base, 0) + 1
+    return base if taken[base] == 1 else f"{base}-{taken[base]}"
+
+
+def _audit_repo(
+    repo: Path,
+    name: str,
+    out_dir: Path,
+    output: str,
+    workers: WorkerPool,
+    cache_dir: Path,
+    fail_on: Optional[str],
+    use_safety: Optional[bool],
+    timeout: Optional[float],
+) -> RepoResult:
+    result = RepoResult(name=name, path=str(repo))
+    if not repo.is_dir():
+        result.error = "not a directory"
+        result.exit_code = 2
+        return result
+
+    cfg = load_config(repo)
+    assert cfg.analyzers is not None
+    plugins = discover_plugins()
+
+    def _usable(analyzer: str) -> bool:
+        return analyzer in plugins and plugins[analyzer].available()
+
+    audited = audit(
+        repo,
+        cfg,
+        fail_on=fail_on,
+        bandit=cfg.analyzers.bandit and _usable("bandit"),
+        safety=(cfg.analyzers.safety if use_safety is None else use_safety) and _usable("safety"),
+        analyzers=[n for n in cfg.analyzers.plugins or [] if _usable(n)],
+        timeout=timeout,
+        cache_dir=cache_dir,
+        workers=workers,
+        reporters=[report_writer(output, out_dir / name)],
+    )
+
+    for f in audited:
+        sev = str(f.get("severity", "UNKNOWN")).upper()
+        result.severities[sev] = result.severities.get(sev, 0) + 1
+    result.exit_code = audited.exit_code
+    result.code = len(audited.code)
+    result.dependencies = len(audited.dependencies)
+    result.cached = audited.cached
+    result.incomplete = audited.incomplete
+    result.report = str(audited.reports[0])
+    result.seconds = audited.seconds
+    return result
+
+
+def run_fleet(
+    repos: List[Path],
+    out_dir: Path,
+    output: str = "json",
+    fail_on: Optional[str] = None,
+    use_safety: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    on_repo: Optional[Callable[[RepoResult], None]] = None,
+) -> Dict:
+    """Audit every repository and write per-repo reports plus ``summary.json``.
+
+    Each repository's own ``.speckit.toml`` decides excludes, analyzers,
+    baseline use and (unless ``fail_on`` is given) the gate threshold.
+
+    Args:
+        repos: Local checkouts to audit
+        out_dir: Reports go to ``<out_dir>/<repo name>/``
+        output: ``json``, ``sarif`` or ``html``
+        fail_on: Severity threshold overriding each repository's config
+        use_safety: Override each repository's Safety setting
+        max_workers: Size of the shared worker pool
+        cache_dir: Shared result cache (default: ``<out_dir>/cache``)
+        timeout: Per-repository deadline in seconds
+        on_repo: Called with each repository's result as it completes
+
+    Returns:
+        The summary document (also written to ``summary.json``)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = Path(cache_dir) if cache_dir else out_dir / "cache"
+
+    start = time.monotonic()
+    taken: Dict[str, int] = {}
+    results: List[RepoResult] = []
+    workers = WorkerPool(max_workers, processes=True, extra_threads=2)
+    try:
+        for repo in repos:
+            name = _unique_name(repo, taken)
+            try:
+                result = _audit_repo(
+                    repo, name, out_dir, output, workers, cache_dir, fail_on, use_safety, timeout
+                )
+            except Exception as e:  # one broken repository must not stop the fleet
+                log.exception(f"Audit of {repo} failed")
+                result = RepoResult(name=name, path=str(repo), exit_code=2, error=str(e))
+            results.append(result)
+            if on_repo is not None:
+                on_repo(result)
+    finally:
+        workers.close()
+
+    summary = {
+        "repositories": [asdict(r) for r in results],
+        "totals": {
+            "repositories": len(results),
+            "failed_gate": sum(1 for r in results if r.exit_code == 1),
+            "errors": sum(1 for r in results if r.error),
+            "code": sum(r.code for r in results),
+            "dependencies": sum(r.dependencies for r in results),
+            "cached_files": sum(r.cached for r in results),
+            "seconds": round(time.monotonic() - start, 3),
+        },
+        "exit_code": max((r.exit_code for r in results), default=0),
+    }
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
@@ -1,10 +1,12 @@
 """Git utilities for changed file detection."""
 
 from __future__ import annotations
+import os
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
+from .errors import GitError, not_a_git_repo
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -117,3 +119,121 @@ def changed_python_files(repo_root: Path) -> List[Path]:
         pass
 
     return []
+
+
+def repo_toplevel(path: Path) -> Path:
+    """Return the top-level directory of the work tree containing ``path``.
+
+    Raises:
+        GitError: ``path`` is not inside a git work tree
+    """
+    res = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        cwd=str(path),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if res.returncode != 0:
+        raise not_a_git_repo(Path(path))
+    return Path(res.stdout.strip())
+
+
+def staged_python_files(repo_root: Path) -> List[str]:
+    """List Python files added, copied, modified or renamed in the index.
+
+    Args:
+        repo_root: Top-level directory of the work tree
+
+    Returns:
+        Paths relative to ``repo_root``, in git's (sorted) order
+
+    Raises:
+        GitError: The index could not be read
+    """
+    cmd = ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR"]
+    res = subprocess.run(cmd, cwd=str(repo_root), capture_output=True, check=False)
+    if res.returncode != 0:
+        raise GitError(
+            res.stderr.decode(errors="replace").strip() or "git diff --cached failed",
+            command=" ".join(cmd),
+        )
+    # -z output is NUL-terminated and never quoted
+    names = [os.fsdecode(n) for n in res.stdout.split(b"\0") if n]
+    return [n for n in names if n.endswith(".py")]
+
+
+def iter_staged_blobs(repo_root: Path, paths: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    """Stream staged file contents through a single ``git cat-file --batch``.
+
+    Objects are requested as ``:<path>`` (the index entry), one at a time,
+    so only one blob is buffered regardless of how many files are staged.
+
+    Args:
+        repo_root: Top-level directory of the work tree
+        paths: Paths relative to ``repo_root``
+
+    Yields:
+        ``(path, content)`` for every path present in the index
+
+    Raises:
+        GitError: ``git cat-file`` could not be started or stopped responding
+    """
+    try:
+        proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=str(repo_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        raise GitError(f"Could not start git cat-file: {e}", command="git cat-file --batch")
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for path in paths:
+            if "\n" in path:
+                # cat-file --batch reads one object name per line
+                logger.warning(f"Skipping staged file with newline in its name: {path!r}")
+                continue
+            proc.stdin.write(b":" + os.fsencode(path) + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                raise GitError("git cat-file exited early", command="git cat-file --batch")
+            parts = header.split()
+            if len(parts) < 3 or parts[1] != b"blob":
+                logger.debug(f"Not a staged blob: {path} ({header.strip()!r})")
+                continue
+            size = int(parts[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing LF after the object
+            yield path, data
+    finally:
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait()
+
+
+def uncommitted_files(path: Path) -> List[str]:
+    """List files that differ from ``HEAD`` or are untracked.
+
+    Args:
+        path: Directory inside the work tree
+
+    Returns:
+        Paths relative to ``path`` (empty outside a git repository)
+    """
+    out: List[str] = []
+    for cmd in (
+        ["git", "diff", "--name-only", "--relative", "-z", "HEAD"],
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+    ):
+        try:
+            res = subprocess.run(cmd, cwd=str(path), capture_output=True, check=False)
+        except (OSError, subprocess.SubprocessError):
+            return []
+        if res.returncode != 0:
+            return []
+        out.extend(os.fsdecode(n) for n in res.stdout.split(b"\0") if n)
+    return out
@@ -0,0 +1,180 @@
+"""Import-reachability index for ranking dependency findings.
+
+Builds a per-file index of imported top-level modules from module ASTs,
+cached by content hash so unchanged files are never re-parsed, and maps
+those modules to distribution names via ``importlib.metadata``.
+"""
+
+from __future__ import annotations
+import ast
+import hashlib
+import json
+import re
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+INDEX_PATH = Path(".speckit/cache/imports.json")
+INDEX_VERSION = 1
+
+
+def normalize_dist(name: str) -> str:
+    """Normalize a distribution name per PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def extract_imports(source: bytes) -> Set[str]:
+    """Return top-level module names imported by a module.
+
+    Relative imports are ignored since they never refer to a distribution.
+
+    Args:
+        source: Raw module source
+
+    Returns:
+        Set of top-level module names (empty if the source does not parse)
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return set()
+
+    mods: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                mods.add(alias.name.split(".", 1)[0])
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            mods.add(node.module.split(".", 1)[0])
+    return mods
+
+
+class ImportIndex:
+    """Incremental index of imports across a project's Python files."""
+
+    def __init__(self, root: Path, cache_path: Path | None = None):
+        """Initialize index, loading any cached entries.
+
+        Args:
+            root: Project root; cache keys are paths relative to it
+            cache_path: Index cache file (defaults to ``<root>/.speckit/cache/imports.json``)
+        """
+        self.root = Path(root)
+        self.cache_path = cache_path or (self.root / INDEX_PATH)
+        self.entries: Dict[str, Dict] = {}
+        self.parsed = 0
+        self.reused = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            # Corrupt cache is rebuilt from scratch
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = data.get("files", {})
+
+    def _rel(self, p: Path) -> str:
+        try:
+            return str(Path(p).relative_to(self.root))
+        except ValueError:
+            return str(p)
+
+    def update(self, files: Iterable[Path], prune: bool = True) -> None:
+        """Refresh the index for the given files.
+
+        Only files whose content hash changed are re-parsed.
+
+        Args:
+            files: Python files in scope
+            prune: Drop cached entries for files not in ``files``
+        """
+        seen: Set[str] = set()
+        for p in files:
+            try:
+                data = Path(p).read_bytes()
+            except OSError:
+                continue
+            rel = self._rel(p)
+            seen.add(rel)
+            self.add_source(rel, data)
+
+        if prune:
+            self.prune(seen)
+
+    def prune(self, keep: Set[str]) -> None:
+        """Drop cached entries for files not in ``keep``."""
+        for rel in set(self.entries) - keep:
+            del self.entries[rel]
+
+    def add_source(self, rel: str, data: bytes) -> None:
+        """Index one module from its source bytes.
+
+        Args:
+            rel: Path relative to the project root
+            data: Module source
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.entries.get(rel)
+        if entry and entry.get("hash") == digest:
+            self.reused += 1
+            return
+        self.entries[rel] = {"hash": digest, "modules": sorted(extract_imports(data))}
+        self.parsed += 1
+
+    def save(self) -> Path:
+        """Persist the index cache."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps({"version": INDEX_VERSION, "files": self.entries}))
+        return self.cache_path
+
+    def modules(self) -> Set[str]:
+        """Return all top-level modules imported anywhere in the project."""
+        out: Set[str] = set()
+        for entry in self.entries.values():
+            out.update(entry.get("modules", []))
+        return out
+
+    def imported_distributions(self) -> Set[str]:
+        """Return normalized names of distributions reachable via imports.
+
+        Module names are mapped through the installed distributions' top-level
+        data. Module names are also kept as-is so packages that are not
+        installed in the scanning environment still match by name.
+        """
+        mods = self.modules()
+        try:
+            mapping: Dict[str, List[str]] = metadata.packages_distributions()
+        except Exception as e:  # pragma: no cover - broken metadata in env
+            log.warning(f"Could not read distribution metadata: {e}")
+            mapping = {}
+
+        dists = {normalize_dist(m) for m in mods}
+        for m in mods:
+            for dist in mapping.get(m, []):
+                dists.add(normalize_dist(dist))
+        return dists
+
+
+def tag_reachability(findings: List[dict], index: ImportIndex) -> List[dict]:
+    """Tag dependency findings as imported or not and rank imported first.
+
+    Args:
+        findings: Dependency finding dictionaries (SafetyFinding shape)
+        index: Up-to-date import index
+
+    Returns:
+        Findings with ``imported`` set, imported packages first
+    """
+    dists = index.imported_distributions()
+    for f in findings:
+        f["imported"] = normalize_dist(str(f.get("package", ""))) in dists
+    # Stable sort keeps the analyzer's order within each group
+    return sorted(findings, key=lambda f: not f["imported"])
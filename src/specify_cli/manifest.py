@@ -0,0 +1,131 @@
+"""Dependency manifest parsing and patching for offline dependency scanning."""
+
+from __future__ import annotations
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import tomllib  # py311+
+except ModuleNotFoundError:
+    import tomli as tomllib  # type: ignore
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+# name[extras]==version ; markers  # comment
+_PIN_RE = re.compile(
+    r"^\s*(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*===?\s*(?P<version>[^\s;#,]+)"
+)
+
+
+# Manifests in the order SafetyAnalyzer prefers them
+MANIFEST_CANDIDATES = (
+    "requirements.txt",
+    "requirements-dev.txt",
+    "requirements.in",
+    "poetry.lock",
+    "Pipfile.lock",
+    "pyproject.toml",
+)
+
+
+def find_manifest(root: Path) -> Optional[Path]:
+    """Return the preferred dependency manifest under ``root``, if any."""
+    for name in MANIFEST_CANDIDATES:
+        p = Path(root) / name
+        if p.exists():
+            return p
+    return None
+
+
+def is_requirements_file(path: Path) -> bool:
+    """True for requirements-style manifests that can be patched line by line."""
+    return path.name not in ("poetry.lock", "Pipfile.lock", "pyproject.toml")
+
+
+@dataclass
+class Pin:
+    """A dependency pinned to an exact version."""
+
+    name: str
+    version: str
+    line: Optional[int] = None  # 1-based line in requirements-style manifests
+
+
+def parse_requirements(text: str) -> List[Pin]:
+    """Parse exact ``==`` pins from requirements-style text.
+
+    Unpinned, editable, URL and option lines are skipped since they cannot be
+    matched against advisories without resolution.
+
+    Args:
+        text: requirements.txt / requirements.in content
+
+    Returns:
+        List of pins in file order
+    """
+    pins: List[Pin] = []
+    for i, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith(("#", "-")):
+            continue
+        m = _PIN_RE.match(line)
+        if m:
+            pins.append(Pin(m.group("name"), m.group("version"), i))
+    return pins
+
+
+def parse_manifest(path: Path) -> List[Pin]:
+    """Parse pins from a supported manifest.
+
+    Supports requirements files, ``poetry.lock`` and ``Pipfile.lock``.
+    ``pyproject.toml`` only declares ranges and yields no pins.
+
+    Args:
+        path: Manifest path
+
+    Returns:
+        List of pins
+    """
+    name = path.name
+    if name == "poetry.lock":
+        data = tomllib.loads(path.read_text())
+        return [Pin(p["name"], str(p["version"])) for p in data.get("package", [])]
+    if name == "Pipfile.lock":
+        data = json.loads(path.read_text())
+        pins = []
+        for section in ("default", "develop"):
+            for pkg, meta in (data.get(section) or {}).items():
+                version = str(meta.get("version", "")).lstrip("=")
+                if version:
+                    pins.append(Pin(pkg, version))
+        return pins
+    if name == "pyproject.toml":
+        log.warning("pyproject.toml declares ranges only; no pins to check offline")
+        return []
+    return parse_requirements(path.read_text())
+
+
+def patch_requirements(text: str, bumps: Dict[int, str]) -> str:
+    """Rewrite pinned versions on the given lines, leaving everything else intact.
+
+    Args:
+        text: requirements-style content
+        bumps: Mapping of 1-based line number to new version
+
+    Returns:
+        Patched content
+    """
+    lines = text.splitlines(keepends=True)
+    for lineno, version in bumps.items():
+        raw = lines[lineno - 1]
+        m = _PIN_RE.match(raw)
+        if not m:
+            continue
+        start, end = m.span("version")
+        lines[lineno - 1] = raw[:start] + version + raw[end:]
+    return "".join(lines)
@@ -0,0 +1,234 @@
+"""Staged pipeline with bounded queues.
+
+Each stage runs on its own thread and is connected to the next by a
+bounded queue, so a slow stage blocks its producers (backpressure) and the
+number of items in flight is capped by the queue depth. Stages are plain
+callables mapping one input item to zero or more output items; the final
+queue is drained by the caller, which keeps sinks on the calling thread.
+"""
+
+from __future__ import annotations
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+# How often blocked stages re-check for cancellation
+_POLL = 0.05
+_END = object()
+
+StageFn = Callable[[Any], Iterable[Any]]
+FlushFn = Callable[[], Iterable[Any]]
+
+
+class Cancelled(Exception):
+    """Raised inside a stage when the pipeline has been stopped."""
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one stage."""
+
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    busy: float = 0.0  # seconds spent working, excluding time blocked on queues
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per busy second."""
+        n = self.items_in or self.items_out
+        return n / self.busy if self.busy > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "busy_seconds": round(self.busy, 4),
+            "items_per_second": round(self.throughput, 1),
+        }
+
+
+class Pipeline:
+    """A linear chain of stages fed by a source iterable.
+
+    Example:
+        >>> pipe = Pipeline(maxsize=8)
+        >>> pipe.source("numbers", range(3))
+        >>> pipe.stage("double", lambda n: [n * 2])
+        >>> list(pipe.run())
+        [0, 2, 4]
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """Initialize an empty pipeline.
+
+        Args:
+            maxsize: Depth of each inter-stage queue
+        """
+        self.maxsize = max(1, maxsize)
+        self.stop = threading.Event()
+        self.stats: Dict[str, StageStats] = {}
+        self.completed = False
+        self.timed_out = False
+        self._source: Optional[Tuple[str, Iterable[Any]]] = None
+        self._stages: List[Tuple[str, StageFn, Optional[FlushFn]]] = []
+        self._errors: List[BaseException] = []
+
+    def source(self, name: str, items: Iterable[Any]) -> None:
+        """Set the iterable feeding the first stage."""
+        self._source = (name, items)
+        self.stats[name] = StageStats(name)
+
+    def stage(self, name: str, fn: StageFn, flush: Optional[FlushFn] = None) -> None:
+        """Append a stage.
+
+        Args:
+            name: Stage name used for counters
+            fn: Maps one input item to an iterable of output items
+            flush: Called once at end of input to emit any buffered items
+        """
+        self._stages.append((name, fn, flush))
+        self.stats[name] = StageStats(name)
+
+    # Blocking helpers that give up once the pipeline is stopped
+
+    def put(self, q: queue.Queue, item: Any) -> None:
+        while not self.stop.is_set():
+            try:
+                q.put(item, timeout=_POLL)
+                return
+            except queue.Full:
+                continue
+        raise Cancelled
+
+    def get(self, q: queue.Queue) -> Any:
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=_POLL)
+            except queue.Empty:
+                continue
+        raise Cancelled
+
+    def result(self, fut: Future) -> Any:
+        """Wait for a future from inside a stage, honouring cancellation."""
+        while not self.stop.is_set():
+            done, _ = wait([fut], timeout=_POLL)
+            if done:
+                return fut.result()
+        raise Cancelled
+
+    def _emit(self, stats: StageStats, outputs: Iterable[Any], outq: queue.Queue) -> None:
+        it = iter(outputs)
+        t = time.monotonic()
+        for out in it:
+            stats.busy += time.monotonic() - t
+            stats.items_out += 1
+            self.put(outq, out)
+            t = time.monotonic()
+        stats.busy += time.monotonic() - t
+
+    def _run_source(self, name: str, items: Iterable[Any], outq: queue.Queue) -> None:
+        try:
+            self._emit(self.stats[name], items, outq)
+            self.put(outq, _END)
+        except Cancelled:
+            pass
+        except BaseException as e:
+            self._fail(e)
+
+    def _run_stage(
+        self,
+        name: str,
+        fn: StageFn,
+        flush: Optional[FlushFn],
+        inq: queue.Queue,
+        outq: queue.Queue,
+    ) -> None:
+        stats = self.stats[name]
+        try:
+            while True:
+                item = self.get(inq)
+                if item is _END:
+                    break
+                stats.items_in += 1
+                self._emit(stats, fn(item), outq)
+            if flush is not None:
+                self._emit(stats, flush(), outq)
+            self.put(outq, _END)
+        except Cancelled:
+            pass
+        except BaseException as e:
+            self._fail(e)
+
+    def _fail(self, e: BaseException) -> None:
+        self._errors.append(e)
+        self.stop.set()
+
+    def run(self, deadline: Optional[float] = None) -> Iterator[Any]:
+        """Start all stages and yield items leaving the last one.
+
+        Stops early (setting ``timed_out``) when the ``time.monotonic()``
+        deadline passes; the first stage error is re-raised here.
+
+        Args:
+            deadline: Absolute monotonic deadline, or None
+
+        Yields:
+            Output items of the final stage
+        """
+        if self._source is None:
+            raise ValueError("pipeline has no source")
+        queues: List[queue.Queue] = [
+            queue.Queue(maxsize=self.maxsize) for _ in range(len(self._stages) + 1)
+        ]
+        threads = [
+            threading.Thread(
+                target=self._run_source,
+                args=(*self._source, queues[0]),
+                name=f"speckit-{self._source[0]}",
+                daemon=True,
+            )
+        ]
+        for i, (name, fn, flush) in enumerate(self._stages):
+            threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(name, fn, flush, queues[i], queues[i + 1]),
+                    name=f"speckit-{name}",
+                    daemon=True,
+                )
+            )
+        for t in threads:
+            t.start()
+
+        last = queues[-1]
+        try:
+            while True:
+                timeout = _POLL
+                if deadline is not None:
+                    timeout = min(timeout, max(0.0, deadline - time.monotonic()))
+                try:
+                    item = last.get(timeout=timeout)
+                except queue.Empty:
+                    if self._errors:
+                        raise self._errors[0]
+                    if deadline is not None and time.monotonic() >= deadline:
+                        self.timed_out = True
+                        return
+                    continue
+                if item is _END:
+                    self.completed = True
+                    return
+                yield item
+        finally:
+            self.stop.set()
+            for t in threads:
+                # Stages poll the stop flag; one stuck in a long call is a daemon
+                t.join(timeout=_POLL * 2)
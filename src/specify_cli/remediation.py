@@ -0,0 +1,93 @@
+"""Batch remediation planning from the offline advisory index.
+
+For every vulnerable pin, computes the lowest version above the current one
+that no known advisory for the package covers. All packages are solved in
+one pass over their indexed advisory ranges, without re-running a scanner.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from packaging.specifiers import SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+from specify_cli.advisories import Advisory, AdvisoryStore
+from specify_cli.import_index import normalize_dist
+from specify_cli.manifest import Pin
+
+
+@dataclass
+class Upgrade:
+    """Planned version bump for one vulnerable pin."""
+
+    package: str
+    current: str
+    target: Optional[str]  # None when no known version clears every advisory
+    advisories: List[str] = field(default_factory=list)
+    line: Optional[int] = None
+
+
+def _candidates(advisories: List[Advisory]) -> Set[Version]:
+    """Versions at which a vulnerable range ends: fix versions and ``<X`` bounds."""
+    out: Set[Version] = set()
+    for adv in advisories:
+        raw = [adv.fix_version] if adv.fix_version else []
+        for spec in adv.vulnerable_specs:
+            raw.extend(s.version for s in SpecifierSet(spec) if s.operator == "<")
+        for r in raw:
+            try:
+                out.add(Version(r))
+            except InvalidVersion:
+                continue
+    return out
+
+
+def lowest_safe_version(current: str, advisories: List[Advisory]) -> Optional[str]:
+    """Return the lowest version above ``current`` outside every advisory range.
+
+    Args:
+        current: Currently pinned version
+        advisories: All advisories for the package (not just matching ones,
+            so a bump never lands inside another advisory's range)
+
+    Returns:
+        Version string, or None if no candidate clears all advisories
+    """
+    try:
+        cur = Version(current)
+    except InvalidVersion:
+        return None
+    for cand in sorted(v for v in _candidates(advisories) if v > cur):
+        if not any(adv.affects(str(cand)) for adv in advisories):
+            return str(cand)
+    return None
+
+
+def plan_upgrades(pins: List[Pin], store: AdvisoryStore) -> List[Upgrade]:
+    """Compute the minimal bump for every vulnerable pin.
+
+    Args:
+        pins: Pinned dependencies from a manifest
+        store: Offline advisory store
+
+    Returns:
+        One Upgrade per vulnerable pin, in manifest order
+    """
+    index = store.advisories_by_package(p.name for p in pins)
+    plan: List[Upgrade] = []
+    for pin in pins:
+        advisories = index.get(normalize_dist(pin.name), [])
+        matching = [a.advisory_id for a in advisories if a.affects(pin.version)]
+        if not matching:
+            continue
+        plan.append(
+            Upgrade(
+                package=pin.name,
+                current=pin.version,
+                target=lowest_safe_version(pin.version, advisories),
+                advisories=matching,
+                line=pin.line,
+            )
+        )
+    return plan
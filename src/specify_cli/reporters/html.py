@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Dict
+from typing import Collection, Dict, Optional
 import html as _html
 
 
@@ -11,51 +11,73 @@ def _e(v) -> str:
     return _html.escape("" if v is None else str(v), quote=True)
 
 
-def write_html(code_findings: List[Dict], dep_findings: List[Dict], out_path: Path) -> Path:
-    """Generate HTML report from findings."""
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+def _imported(v) -> str:
+    """Render import-reachability tag."""
+    if v is None:
+        return "unknown"
+    return "imported" if v else "not imported"
+
+
+def _row_code(f: Dict) -> str:
+    return (
+        "<tr>"
+        f"<td>{_e(f.get('rule_id'))}</td>"
+        f"<td>{_e(f.get('severity'))}</td>"
+        f"<td>{_e(f.get('file_path'))}:{_e(f.get('line'))}</td>"
+        f"<td>{_e(f.get('message'))}</td>"
+        f"<td>{_e(f.get('cwe'))}</td>"
+        "</tr>"
+    )
+
 
-    def _rows_code() -> str:
-        rows = []
-        for f in code_findings:
-            rows.append(
-                "<tr>"
-                f"<td>{_e(f.get('rule_id'))}</td>"
-                f"<td>{_e(f.get('severity'))}</td>"
-                f"<td>{_e(f.get('file_path'))}:{_e(f.get('line'))}</td>"
-                f"<td>{_e(f.get('message'))}</td>"
-                f"<td>{_e(f.get('cwe'))}</td>"
-                "</tr>"
-            )
-        return "".join(rows)
-
-    def _rows_deps() -> str:
-        rows = []
-        for v in dep_findings:
-            rows.append(
-                "<tr>"
-                f"<td>{_e(v.get('package'))}</td>"
-                f"<td>{_e(v.get('installed_version'))}</td>"
-                f"<td>{_e(v.get('advisory_id') or v.get('cve'))}</td>"
-                f"<td>{_e(v.get('severity'))}</td>"
-                f"<td>{_e(v.get('fix_version') or 'N/A')}</td>"
-                "</tr>"
-            )
-        return "".join(rows)
-
-    html_doc = f"""<!doctype html>
+def _row_dep(v: Dict) -> str:
+    return (
+        "<tr>"
+        f"<td>{_e(v.get('package'))}</td>"
+        f"<td>{_e(v.get('installed_version'))}</td>"
+        f"<td>{_e(v.get('advisory_id') or v.get('cve'))}</td>"
+        f"<td>{_e(v.get('severity'))}</td>"
+        f"<td>{_e(v.get('fix_version') or 'N/A')}</td>"
+        f"<td>{_e(_imported(v.get('imported')))}</td>"
+        "</tr>"
+    )
+
+
+def write_html(
+    code_findings: Collection[Dict],
+    dep_findings: Collection[Dict],
+    out_path: Path,
+    notice: Optional[str] = None,
+) -> Path:
+    """Generate HTML report from findings (``notice`` is shown under the title).
+
+    Rows are written as they are read, so findings may be a ``SpillList``.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w") as fh:
+        fh.write(
+            f"""<!doctype html>
 <html><head><meta charset="utf-8"><title>SpecKit Report</title>
 <style>body{{font-family:system-ui,Arial}} table{{border-collapse:collapse;width:100%}} td,th{{border:1px solid #ccc;padding:6px}}</style>
 </head><body>
 <h1>SpecKit Security Report</h1>
+{f'<p><strong>{_e(notice)}</strong></p>' if notice else ''}
 <h2>Code issues</h2>
 <p>Total: {_e(len(code_findings))}</p>
 <table><thead><tr><th>Rule</th><th>Severity</th><th>Location</th><th>Message</th><th>CWE</th></tr></thead>
-<tbody>{_rows_code()}</tbody></table>
+<tbody>"""
+        )
+        fh.writelines(_row_code(f) for f in code_findings)
+        fh.write(
+            f"""</tbody></table>
 <h2>Dependency CVEs</h2>
 <p>Total: {_e(len(dep_findings))}</p>
-<table><thead><tr><th>Package</th><th>Installed</th><th>Advisory or CVE</th><th>Severity</th><th>Fix</th></tr></thead>
-<tbody>{_rows_deps()}</tbody></table>
+<table><thead><tr><th>Package</th><th>Installed</th><th>Advisory or CVE</th><th>Severity</th><th>Fix</th><th>Imported</th></tr></thead>
+<tbody>"""
+        )
+        fh.writelines(_row_dep(v) for v in dep_findings)
+        fh.write(
+            """</tbody></table>
 </body></html>"""
-    out_path.write_text(html_doc)
+        )
     return out_path
@@ -1,10 +1,12 @@
 """Combined SARIF reporter for Bandit + Safety findings."""
 
 from __future__ import annotations
-import json
-import hashlib
+import itertools
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+from specify_cli.baseline import finding_fingerprint
+from specify_cli.spill import dump_json
 
 
 def _level(sev: str) -> str:
@@ -16,10 +18,6 @@ def _level(sev: str) -> str:
     return "note"
 
 
-def _fp(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()[:16]
-
-
 def _best_dep_artifact(repo_root: Path, hint: Optional[str]) -> Optional[str]:
     if hint:
         p = repo_root / hint
@@ -37,6 +35,86 @@ def _best_dep_artifact(repo_root: Path, hint: Optional[str]) -> Optional[str]:
     return None
 
 
+def _code_rule(f: dict) -> Dict:
+    rid = f["rule_id"]
+    rule = {
+        "id": rid,
+        "shortDescription": {"text": f"Bandit {rid}"},
+        "defaultConfiguration": {"level": _level(f.get("severity", ""))},
+        "properties": {
+            "tags": ["security", "code"],
+            "precision": f.get("confidence", "MEDIUM"),
+        },
+    }
+    if f.get("cwe"):
+        rule["properties"]["cwe"] = f"CWE-{f['cwe']}"
+    return rule
+
+
+def _code_result(f: dict, root: Path) -> Dict:
+    rid = f["rule_id"]
+    rel = str(Path(f["file_path"]).resolve().relative_to(root))
+    return {
+        "ruleId": rid,
+        "level": _level(f.get("severity", "")),
+        "message": {"text": f.get("message", "")},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": rel},
+                    "region": {"startLine": int(f.get("line", 1))},
+                }
+            }
+        ],
+        # Root-relative, so alerts keep their identity across checkout directories
+        "fingerprints": {"primaryLocationLineHash": finding_fingerprint(f, root)},
+    }
+
+
+def _dep_rule(v: dict) -> Dict:
+    rule = {
+        "id": f"SAFETY-{v.get('advisory_id','UNKNOWN')}",
+        "shortDescription": {
+            "text": f"Dependency vulnerability {v.get('advisory_id','') or v.get('cve','')}"
+        },
+        "defaultConfiguration": {"level": _level(v.get("severity", ""))},
+        "properties": {"tags": ["security", "dependency"]},
+    }
+    if v.get("cve"):
+        rule["properties"]["cve"] = v["cve"]
+    return rule
+
+
+def _dep_result(v: dict, dep_art: Optional[str]) -> Dict:
+    msg = f"{v.get('package','')} {v.get('installed_version','')} vulnerable. Spec: {v.get('vulnerable_spec','')}. Fix: {v.get('fix_version','') or 'N/A'}"
+    locs = []
+    if dep_art:
+        locs = [{"physicalLocation": {"artifactLocation": {"uri": dep_art}}}]
+    result = {
+        "ruleId": f"SAFETY-{v.get('advisory_id','UNKNOWN')}",
+        "level": _level(v.get("severity", "")),
+        "message": {"text": msg},
+        "locations": locs,
+        "fingerprints": {"primaryLocationLineHash": finding_fingerprint(v)},
+    }
+    if v.get("imported") is not None:
+        result["properties"] = {"imported": bool(v["imported"])}
+    return result
+
+
+def _document(rules: Dict[str, Dict], results: Iterable[Dict]) -> Dict:
+    return {
+        "version": "2.1.0",
+        "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
+        "runs": [
+            {
+                "tool": {"driver": {"name": "SpecKit Combined", "rules": list(rules.values())}},
+                "results": results,
+            }
+        ],
+    }
+
+
 def combine_to_sarif(
     bandit_findings: List[dict],
     safety_findings: List[dict],
@@ -49,83 +127,50 @@ def combine_to_sarif(
 
     # Bandit
     for f in bandit_findings:
-        rid = f["rule_id"]
-        if rid not in rules:
-            rule = {
-                "id": rid,
-                "shortDescription": {"text": f"Bandit {rid}"},
-                "defaultConfiguration": {"level": _level(f.get("severity", ""))},
-                "properties": {
-                    "tags": ["security", "code"],
-                    "precision": f.get("confidence", "MEDIUM"),
-                },
-            }
-            if f.get("cwe"):
-                rule["properties"]["cwe"] = f"CWE-{f['cwe']}"
-            rules[rid] = rule
-        rel = str(Path(f["file_path"]).resolve().relative_to(root))
-        results.append(
-            {
-                "ruleId": rid,
-                "level": _level(f.get("severity", "")),
-                "message": {"text": f.get("message", "")},
-                "locations": [
-                    {
-                        "physicalLocation": {
-                            "artifactLocation": {"uri": rel},
-                            "region": {"startLine": int(f.get("line", 1))},
-                        }
-                    }
-                ],
-                "fingerprints": {"primaryLocationLineHash": _fp(f"{rel}:{f.get('line',1)}:{rid}")},
-            }
-        )
+        if f["rule_id"] not in rules:
+            rules[f["rule_id"]] = _code_rule(f)
+        results.append(_code_result(f, root))
 
     # Safety
     dep_art = _best_dep_artifact(repo_root, dep_artifact_hint)
     for v in safety_findings:
-        rid = f"SAFETY-{v.get('advisory_id','UNKNOWN')}"
-        if rid not in rules:
-            rule = {
-                "id": rid,
-                "shortDescription": {
-                    "text": f"Dependency vulnerability {v.get('advisory_id','') or v.get('cve','')}"
-                },
-                "defaultConfiguration": {"level": _level(v.get("severity", ""))},
-                "properties": {"tags": ["security", "dependency"]},
-            }
-            if v.get("cve"):
-                rule["properties"]["cve"] = v["cve"]
-            rules[rid] = rule
-
-        msg = f"{v.get('package','')} {v.get('installed_version','')} vulnerable. Spec: {v.get('vulnerable_spec','')}. Fix: {v.get('fix_version','') or 'N/A'}"
-        fp_src = f"{v.get('package','')}:{v.get('installed_version','')}:{v.get('advisory_id','')}"
-        locs = []
-        if dep_art:
-            locs = [{"physicalLocation": {"artifactLocation": {"uri": dep_art}}}]
-        results.append(
-            {
-                "ruleId": rid,
-                "level": _level(v.get("severity", "")),
-                "message": {"text": msg},
-                "locations": locs,
-                "fingerprints": {"primaryLocationLineHash": _fp(fp_src)},
-            }
-        )
+        rule = _dep_rule(v)
+        rules.setdefault(rule["id"], rule)
+        results.append(_dep_result(v, dep_art))
 
-    return {
-        "version": "2.1.0",
-        "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-        "runs": [
-            {
-                "tool": {"driver": {"name": "SpecKit Combined", "rules": list(rules.values())}},
-                "results": results,
-            }
-        ],
-    }
+    return _document(rules, results)
+
+
+def stream_sarif(
+    bandit_findings: Iterable[dict],
+    safety_findings: Iterable[dict],
+    repo_root: Path,
+    dep_artifact_hint: Optional[str] = None,
+) -> Dict:
+    """``combine_to_sarif`` with results generated lazily.
+
+    Findings are read twice, once for the rules and once for the results,
+    so they can be ``SpillList``s; the document can be written once, by
+    ``write_sarif``.
+    """
+    rules: Dict[str, Dict] = {}
+    for f in bandit_findings:
+        if f["rule_id"] not in rules:
+            rules[f["rule_id"]] = _code_rule(f)
+    for v in safety_findings:
+        rule = _dep_rule(v)
+        rules.setdefault(rule["id"], rule)
+    root = repo_root.resolve()
+    dep_art = _best_dep_artifact(repo_root, dep_artifact_hint)
+    results = itertools.chain(
+        (_code_result(f, root) for f in bandit_findings),
+        (_dep_result(v, dep_art) for v in safety_findings),
+    )
+    return _document(rules, results)
 
 
 def write_sarif(doc: Dict, out_path: Path) -> Path:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(doc, indent=2))
+    with open(out_path, "w", encoding="utf-8") as fh:
+        dump_json(doc, fh)
     return out_path
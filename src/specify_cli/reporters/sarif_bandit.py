@@ -2,21 +2,10 @@
 
 from __future__ import annotations
 import json
-import hashlib
 from pathlib import Path
 from typing import Dict, List
 
-
-def _hash(s: str) -> str:
-    """Generate short hash for fingerprinting.
-
-    Args:
-        s: String to hash
-
-    Returns:
-        First 16 chars of SHA256 hash
-    """
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()[:16]
+from specify_cli.baseline import finding_fingerprint
 
 
 def bandit_findings_to_sarif(findings: List[Dict], repo_root: Path) -> Dict:
@@ -45,10 +34,9 @@ def bandit_findings_to_sarif(findings: List[Dict], repo_root: Path) -> Dict:
             if f.get("cwe"):
                 rules[rule_id]["properties"]["cwe"] = f"CWE-{f['cwe']}"
 
+        rel = str(Path(f["file_path"]).resolve().relative_to(repo_root.resolve()))
         phys_loc = {
-            "artifactLocation": {
-                "uri": str(Path(f["file_path"]).resolve().relative_to(repo_root.resolve()))
-            },
+            "artifactLocation": {"uri": rel},
             "region": {"startLine": int(f["line"])},
         }
 
@@ -58,9 +46,7 @@ def bandit_findings_to_sarif(findings: List[Dict], repo_root: Path) -> Dict:
                 "level": _map_level(f["severity"]),
                 "message": {"text": f["message"]},
                 "locations": [{"physicalLocation": phys_loc}],
-                "fingerprints": {
-                    "primaryLocationLineHash": _hash(f"{f['file_path']}:{f['line']}:{rule_id}")
-                },
+                "fingerprints": {"primaryLocationLineHash": finding_fingerprint(f, repo_root)},
             }
         )
 
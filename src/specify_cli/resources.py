@@ -0,0 +1,171 @@
+"""Container-aware sizing of the analysis worker pool.
+
+``os.cpu_count()`` reports the host's cores even inside a container whose
+cgroup allows a fraction of them. ``auto_workers`` instead takes the
+smallest of:
+
+- the CPUs this process may run on (``sched_getaffinity``),
+- the cgroup CPU quota (v2 ``cpu.max``, v1 ``cpu.cfs_quota_us`` /
+  ``cpu.cfs_period_us``), rounded up,
+- the memory limit (cgroup ``memory.max`` / ``memory.limit_in_bytes``, or
+  physical memory) left after this process, divided by the per-worker
+  footprint.
+
+The footprint is measured: after a run with worker processes, the peak RSS
+of the reaped workers is saved to ``workers.json`` in the run's history
+directory and used by the next ``auto`` run.
+"""
+
+from __future__ import annotations
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Union
+
+from specify_cli.errors import ConfigError
+from specify_cli.logging import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+log = get_logger(__name__)
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_CGROUP = Path("/proc/self/cgroup")
+FOOTPRINT_FILE = "workers.json"
+DEFAULT_FOOTPRINT = 256 * 1024 * 1024  # bytes per worker until one has been measured
+_UNLIMITED = 1 << 60  # cgroup v1 reports "no limit" as a huge page-aligned number
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _cgroup_dirs(controller: str, root: Path, proc: Path) -> List[Path]:
+    """Directories that may hold a controller's files, most specific first."""
+    dirs: List[Path] = []
+    for line in (_read(proc) or "").splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        _, controllers, rel = parts
+        rel = rel.lstrip("/")
+        if not controllers:  # v2 unified hierarchy
+            dirs += [root / rel, root]
+        elif controller in controllers.split(","):
+            for mount in (root / controllers, root / controller):
+                dirs += [mount / rel, mount]
+    dirs += [root, root / controller]
+    return list(dict.fromkeys(dirs))
+
+
+def cpu_quota(root: Path = CGROUP_ROOT, proc: Path = PROC_CGROUP) -> Optional[float]:
+    """CPUs allowed by the cgroup quota, or None when unlimited or unknown."""
+    for d in _cgroup_dirs("cpu", root, proc):
+        v2 = _read(d / "cpu.max")
+        if v2 is not None:
+            quota, _, period = v2.partition(" ")
+            if quota == "max":
+                return None
+            return int(quota) / int(period or 100000)
+        quota_us = _read(d / "cpu.cfs_quota_us")
+        period_us = _read(d / "cpu.cfs_period_us")
+        if quota_us is not None and period_us is not None:
+            return None if int(quota_us) <= 0 else int(quota_us) / int(period_us)
+    return None
+
+
+def memory_limit(root: Path = CGROUP_ROOT, proc: Path = PROC_CGROUP) -> Optional[int]:
+    """Memory limit in bytes: the cgroup's, else physical memory, else None."""
+    for d in _cgroup_dirs("memory", root, proc):
+        value = _read(d / "memory.max") or _read(d / "memory.limit_in_bytes")
+        if value is not None:
+            if value == "max" or int(value) >= _UNLIMITED:
+                break
+            return int(value)
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may be scheduled on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _maxrss(children: bool = False) -> int:
+    if resource is None:
+        return 0
+    rss = resource.getrusage(
+        resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    ).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # bytes on macOS, KiB elsewhere
+
+
+def worker_footprint(history_dir: Optional[Path] = None) -> int:
+    """Measured peak RSS of one worker process, or the default estimate."""
+    if history_dir is not None:
+        try:
+            data = json.loads((Path(history_dir) / FOOTPRINT_FILE).read_text())
+            return max(int(data["worker_rss_bytes"]), 1)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    return DEFAULT_FOOTPRINT
+
+
+def record_worker_footprint(history_dir: Path) -> None:
+    """Save the peak RSS of reaped worker processes for later ``auto`` runs."""
+    rss = _maxrss(children=True)
+    if not rss:
+        return
+    try:
+        Path(history_dir).mkdir(parents=True, exist_ok=True)
+        (Path(history_dir) / FOOTPRINT_FILE).write_text(json.dumps({"worker_rss_bytes": rss}))
+    except OSError as e:
+        log.debug(f"Could not record worker footprint: {e}")
+
+
+def auto_workers(history_dir: Optional[Path] = None) -> int:
+    """Worker count fitting this container's CPU quota, affinity and memory."""
+    affinity = available_cpus()
+    quota = cpu_quota()
+    workers = affinity if quota is None else min(affinity, max(1, math.ceil(quota)))
+    limit = memory_limit()
+    footprint = worker_footprint(history_dir)
+    if limit is not None:
+        headroom = limit - _maxrss()
+        workers = min(workers, max(1, headroom // footprint))
+    log.info(
+        f"Using {workers} workers (affinity {affinity} CPUs, "
+        f"quota {'none' if quota is None else f'{quota:g}'}, "
+        f"memory limit {'none' if limit is None else f'{limit >> 20} MiB'}, "
+        f"worker footprint {footprint >> 20} MiB)"
+    )
+    return workers
+
+
+def resolve_workers(value: Union[int, str, None], history_dir: Optional[Path] = None) -> int:
+    """Turn a ``max_workers`` setting (a count, ``"auto"`` or None) into a count.
+
+    Raises:
+        ConfigError: Not a positive integer or ``"auto"``
+    """
+    if value is None or (isinstance(value, str) and value.strip().lower() == "auto"):
+        return auto_workers(history_dir)
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        count = 0
+    if count < 1:
+        raise ConfigError(f"max_workers must be a positive integer or 'auto', not {value!r}")
+    return count
@@ -0,0 +1,66 @@
+"""Content-addressed cache of per-file analyzer results.
+
+Entries are keyed by analyzer, analyzer version and the SHA-256 of the
+file content, so a result is reused wherever the same bytes appear, even
+under a different path. Paths are stripped on write and restored on read.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from specify_cli.logging import get_logger
+
+log = get_logger(__name__)
+
+CACHE_DIR = Path(".speckit/cache/results")
+CACHE_VERSION = 1
+
+
+class ResultCache:
+    """On-disk store with one small JSON file per entry."""
+
+    def __init__(self, directory: Path):
+        """Initialize cache rooted at ``directory`` (created on first write)."""
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(analyzer: str, version: str, digest: str) -> str:
+        """Build the entry key for one analyzer run over one file content."""
+        raw = f"{CACHE_VERSION}\0{analyzer}\0{version}\0{digest}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, file_path: str) -> Optional[List[Dict]]:
+        """Return cached findings re-attached to ``file_path``, or None on a miss."""
+        try:
+            findings = json.loads(self._path(key).read_text())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        for f in findings:
+            f["file_path"] = file_path
+        return findings
+
+    def put(self, key: str, findings: List[Dict]) -> None:
+        """Store findings for a key; failures only cost a future cache miss."""
+        path = self._path(key)
+        stripped = [{k: v for k, v in f.items() if k != "file_path"} for f in findings]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as fh:
+                json.dump(stripped, fh)
+            # Atomic so concurrent runs never read a half-written entry
+            os.replace(tmp, path)
+        except OSError as e:
+            log.debug(f"Could not write result cache entry {path}: {e}")
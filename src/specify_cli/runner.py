@@ -1,12 +1,46 @@
 """Analysis runner orchestration."""
 
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
+import hashlib
+import multiprocessing
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from specify_cli.analyzers.bandit_analyzer import BanditAnalyzer
-from specify_cli.analyzers.safety_analyzer import SafetyAnalyzer
+from specify_cli.analyzers.registry import AnalyzerContext, AnalyzerPlugin, discover_plugins
+from specify_cli.baseline import filter_with_baseline, stamp_fingerprints
+from specify_cli.budget import TimeBudget, load_history, prioritize
+from specify_cli.checkpoint import Checkpoint, checkpoint_key
+from specify_cli.discovery import iter_python_files
+from specify_cli.import_index import ImportIndex, tag_reachability
+from specify_cli.logging import get_logger
+from specify_cli.pipeline import Pipeline, StageStats
+from specify_cli.resources import record_worker_footprint, resolve_workers
+from specify_cli.result_cache import CACHE_DIR, ResultCache
+from specify_cli.sharding import Shard, in_shard
+from specify_cli.spill import SpillList
+
+log = get_logger(__name__)
 
 
 @dataclass
@@ -18,26 +52,641 @@ class RunConfig:
     use_bandit: bool = True
     use_safety: bool = True
     exclude_globs: List[str] = field(default_factory=list)
+    advisory_db: Optional[Path] = None
+    timeout: Optional[float] = None  # overall deadline in seconds
+    analyzers: List[str] = field(default_factory=list)  # extra plugins by name
+    baseline: Optional[Collection[str]] = None  # fingerprints (e.g. a BaselineIndex) to suppress
+    sinks: List[Callable[[str, List[dict]], None]] = field(default_factory=list)
+    use_cache: bool = True  # reuse per-file results for unchanged content
+    max_workers: Union[int, str, None] = None  # count or "auto" (default), see resources.py
+    cache_dir: Optional[Path] = None  # result cache location (default: <path>/.speckit/cache)
+    batch_size: int = 16  # files per analysis task
+    queue_size: int = 64  # depth of each inter-stage queue
+    shard: Optional[Shard] = None  # (index, count): scan only this shard's files
+    time_budget: Optional[float] = None  # seconds; stop early and return partial results
+    history_dir: Optional[Path] = None  # directory with last_run.json, for budget ordering
+    checkpoint_dir: Optional[Path] = None  # output directory to checkpoint progress into
+    resume: bool = False  # reuse checkpointed results for files with unchanged hashes
+    max_memory: Optional[int] = None  # bytes of findings to hold before spilling to disk
+    spill_dir: Optional[Path] = None  # segment file location (default: system temp dir)
+    cancel: Optional[threading.Event] = None  # set (e.g. by a sink) to stop run_all early
+
+    def enabled_analyzers(self) -> List[str]:
+        """Names of analyzers to run, built-ins first."""
+        names = []
+        if self.use_bandit:
+            names.append("bandit")
+        if self.use_safety:
+            names.append("safety")
+        return names + [n for n in self.analyzers if n not in names]
+
+    def findings_list(self, share: int = 1) -> Union[List[dict], SpillList]:
+        """Empty collection for findings: a list, or with ``max_memory`` set a
+        ``SpillList`` holding ``1/share`` of it in memory."""
+        if self.max_memory is None:
+            return []
+        return SpillList(max(self.max_memory // max(share, 1), 1), self.spill_dir)
+
+
+class RunResults(dict):
+    """Findings per analyzer, plus run metadata.
+
+    Behaves as the plain ``Dict[str, List[dict]]`` that ``run_all`` has
+    always returned; analyzers that missed the deadline are listed in
+    ``incomplete`` and have no entry.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.incomplete: List[str] = []
+        self.timings: Dict[str, float] = {}
+        self.suppressed: Dict[str, int] = {}  # findings dropped by the baseline
+        self.stages: Dict[str, StageStats] = {}
+        self.cached = 0  # per-file results served from the result cache
+        self.partial = False  # time budget ran out before every file was analyzed
+        self.coverage: Dict[str, Any] = {}  # file counts for budgeted runs
+        self.resumed = 0  # files whose results came from a checkpoint
+        self.cancelled = False  # stopped early through RunConfig.cancel
+
+
+@dataclass
+class FileWork:
+    """One source file moving through the pipeline."""
+
+    path: Path
+    rel: str
+    data: bytes
+    digest: str
+    results: Dict[str, List[dict]] = field(default_factory=dict)
+    pending: List[AnalyzerPlugin] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)  # analyzers not run (time budget)
+
+
+def _run_plugin(plugin: AnalyzerPlugin, ctx: AnalyzerContext) -> List[dict]:
+    """Import and run one analyzer (module-level so it pickles into workers)."""
+    return plugin.load()(ctx)
+
+
+def _worker_init() -> None:
+    # Workers inherit the CLI's SIGTERM handler, which would turn terminate()
+    # into a KeyboardInterrupt inside the pool's task loop
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+class WorkerPool:
+    """Analysis workers: a process pool for CPU-bound plugins, threads for the rest.
+
+    ``run_all`` creates one per run unless given a pool to share, e.g. by a
+    fleet audit scanning many repositories from one process.
+    """
+
+    def __init__(
+        self,
+        max_workers: Union[int, str, None] = None,
+        processes: bool = True,
+        extra_threads: int = 0,
+        history_dir: Optional[Path] = None,
+    ):
+        """Start the workers.
+
+        Args:
+            max_workers: Analysis processes and threads, or ``"auto"`` (the
+                default) to fit the container's CPU quota and memory limit
+            processes: Start a process pool (otherwise everything runs on threads)
+            extra_threads: Additional threads for project-level analyzers
+            history_dir: Where the measured per-worker footprint is kept
+        """
+        self.size = resolve_workers(max_workers, history_dir)
+        self.history_dir = history_dir
+        # Fork workers before any thread exists
+        self._pool = multiprocessing.Pool(self.size, _worker_init) if processes else None
+        self._threads = ThreadPoolExecutor(
+            max_workers=self.size + extra_threads, thread_name_prefix="speckit-io"
+        )
+
+    def submit(self, plugin: AnalyzerPlugin, ctx: AnalyzerContext) -> Future:
+        """Run a plugin on the right kind of worker."""
+        if plugin.cost != "cpu" or self._pool is None:
+            return self._threads.submit(_run_plugin, plugin, ctx)
+        # Completion is delivered through pool callbacks, so no thread ever
+        # blocks on a worker that may be terminated at the deadline
+        fut: Future = Future()
+        self._pool.apply_async(
+            _run_plugin,
+            (plugin, ctx),
+            callback=fut.set_result,
+            error_callback=fut.set_exception,
+        )
+        return fut
+
+    def close(self) -> None:
+        """Stop all workers, abandoning unfinished work."""
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            if self.history_dir is not None:
+                record_worker_footprint(self.history_dir)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def group_by_file(
+    findings: List[dict], files: List[Tuple[Path, str]]
+) -> Tuple[Dict[str, List[dict]], List[dict]]:
+    """Split one analyzer's findings over the files it was given.
+
+    Matched findings get ``file_path`` rewritten to the path as given, so
+    results read the same whether fresh or served from the cache.
+
+    Args:
+        findings: Analyzer output for a batch of files
+        files: ``(path, rel)`` pairs the analyzer was run on
+
+    Returns:
+        Findings per relative path (every file present) and findings that
+        name no file in the batch
+    """
+    owners: Dict[str, Tuple[Path, str]] = {}
+    per_file: Dict[str, List[dict]] = {}
+    for path, rel in files:
+        owners[os.path.normpath(path)] = owners[rel] = (path, rel)
+        per_file[rel] = []
+    orphans = []
+    for f in findings:
+        owner = owners.get(os.path.normpath(str(f.get("file_path"))))
+        if owner is None:
+            orphans.append(f)
+        else:
+            f["file_path"] = str(owner[0])
+            per_file[owner[1]].append(f)
+    return per_file, orphans
+
+
+class _FileSteps:
+    """Per-file read, cache lookup, result assignment and baseline filtering.
+
+    Shared by the threaded pipeline in ``run_all`` and by
+    ``specify_cli.async_runner``.
+    """
+
+    def __init__(
+        self,
+        cfg: RunConfig,
+        plugins: List[AnalyzerPlugin],
+        cache: Optional[ResultCache],
+        index: Optional[ImportIndex],
+        checkpoint: Optional[Checkpoint] = None,
+    ):
+        self.root = Path(cfg.path)
+        self.cfg = cfg
+        self.plugins = plugins
+        self.cache = cache
+        self.index = index
+        self.checkpoint = checkpoint
+        self.versions = {p.name: p.version() for p in plugins if p.cacheable} if cache else {}
+        self.seen: Set[str] = set()
+        self.suppressed: Dict[str, int] = {}
+
+    def read(self, path: Path) -> Iterator[FileWork]:
+        rel = _rel(path, self.root)
+        mine = in_shard(rel, self.cfg.shard)
+        if not mine and self.index is None:
+            return
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            log.debug(f"Skipping unreadable file {path}: {e}")
+            return
+        self.seen.add(rel)
+        if self.index is not None:
+            # Reachability needs every import, not just this shard's files
+            self.index.add_source(rel, data)
+        if mine:
+            if self.checkpoint is not None:
+                self.checkpoint.discovered(rel)
+            yield FileWork(path, rel, data, hashlib.sha256(data).hexdigest())
+
+    def _key(self, plugin: AnalyzerPlugin, work: FileWork) -> str:
+        return ResultCache.key(plugin.name, self.versions[plugin.name], work.digest)
+
+    def lookup(self, work: FileWork) -> Iterator[FileWork]:
+        if self.checkpoint is not None:
+            restored = self.checkpoint.restore(work.rel, work.digest, str(work.path))
+            if restored is not None and all(p.name in restored for p in self.plugins):
+                work.results = restored
+                yield work
+                return
+        for p in self.plugins:
+            if self.cache is not None and p.cacheable:
+                hit = self.cache.get(self._key(p, work), str(work.path))
+                if hit is not None:
+                    work.results[p.name] = hit
+                    continue
+            work.pending.append(p)
+        yield work
+
+    def _assign(self, name: str, batch: List[FileWork], findings: List[dict]) -> None:
+        plugin = next(p for p in self.plugins if p.name == name)
+        owned = [w for w in batch if plugin in w.pending]
+        per_file, orphans = group_by_file(findings, [(w.path, w.rel) for w in owned])
+        for w in owned:
+            w.results[name] = per_file[w.rel]
+        if orphans:
+            # Findings that cannot be attributed to a file are kept but not cached
+            owned[0].results[name].extend(orphans)
+        elif self.cache is not None and plugin.cacheable:
+            for w in owned:
+                self.cache.put(self._key(plugin, w), w.results[name])
 
+    def release(self, work: FileWork) -> None:
+        """Stamp fingerprints while the source is at hand, then drop it."""
+        for p in self.plugins:
+            if p.kind == "code" and work.results.get(p.name):
+                stamp_fingerprints(
+                    work.results[p.name], source=work.data, path=str(work.path), root=self.root
+                )
+        work.pending = []
+        work.data = b""
 
-def run_all(cfg: RunConfig) -> Dict[str, List[dict]]:
-    """Run all enabled analyzers.
+    def filter(self, work: FileWork) -> Iterator[FileWork]:
+        if self.checkpoint is not None and not work.skipped:
+            # Unfiltered, so a resumed run applies the current baseline
+            self.checkpoint.record(work.rel, work.digest, work.results)
+        if self.cfg.baseline:
+            for p in self.plugins:
+                if p.kind == "code" and work.results.get(p.name):
+                    kept = filter_with_baseline(work.results[p.name], self.cfg.baseline)
+                    dropped = len(work.results[p.name]) - len(kept)
+                    self.suppressed[p.name] = self.suppressed.get(p.name, 0) + dropped
+                    work.results[p.name] = kept
+        yield work
+
+
+class _FileStages(_FileSteps):
+    """Stage functions for the per-file part of the pipeline."""
+
+    def __init__(
+        self,
+        cfg: RunConfig,
+        plugins: List[AnalyzerPlugin],
+        pipe: Pipeline,
+        submit: Callable[[AnalyzerPlugin, List[Path]], Future],
+        cache: Optional[ResultCache],
+        index: Optional[ImportIndex],
+        max_inflight: int,
+        budget: Optional[TimeBudget] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ):
+        super().__init__(cfg, plugins, cache, index, checkpoint)
+        self.pipe = pipe
+        self.submit = submit
+        self.max_inflight = max_inflight
+        self.budget = budget
+        self._buffer: List[FileWork] = []
+        self._inflight: Deque[Tuple[List[FileWork], Dict[str, Future], float]] = deque()
+
+    def analyze(self, work: FileWork) -> Iterator[FileWork]:
+        self._buffer.append(work)
+        if len(self._buffer) >= self.cfg.batch_size:
+            self._dispatch()
+        yield from self._drain(self.max_inflight)
+
+    def flush(self) -> Iterator[FileWork]:
+        if self._buffer:
+            self._dispatch()
+        yield from self._drain(0)
+
+    def _dispatch(self) -> None:
+        batch, self._buffer = self._buffer, []
+        futs: Dict[str, Future] = {}
+        if self.budget is not None and not self.budget.can_start():
+            # Out of time: pass the batch on with only its cached results
+            for w in batch:
+                w.skipped = [p.name for p in w.pending]
+        else:
+            for p in self.plugins:
+                files = [w.path for w in batch if p in w.pending]
+                if files:
+                    futs[p.name] = self.submit(p, files)
+        self._inflight.append((batch, futs, time.monotonic()))
+
+    def _drain(self, limit: int) -> Iterator[FileWork]:
+        # Batches complete in submission order so output order is stable;
+        # block only while more than ``limit`` batches are in flight
+        while self._inflight:
+            batch, futs, dispatched = self._inflight[0]
+            if len(self._inflight) <= limit and not all(f.done() for f in futs.values()):
+                break
+            self._inflight.popleft()
+            for name, fut in futs.items():
+                self._assign(name, batch, self.pipe.result(fut))
+            if futs and self.budget is not None:
+                self.budget.record(time.monotonic() - dispatched)
+            for w in batch:
+                self.release(w)
+                yield w
+
+
+def select_plugins(cfg: RunConfig) -> Tuple[List[AnalyzerPlugin], List[AnalyzerPlugin]]:
+    """Resolve enabled analyzers into file-level and project-level plugins.
+
+    Unknown names are skipped with a warning. On shards other than 0 no
+    project-level analyzers run.
+    """
+    registry = discover_plugins()
+    plugins: List[AnalyzerPlugin] = []
+    for name in cfg.enabled_analyzers():
+        if name in registry:
+            plugins.append(registry[name])
+        else:
+            log.warning(f"Unknown analyzer '{name}'; skipping")
+    file_plugins = [p for p in plugins if p.scope == "file"]
+    project_plugins = [p for p in plugins if p.scope != "file"]
+    if cfg.shard and cfg.shard[0] != 0:
+        # Project-level analyzers run once, on shard 0
+        project_plugins = []
+    return file_plugins, project_plugins
+
+
+def open_checkpoint(cfg: RunConfig, file_plugins: List[AnalyzerPlugin]) -> Optional[Checkpoint]:
+    """The run's checkpoint, loaded for ``cfg.resume`` and otherwise cleared."""
+    if cfg.checkpoint_dir is None or not file_plugins:
+        return None
+    key = checkpoint_key(
+        cfg.path,
+        [(p.name, p.version()) for p in file_plugins],
+        exclude_globs=sorted(cfg.exclude_globs or []),
+        shard=cfg.shard,
+    )
+    checkpoint = Checkpoint(cfg.checkpoint_dir, key)
+    if cfg.resume:
+        log.info(f"Resuming with {checkpoint.load()} checkpointed files")
+    else:
+        checkpoint.reset()
+    return checkpoint
+
+
+def run_all(cfg: RunConfig, workers: Optional[WorkerPool] = None) -> Dict[str, List[dict]]:
+    """Run all enabled analyzers as a staged pipeline.
+
+    Project-level analyzers start first on their own workers. Per-file work
+    then flows through stages connected by bounded queues: discovery →
+    read/hash → result-cache lookup → analyze → baseline filter → sinks.
+    Discovery, I/O and analysis overlap, and memory is capped by queue
+    depth and the number of analysis batches in flight. CPU-bound plugins
+    run in a process pool, IO-bound plugins on threads; analyzer modules
+    are imported only when enabled. Unchanged files are served from the
+    content-addressed result cache for cacheable plugins, and the import
+    index is fed from the same reads.
+
+    With ``cfg.timeout`` set, analyzers still running at the deadline are
+    cancelled and reported in ``RunResults.incomplete``. Per-stage
+    throughput counters are available in ``RunResults.stages``.
+
+    With ``cfg.shard`` set, only files whose relative path hashes to that
+    shard are analyzed, and project-level analyzers run on shard 0 only.
+
+    With ``cfg.checkpoint_dir`` set, completed per-file results and the
+    pending file list are flushed there periodically (see
+    ``specify_cli.checkpoint``); ``cfg.resume`` reuses them for files whose
+    content hash is unchanged.
+
+    A shared ``workers`` pool is left running afterwards, so work cancelled
+    at a deadline may still occupy it briefly.
+
+    Setting ``cfg.cancel`` stops the run after the file being delivered:
+    outstanding analysis is abandoned, project-level analyzers that have not
+    finished are listed in ``incomplete``, findings delivered so far are
+    kept and ``RunResults.cancelled`` is set.
+
+    With ``cfg.max_memory`` set, each analyzer's findings are collected in
+    a ``SpillList`` (see ``specify_cli.spill``) that writes past its share of
+    the limit to a segment file in ``cfg.spill_dir``.
+
+    With ``cfg.time_budget`` set, files are analyzed in priority order (see
+    ``specify_cli.budget.prioritize``) and no new batch is dispatched once
+    it would not finish inside the budget. Findings for the files that were
+    analyzed are kept; ``RunResults.partial`` and ``RunResults.coverage``
+    describe what was left out.
 
     Args:
         cfg: Run configuration
+        workers: Pool to run analyzers on (default: a new pool for this run)
 
     Returns:
         Dictionary mapping analyzer name to list of findings
     """
-    out: Dict[str, List[dict]] = {}
+    out = RunResults()
+    root = Path(cfg.path)
     excludes = cfg.exclude_globs or []
+    deadline = time.monotonic() + cfg.timeout if cfg.timeout else None
+    budget = TimeBudget(cfg.time_budget) if cfg.time_budget else None
+    if budget is not None:
+        deadline = budget.deadline if deadline is None else min(deadline, budget.deadline)
+
+    file_plugins, project_plugins = select_plugins(cfg)
+    plugins = file_plugins + project_plugins
+    dependency = any(p.kind == "dependency" for p in plugins)
+
+    def _ctx(files: List[Path]) -> AnalyzerContext:
+        return AnalyzerContext(
+            root=root,
+            files=files,
+            exclude_globs=excludes,
+            timeout=_remaining(deadline),
+            advisory_db=cfg.advisory_db,
+        )
+
+    owned = workers is None
+    pool = workers or WorkerPool(
+        cfg.max_workers,
+        processes=any(p.cost == "cpu" for p in plugins),
+        extra_threads=len(project_plugins),
+        history_dir=cfg.history_dir,
+    )
+
+    def _submit(plugin: AnalyzerPlugin, files: List[Path]) -> Future:
+        return pool.submit(plugin, _ctx(files))
+
+    checkpoint = open_checkpoint(cfg, file_plugins)
+    started = time.monotonic()
+    # Project-level results are sunk from worker callbacks as they finish, so
+    # they can fail the gate while files are still being analyzed
+    sink_lock = threading.Lock()
+    collected: Dict[str, List[dict]] = {}
+    closed = threading.Event()  # results arriving after this are ignored
 
-    if cfg.use_bandit:
-        bandit = BanditAnalyzer(Path(cfg.path), exclude_globs=excludes).run()
-        out["bandit"] = [asdict(b) for b in bandit]
+    def _collect(p: AnalyzerPlugin, fut: Future) -> None:
+        with sink_lock:
+            if p.name in collected or closed.is_set() or fut.cancelled() or fut.exception():
+                return
+            findings = fut.result()
+            stamp_fingerprints(findings, root=root)
+            if p.kind == "code" and cfg.baseline:
+                kept = filter_with_baseline(findings, cfg.baseline)
+                out.suppressed[p.name] = len(findings) - len(kept)
+                findings = kept
+            collected[p.name] = findings
+            _sink(cfg, p.name, findings)
 
-    if cfg.use_safety:
-        safety = SafetyAnalyzer(Path(cfg.path)).run()
-        out["safety"] = [asdict(s) for s in safety]
+    try:
+        futures: Dict[str, Future] = {}
+        for p in project_plugins:
+            fut = _submit(p, [])
+            fut.add_done_callback(
+                lambda _f, name=p.name: out.timings.__setitem__(name, time.monotonic() - started)
+            )
+            fut.add_done_callback(lambda f, p=p: _collect(p, f))
+            futures[p.name] = fut
 
+        index: Optional[ImportIndex] = None
+        if file_plugins or dependency:
+            index = ImportIndex(root) if dependency else None
+            cache = ResultCache(cfg.cache_dir or root / CACHE_DIR) if cfg.use_cache else None
+            pipe = Pipeline(maxsize=cfg.queue_size)
+            stages = _FileStages(
+                cfg, file_plugins, pipe, _submit, cache, index, pool.size * 2, budget, checkpoint
+            )
+            files: Iterable[Path] = iter_python_files(root, excludes)
+            total = 0
+            if budget is not None:
+                files = _prioritized(cfg, list(files))
+                total = sum(1 for f in files if in_shard(_rel(f, root), cfg.shard))
+                files = _while_in_budget(files, budget)
+            pipe.source("discover", files)
+            pipe.stage("read", stages.read)
+            pipe.stage("cache", stages.lookup)
+            pipe.stage("analyze", stages.analyze, flush=stages.flush)
+            pipe.stage("filter", stages.filter)
+
+            for p in file_plugins:
+                out[p.name] = cfg.findings_list(len(plugins))
+            analyzed = 0
+            for work in pipe.run(deadline):
+                analyzed += not work.skipped
+                for name, findings in work.results.items():
+                    out[name].extend(findings)
+                    with sink_lock:
+                        _sink(cfg, name, findings)
+                if _cancelled(cfg):
+                    out.cancelled = True
+                    break
+            out.stages = pipe.stats
+            out.suppressed.update(stages.suppressed)
+            out.cached = cache.hits if cache else 0
+
+            if budget is not None:
+                out.partial = analyzed < total
+                out.coverage = {
+                    "files_total": total,
+                    "files_analyzed": analyzed,
+                    "files_skipped": total - analyzed,
+                    "percent": round(100.0 * analyzed / total, 1) if total else 100.0,
+                }
+                for p in file_plugins:
+                    out.timings[p.name] = time.monotonic() - started
+                if out.partial:
+                    index = None  # reachability needs every file's imports
+                elif index is not None:
+                    index.prune(stages.seen)
+                    index.save()
+            elif pipe.timed_out:
+                for p in file_plugins:
+                    out.incomplete.append(p.name)
+                    del out[p.name]
+                index = None
+            elif out.cancelled:
+                index = None
+            else:
+                for p in file_plugins:
+                    out.timings[p.name] = time.monotonic() - started
+                if index is not None:
+                    index.prune(stages.seen)
+                    index.save()
+
+        if _cancelled(cfg):
+            out.cancelled = True
+        _, not_done = wait(futures.values(), timeout=0 if out.cancelled else _remaining(deadline))
+        for p in project_plugins:
+            if futures[p.name] not in not_done:
+                _collect(p, futures[p.name])  # its callback may not have run yet
+        with sink_lock:
+            closed.set()
+        for p in project_plugins:
+            fut = futures[p.name]
+            if p.name not in collected:
+                if fut in not_done or _timed_out(fut):
+                    out.incomplete.append(p.name)
+                    out.timings.pop(p.name, None)
+                    continue
+                fut.result()  # re-raise the analyzer's error
+            findings = collected[p.name]
+            if p.kind == "dependency" and index is not None:
+                findings = tag_reachability(findings, index)
+            if cfg.max_memory is not None:
+                spilled = cfg.findings_list(len(plugins))
+                spilled.extend(findings)
+                findings = spilled
+            out[p.name] = findings
+    finally:
+        if checkpoint is not None:
+            checkpoint.flush()
+            out.resumed = checkpoint.resumed
+        if owned:
+            pool.close()
+
+    if budget is not None:
+        out.partial = out.partial or bool(out.incomplete)
+        out.coverage["budget_seconds"] = budget.seconds
+        out.coverage["elapsed_seconds"] = round(budget.elapsed(), 3)
+    if out.cancelled:
+        log.info("Run cancelled; remaining analysis abandoned")
+    elif out.incomplete:
+        log.warning(f"Analyzers did not finish before the deadline: {', '.join(out.incomplete)}")
     return out
+
+
+def _rel(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root))
+    except ValueError:
+        return str(path)
+
+
+def _prioritized(cfg: RunConfig, files: List[Path]) -> List[Path]:
+    since = None
+    history: Dict[str, int] = {}
+    if cfg.history_dir is not None:
+        history = load_history(cfg.history_dir)
+        try:
+            since = (Path(cfg.history_dir) / "last_run.json").stat().st_mtime
+        except OSError:
+            pass
+    return prioritize(Path(cfg.path), files, history, since=since)
+
+
+def _while_in_budget(files: Iterable[Path], budget: TimeBudget) -> Iterator[Path]:
+    # Stop feeding the pipeline once no further batch could finish in time
+    for path in files:
+        if not budget.can_start():
+            return
+        yield path
+
+
+def _sink(cfg: RunConfig, name: str, findings: List[dict]) -> None:
+    if findings:
+        for sink in cfg.sinks:
+            sink(name, findings)
+
+
+def _cancelled(cfg: RunConfig) -> bool:
+    return cfg.cancel is not None and cfg.cancel.is_set()
+
+
+def _timed_out(fut: Future) -> bool:
+    """True if a finished future failed only because it hit the deadline."""
+    exc = fut.exception()
+    return isinstance(exc, (multiprocessing.TimeoutError, subprocess.TimeoutExpired))
@@ -0,0 +1,187 @@
+"""Deterministic work sharding and merging of shard reports.
+
+Files are assigned to shards by a stable hash of their path relative to
+the scan root, so every runner computes the same partition without
+coordination. Reports are written in a canonical order (code findings by
+file path, analyzer order preserved within a file), which lets ``merge``
+reproduce exactly what an unsharded run would have written.
+"""
+
+from __future__ import annotations
+import hashlib
+from pathlib import PurePath
+from typing import Dict, List, Optional, Tuple
+
+from specify_cli.errors import SpecKitError
+
+Shard = Tuple[int, int]  # (index, count), index is 0-based
+
+
+class ShardError(SpecKitError):
+    """Invalid shard specification or inconsistent shard reports."""
+
+
+def parse_shard(spec: str) -> Shard:
+    """Parse ``"i/n"`` into ``(i, n)`` with ``0 <= i < n``.
+
+    Raises:
+        ShardError: Malformed or out-of-range specification
+    """
+    try:
+        i_str, n_str = spec.split("/", 1)
+        index, count = int(i_str), int(n_str)
+    except ValueError:
+        raise ShardError(f"Invalid shard '{spec}'; expected INDEX/COUNT such as 0/8") from None
+    if count < 1 or not 0 <= index < count:
+        raise ShardError(f"Invalid shard '{spec}'; INDEX must be in 0..COUNT-1")
+    return index, count
+
+
+def shard_of(rel_path: str, count: int) -> int:
+    """Return the shard owning a path relative to the scan root."""
+    # Hash the POSIX spelling so Windows and Unix runners agree
+    digest = hashlib.sha256(PurePath(rel_path).as_posix().encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def in_shard(rel_path: str, shard: Optional[Shard]) -> bool:
+    """True if the path belongs to ``shard`` (always true when unsharded)."""
+    return shard is None or shard_of(rel_path, shard[1]) == shard[0]
+
+
+def shard_suffix(shard: Shard) -> str:
+    """Filename infix for a shard's report, e.g. ``shard-2-of-8``."""
+    return f"shard-{shard[0]}-of-{shard[1]}"
+
+
+def _path_key(path: str) -> Tuple[str, ...]:
+    # Same order as discovery: path parts compared component-wise
+    return PurePath(path).parts
+
+
+def canonical_key(finding: dict, path_field: str = "file_path") -> Tuple[str, ...]:
+    """Sort key of a code finding in canonical order."""
+    return _path_key(str(finding.get(path_field, "")))
+
+
+def canonical_order(findings: List[dict], path_field: str = "file_path") -> List[dict]:
+    """Sort code findings by file path, keeping analyzer order within a file."""
+    return sorted(findings, key=lambda f: canonical_key(f, path_field))
+
+
+def _check_shards(shards: List[Optional[Dict]]) -> int:
+    if any(s is None for s in shards):
+        raise ShardError("Every input must be a sharded report (written with --shard)")
+    count = shards[0]["count"]  # type: ignore[index]
+    indices = sorted(s["index"] for s in shards)  # type: ignore[index]
+    if any(s["count"] != count for s in shards):  # type: ignore[index]
+        raise ShardError("Reports come from different shard counts")
+    if indices != list(range(count)):
+        missing = sorted(set(range(count)) - set(indices))
+        dupes = sorted({i for i in indices if indices.count(i) > 1})
+        detail = f"missing {missing}" if missing else f"duplicated {dupes}"
+        raise ShardError(f"Incomplete shard set: {detail}")
+    return count
+
+
+def _union(lists: List[List[str]]) -> List[str]:
+    out: List[str] = []
+    for names in lists:
+        out.extend(n for n in names if n not in out)
+    return out
+
+
+def _merge_coverage(coverages: List[Optional[Dict]]) -> Optional[Dict]:
+    # Sum file counts of time-budgeted shards; None if no shard had a budget
+    present = [c for c in coverages if c]
+    if not present:
+        return None
+    merged: Dict = {
+        k: sum(c.get(k, 0) for c in present)
+        for k in ("files_total", "files_analyzed", "files_skipped")
+    }
+    total = merged["files_total"]
+    merged["percent"] = round(100.0 * merged["files_analyzed"] / total, 1) if total else 100.0
+    merged["budget_seconds"] = max(c.get("budget_seconds", 0) for c in present)
+    merged["elapsed_seconds"] = max(c.get("elapsed_seconds", 0) for c in present)
+    return merged
+
+
+def merge_json_reports(reports: List[Dict]) -> Dict:
+    """Merge JSON shard reports into the report an unsharded run writes.
+
+    Args:
+        reports: Parsed ``analysis.<shard>.json`` documents
+
+    Returns:
+        Merged report without shard metadata
+
+    Raises:
+        ShardError: Inputs are not a complete, consistent shard set
+    """
+    _check_shards([r.get("shard") for r in reports])
+    merged: Dict = {
+        "code": canonical_order([f for r in reports for f in r.get("code", [])]),
+        "dependencies": [d for r in reports for d in r.get("dependencies", [])],
+    }
+    incomplete = _union([r.get("incomplete", []) for r in reports])
+    if incomplete:
+        merged["incomplete"] = incomplete
+    coverage = _merge_coverage([r.get("coverage") for r in reports])
+    if coverage is not None:
+        merged["partial"] = any(r.get("partial") for r in reports)
+        merged["coverage"] = coverage
+    return merged
+
+
+def _is_dependency_rule(rule: Dict) -> bool:
+    return "dependency" in rule.get("properties", {}).get("tags", [])
+
+
+def merge_sarif_reports(docs: List[Dict]) -> Dict:
+    """Merge SARIF shard reports into the document an unsharded run writes.
+
+    Code results are put back in file order and rules are re-listed in
+    order of first use, matching ``combine_to_sarif`` over all findings.
+
+    Args:
+        docs: Parsed ``report.<shard>.sarif`` documents (one run each)
+
+    Returns:
+        Merged SARIF document without shard metadata
+
+    Raises:
+        ShardError: Inputs are not a complete, consistent shard set
+    """
+    runs = [d["runs"][0] for d in docs]
+    _check_shards([r.get("properties", {}).get("shard") for r in runs])
+
+    code: List[Tuple[Dict, Dict]] = []
+    deps: List[Tuple[Dict, Dict]] = []
+    for run in runs:
+        rules = {r["id"]: r for r in run["tool"]["driver"]["rules"]}
+        for result in run["results"]:
+            rule = rules[result["ruleId"]]
+            (deps if _is_dependency_rule(rule) else code).append((result, rule))
+
+    def _uri(item: Tuple[Dict, Dict]) -> str:
+        return item[0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+
+    code.sort(key=lambda item: _path_key(_uri(item)))
+    merged_rules: Dict[str, Dict] = {}
+    for result, rule in code + deps:
+        merged_rules.setdefault(result["ruleId"], rule)
+
+    doc = {k: v for k, v in docs[0].items() if k != "runs"}
+    run = {k: v for k, v in runs[0].items() if k not in ("results", "properties")}
+    run["tool"] = {"driver": {**runs[0]["tool"]["driver"], "rules": list(merged_rules.values())}}
+    run["results"] = [result for result, _ in code + deps]
+    props = {k: v for k, v in runs[0].get("properties", {}).items() if k != "shard"}
+    coverage = _merge_coverage([r.get("properties", {}).get("coverage") for r in runs])
+    if coverage is not None:
+        props["partial"] = any(r.get("properties", {}).get("partial") for r in runs)
+        props["coverage"] = coverage
+    if props:
+        run["properties"] = props
+    doc["runs"] = [run]
+    return doc
@@ -0,0 +1,84 @@
+"""Line-independent context fingerprints of findings.
+
+``baseline.fingerprint`` includes the line number, so inserting one line
+at the top of a file changes the fingerprint of every finding below it.
+The context fingerprint leaves the line out:
+
+    SHA-256 of ``path:rule_id:scope:snippet:occurrence``
+
+- ``path`` is relative to the scan root, so checkouts in different
+  directories (developer machines, CI workspaces) agree;
+- ``scope`` is the dotted name of the enclosing ``class``/``def`` blocks
+  (empty at module level), taken from indentation;
+- ``snippet`` is the flagged source line with whitespace collapsed;
+- ``occurrence`` numbers findings with the same rule, scope and snippet in
+  the file, in line order, so repeated lines stay distinct.
+
+Scopes for a whole file are computed in one pass over its lines, so
+stamping all of a file's findings is O(lines + findings).
+"""
+
+from __future__ import annotations
+import hashlib
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+CONTEXT_FIELD = "context_fingerprint"
+
+_BLOCK = re.compile(r"(?:async\s+def|def|class)\s+(\w+)")
+
+
+def line_scopes(lines: List[str]) -> List[str]:
+    """Enclosing ``class``/``def`` scope of each line, e.g. ``"Client.connect"``.
+
+    A ``def`` or ``class`` line belongs to the scope around it. Blank and
+    comment lines keep the scope of the line before them.
+    """
+    scopes: List[str] = []
+    stack: List[Tuple[int, str]] = []
+    current = ""
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith("#"):
+            indent = len(line) - len(stripped)
+            if stack and stack[-1][0] >= indent:
+                while stack and stack[-1][0] >= indent:
+                    stack.pop()
+                current = ".".join(name for _, name in stack)
+            scopes.append(current)
+            m = _BLOCK.match(stripped)
+            if m:
+                stack.append((indent, m.group(1)))
+                current = ".".join(name for _, name in stack)
+        else:
+            scopes.append(current)
+    return scopes
+
+
+def normalize(line: str) -> str:
+    """Source line with surrounding whitespace removed and runs collapsed."""
+    return " ".join(line.split())
+
+
+def stamp_context(findings: List[Dict[str, Any]], source: bytes, rel: str) -> None:
+    """Store the context fingerprint on findings from one file.
+
+    Args:
+        findings: Findings whose ``file_path`` is the file ``source`` was read from
+        source: The file's content
+        rel: The file's path relative to the scan root, POSIX-style
+    """
+    if not findings:
+        return
+    lines = source.decode("utf-8", errors="replace").splitlines()
+    scopes = line_scopes(lines)
+    seen: Counter = Counter()
+    for f in sorted(findings, key=lambda f: int(f.get("line") or 0)):
+        i = int(f.get("line") or 0) - 1
+        snippet = normalize(lines[i]) if 0 <= i < len(lines) else ""
+        scope = scopes[i] if 0 <= i < len(scopes) else ""
+        key = (f.get("rule_id"), scope, snippet)
+        seen[key] += 1
+        raw = f"{rel}:{f.get('rule_id')}:{scope}:{snippet}:{seen[key]}"
+        f[CONTEXT_FIELD] = hashlib.sha256(raw.encode("utf-8")).hexdigest()
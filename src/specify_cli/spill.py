@@ -0,0 +1,217 @@
+"""Bounded-memory finding collections.
+
+Audits of large third-party trees can produce millions of findings. A
+``SpillList`` keeps findings in memory until their serialized size passes
+a threshold, then appends them to a segment file on disk as JSON lines.
+Readers (baseline filtering, the gate, reporters) iterate it sequentially,
+so peak memory stays near the threshold whatever the result size.
+
+With a sort ``key`` every spilled segment is sorted before it is written
+and iteration merges the segments, which is an external merge sort:
+``SpillList(key=canonical_key)`` yields the same order as
+``canonical_order``. Each segment being merged holds a file handle, so
+beyond ``MERGE_FAN_IN`` segments they are first merged in groups into a
+fresh segment file, as many passes as it takes.
+
+``dump_json`` writes documents containing such collections without
+building them in memory.
+"""
+
+from __future__ import annotations
+import heapq
+import json
+import os
+import re
+import tempfile
+import weakref
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from specify_cli.errors import ConfigError
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+MERGE_FAN_IN = 64  # segments merged at once, each with its own file handle
+
+
+def parse_size(value: Union[int, str]) -> int:
+    """Parse a byte size such as ``1048576``, ``"512M"`` or ``"2G"``.
+
+    Raises:
+        ConfigError: Not a positive size
+    """
+    if isinstance(value, int):
+        size = value
+    else:
+        m = re.fullmatch(r"\s*(\d+)\s*([KMG]?)(?:I?B)?\s*", str(value), re.IGNORECASE)
+        if not m:
+            raise ConfigError(f"Invalid size {value!r}; expected bytes or a K/M/G suffix")
+        size = int(m.group(1)) * _UNITS[m.group(2).upper()]
+    if size < 1:
+        raise ConfigError(f"Size must be positive, not {value!r}")
+    return size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class SpillList:
+    """Append-only finding collection that spills to disk past ``max_bytes``.
+
+    Supports ``append``, ``extend``, ``len`` and repeated iteration. The
+    segment file lives in ``directory`` (default: the system temp dir;
+    avoid tmpfs, which is memory) and is removed by ``close`` or when the
+    list is garbage-collected.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        directory: Optional[Path] = None,
+        key: Optional[Callable[[dict], Any]] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.key = key
+        self._buffer: List[dict] = []
+        self._buffered = 0  # serialized bytes held in _buffer
+        self._segments: List[Tuple[int, int]] = []  # (offset, length) of each spilled run
+        self._file: Optional[IO[bytes]] = None
+        self._path: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    @property
+    def spilled(self) -> bool:
+        """True once findings have been written to disk."""
+        return bool(self._segments)
+
+    def append(self, finding: dict) -> None:
+        self._buffer.append(finding)
+        self._buffered += len(json.dumps(finding))
+        self._count += 1
+        if self._buffered > self.max_bytes:
+            self._spill()
+
+    def extend(self, findings: Iterable[dict]) -> None:
+        for f in findings:
+            self.append(f)
+
+    def _open_segment_file(self) -> Tuple[IO[bytes], str]:
+        if self.directory is not None:
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="findings-", suffix=".jsonl", dir=self.directory)
+        return os.fdopen(fd, "w+b"), path
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file, self._path = self._open_segment_file()
+            self._finalizer = weakref.finalize(self, _remove, self._path)
+        rows = sorted(self._buffer, key=self.key) if self.key else self._buffer
+        start = self._file.seek(0, os.SEEK_END)
+        for f in rows:
+            self._file.write(json.dumps(f).encode("utf-8") + b"\n")
+        self._file.flush()
+        self._segments.append((start, self._file.tell() - start))
+        self._buffer = []
+        self._buffered = 0
+
+    def _read(self, offset: int, length: int) -> Iterator[dict]:
+        assert self._path is not None
+        with open(self._path, "rb") as fh:
+            fh.seek(offset)
+            remaining = length
+            while remaining > 0:
+                line = fh.readline()
+                remaining -= len(line)
+                yield json.loads(line)
+
+    def _reduce_segments(self) -> None:
+        """Merge sorted segments in groups until at most ``MERGE_FAN_IN`` remain."""
+        while len(self._segments) > MERGE_FAN_IN:
+            out, path = self._open_segment_file()
+            merged: List[Tuple[int, int]] = []
+            for i in range(0, len(self._segments), MERGE_FAN_IN):
+                group = [self._read(o, n) for o, n in self._segments[i : i + MERGE_FAN_IN]]
+                start = out.tell()
+                for f in heapq.merge(*group, key=self.key):
+                    out.write(json.dumps(f).encode("utf-8") + b"\n")
+                merged.append((start, out.tell() - start))
+            out.flush()
+            # Later spills append to the merged file; the old one is removed
+            assert self._file is not None and self._finalizer is not None
+            self._file.close()
+            self._finalizer()
+            self._file, self._path, self._segments = out, path, merged
+            self._finalizer = weakref.finalize(self, _remove, path)
+
+    def __iter__(self) -> Iterator[dict]:
+        if self.key:
+            self._reduce_segments()
+        runs: List[Iterable[dict]] = [self._read(o, n) for o, n in self._segments]
+        if self.key:
+            runs.append(sorted(self._buffer, key=self.key))
+            # heapq.merge favors earlier runs on ties, so the sort stays stable
+            return iter(heapq.merge(*runs, key=self.key))
+        runs.append(list(self._buffer))
+        return (f for run in runs for f in run)
+
+    def close(self) -> None:
+        """Drop the findings and remove the segment file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._finalizer is not None:
+            self._finalizer()
+        self._buffer = []
+        self._buffered = 0
+        self._segments = []
+        self._count = 0
+
+
+class _Array(list):
+    """Empty list standing in for a lazy iterable inside the JSON encoder.
+
+    The pure-Python encoder (used whenever ``indent`` is set) only tests an
+    array's truth value and iterates it, so the items are never held at once.
+    """
+
+    def __init__(self, items: Iterable[Any]):
+        super().__init__()
+        it = iter(items)
+        self._first = next(it, _Array)
+        self._rest = it
+
+    def __bool__(self) -> bool:
+        return self._first is not _Array
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._first is not _Array:
+            yield self._first
+            yield from self._rest
+
+
+def _array(value: Any) -> Any:
+    try:
+        return _Array(value)
+    except TypeError:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_json(doc: Any, fh: IO[str], indent: int = 2) -> None:
+    """Write ``doc`` like ``json.dump(doc, fh, indent=indent)``, streaming collections.
+
+    Any iterable that is not a list (a ``SpillList``, a generator) is
+    written as an array, one item at a time.
+    """
+    for chunk in json.JSONEncoder(indent=indent, default=_array).iterencode(doc):
+        fh.write(chunk)
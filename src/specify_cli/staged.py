@@ -0,0 +1,112 @@
+"""Audit of the git index (what a commit would contain).
+
+Staged content can differ from the working tree, so files are never read
+from disk: the staged paths come from one ``git diff --cached`` call and
+their blobs stream through one ``git cat-file --batch`` process into
+analyzers that scan in-memory buffers.
+"""
+
+from __future__ import annotations
+import hashlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from specify_cli.analyzers.registry import AnalyzerContext, AnalyzerPlugin
+from specify_cli.baseline import filter_with_baseline, stamp_fingerprints
+from specify_cli.discovery import in_scope
+from specify_cli.gitutils import iter_staged_blobs, staged_python_files
+from specify_cli.logging import get_logger
+from specify_cli.result_cache import CACHE_DIR, ResultCache
+from specify_cli.sharding import canonical_order
+
+log = get_logger(__name__)
+
+
+@dataclass
+class StagedResult:
+    """Findings for the staged snapshot plus what was scanned."""
+
+    findings: List[dict] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    suppressed: int = 0
+    cached: int = 0
+    seconds: float = 0.0
+
+
+def scan_staged(
+    root: Path,
+    plugins: List[AnalyzerPlugin],
+    exclude_globs: Optional[List[str]] = None,
+    baseline: Optional[Set[str]] = None,
+    use_cache: bool = True,
+) -> StagedResult:
+    """Scan the staged version of every in-scope Python file.
+
+    Args:
+        root: Top-level directory of the work tree
+        plugins: Analyzers to run; only ``in_memory`` file analyzers are used
+        exclude_globs: Exclude patterns from config
+        baseline: Fingerprints to suppress, or None to report everything
+        use_cache: Reuse per-file results for identical content
+
+    Returns:
+        StagedResult with findings reported under ``root / <path>``
+
+    Raises:
+        GitError: The index could not be read
+    """
+    start = time.monotonic()
+    root = Path(root)
+    excludes = exclude_globs or []
+    result = StagedResult()
+    result.files = [rel for rel in staged_python_files(root) if in_scope(rel, excludes)]
+    if not result.files or not plugins:
+        result.seconds = time.monotonic() - start
+        return result
+
+    buffers: Dict[str, bytes] = {}
+    digests: Dict[str, str] = {}
+    for rel, data in iter_staged_blobs(root, result.files):
+        name = str(root / rel)
+        buffers[name] = data
+        digests[name] = hashlib.sha256(data).hexdigest()
+
+    cache = ResultCache(root / CACHE_DIR) if use_cache else None
+    found: Dict[str, List[dict]] = {name: [] for name in buffers}
+    for plugin in plugins:
+        if plugin.scope != "file" or not plugin.in_memory:
+            log.debug(f"Skipping {plugin.name}: cannot scan in-memory buffers")
+            continue
+        version = plugin.version()
+        todo: Dict[str, bytes] = {}
+        for name, data in buffers.items():
+            if cache is not None and plugin.cacheable:
+                hit = cache.get(ResultCache.key(plugin.name, version, digests[name]), name)
+                if hit is not None:
+                    found[name] += hit
+                    result.cached += 1
+                    continue
+            todo[name] = data
+        if not todo:
+            continue
+        ctx = AnalyzerContext(root=root, exclude_globs=excludes, buffers=todo)
+        fresh: Dict[str, List[dict]] = {name: [] for name in todo}
+        for f in plugin.load()(ctx):
+            fresh.setdefault(str(f.get("file_path")), []).append(f)
+        for name, items in fresh.items():
+            if cache is not None and plugin.cacheable and name in todo:
+                cache.put(ResultCache.key(plugin.name, version, digests[name]), items)
+            found.setdefault(name, []).extend(items)
+
+    for name, items in found.items():
+        stamp_fingerprints(items, source=buffers.get(name), path=name, root=root)
+    flat = [f for name in found for f in found[name]]
+    if baseline is not None:
+        kept = filter_with_baseline(flat, baseline)
+        result.suppressed = len(flat) - len(kept)
+        flat = kept
+    result.findings = canonical_order(flat)
+    result.seconds = time.monotonic() - start
+    return result
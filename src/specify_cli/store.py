@@ -1,10 +1,11 @@
 """Storage for analysis run history."""
 
 from __future__ import annotations
-import json
 from pathlib import Path
 from typing import Dict
 
+from specify_cli.spill import dump_json
+
 
 def save_last_run(data: Dict, out_dir: Path) -> Path:
     """Save last run data for delta reporting.
@@ -18,5 +19,6 @@ def save_last_run(data: Dict, out_dir: Path) -> Path:
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     p = out_dir / "last_run.json"
-    p.write_text(json.dumps(data, indent=2))
+    with open(p, "w") as fh:
+        dump_json(data, fh)
     return p
@@ -0,0 +1,316 @@
+"""Resident watch session for incremental audits.
+
+Keeps analyzers imported, the baseline loaded and per-file results in
+memory, and re-scans only files whose modification time or size changed.
+On Linux, inotify wakes the loop as soon as a watched directory changes;
+elsewhere (or if inotify is unavailable) the tree is polled.
+"""
+
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+from specify_cli.analyzers.registry import AnalyzerContext, AnalyzerPlugin
+from specify_cli.baseline import (
+    BASELINE_PATH,
+    NO_SOURCE,
+    baseline_stamp,
+    close_baseline,
+    filter_with_baseline,
+    finding_fingerprint,
+    load_baseline,
+    stamp_fingerprints,
+)
+from specify_cli.discovery import in_scope, iter_python_files
+from specify_cli.logging import get_logger
+from specify_cli.result_cache import CACHE_DIR, ResultCache
+from specify_cli.runner import group_by_file
+from specify_cli.sharding import canonical_order
+
+log = get_logger(__name__)
+
+FileSig = Tuple[int, int]  # (mtime_ns, size)
+
+
+def snapshot(root: Path, exclude_globs: Optional[List[str]] = None) -> Dict[str, FileSig]:
+    """Stat every Python file in scope, keyed by path relative to ``root``."""
+    out: Dict[str, FileSig] = {}
+    for p in iter_python_files(root, exclude_globs):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        out[str(p.relative_to(root))] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def diff_snapshots(old: Dict[str, FileSig], new: Dict[str, FileSig]) -> Tuple[List[str], List[str]]:
+    """Return ``(changed, removed)``; changed includes added files."""
+    changed = sorted(rel for rel, sig in new.items() if old.get(rel) != sig)
+    removed = sorted(set(old) - set(new))
+    return changed, removed
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify, used only as a wake-up signal."""
+
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+    def __init__(self, libc: ctypes.CDLL, fd: int):
+        self._libc = libc
+        self.fd = fd
+        self.watched: Set[str] = set()
+
+    @classmethod
+    def create(cls) -> Optional["_Inotify"]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def watch(self, directories: Iterable[Path]) -> None:
+        for d in directories:
+            key = str(d)
+            if key in self.watched:
+                continue
+            if self._libc.inotify_add_watch(self.fd, os.fsencode(key), self.MASK) >= 0:
+                self.watched.add(key)
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self.fd, 65536):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ChangeWaiter:
+    """Blocks until the tree may have changed."""
+
+    def __init__(self, use_inotify: bool = True):
+        self._inotify = _Inotify.create() if use_inotify else None
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    def track(self, root: Path, rels: Iterable[str]) -> None:
+        """Watch the root and every directory holding a tracked file."""
+        if self._inotify:
+            self._inotify.watch({root} | {(root / rel).parent for rel in rels})
+
+    def wait(self, interval: float) -> None:
+        """Return after a change notification or ``interval`` seconds.
+
+        With inotify, files in directories created since the last ``track``
+        are still picked up by the next interval's stat pass.
+        """
+        if self._inotify:
+            if self._inotify.wait(interval):
+                time.sleep(0.02)  # let editors finish multi-step saves
+                self._inotify.wait(0)
+        else:
+            time.sleep(interval)
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+
+
+@dataclass
+class Delta:
+    """Changes in findings after one incremental scan."""
+
+    files: List[str]
+    added: List[dict] = field(default_factory=list)
+    fixed: List[dict] = field(default_factory=list)
+    total: int = 0
+    seconds: float = 0.0
+
+
+class WatchSession:
+    """Warm analyzer state for a project, updated file by file."""
+
+    def __init__(
+        self,
+        root: Path,
+        plugins: List[AnalyzerPlugin],
+        exclude_globs: Optional[List[str]] = None,
+        baseline_path: Optional[Path] = BASELINE_PATH,
+        use_cache: bool = True,
+        shared_baseline: Optional[Path] = None,
+    ):
+        """Import analyzers and load the baseline once.
+
+        Args:
+            root: Project root
+            plugins: File-scope analyzer plugins to keep resident
+            exclude_globs: Exclude patterns from config
+            baseline_path: Baseline to filter with, or None to report everything
+            use_cache: Seed the initial scan from the on-disk result cache
+            shared_baseline: Organization-wide baseline consulted with ``baseline_path``
+        """
+        self.root = Path(root)
+        self.plugins = [p for p in plugins if p.scope == "file"]
+        self.exclude_globs = exclude_globs or []
+        self.baseline_path = baseline_path
+        self.shared_baseline = shared_baseline
+        self.cache = ResultCache(self.root / CACHE_DIR) if use_cache else None
+        self._runners = {p.name: p.load() for p in self.plugins}
+        self._versions = {p.name: p.version() for p in self.plugins}
+        self._baseline: Collection[str] = set()
+        self._baseline_sig: Optional[FileSig] = None
+        self.snap: Dict[str, FileSig] = {}
+        self.results: Dict[str, List[dict]] = {}  # rel -> findings from all plugins
+        self._reload_baseline()
+
+    def _baseline_stat(self) -> Optional[FileSig]:
+        if self.baseline_path is None:
+            return None
+        stamp = baseline_stamp(self.baseline_path)  # JSON, journal or shard manifest
+        return None if stamp == NO_SOURCE else stamp
+
+    def _reload_baseline(self) -> bool:
+        sig = self._baseline_stat()
+        if sig == self._baseline_sig:
+            return False
+        self._baseline_sig = sig
+        old = self._baseline
+        self._baseline = (
+            load_baseline(self.baseline_path, root=self.root, shared=self.shared_baseline)
+            if self.baseline_path
+            else set()
+        )
+        close_baseline(old)
+        return True
+
+    def close(self) -> None:
+        """Release the baseline; the session must not be polled afterwards."""
+        close_baseline(self._baseline)
+        self._baseline = set()
+
+    def start(self) -> int:
+        """Scan everything once; returns the number of files tracked."""
+        self.snap = snapshot(self.root, self.exclude_globs)
+        self._scan(list(self.snap))
+        return len(self.snap)
+
+    def findings(self) -> List[dict]:
+        """Current findings across all files, baseline-filtered, in report order."""
+        flat = [f for rel in self.results for f in self.results[rel]]
+        return canonical_order(filter_with_baseline(flat, self._baseline))
+
+    def poll(self, rels: Optional[Iterable[str]] = None) -> Optional[Delta]:
+        """Re-scan files changed since the last call.
+
+        Args:
+            rels: Only check these paths (relative to the root) instead of
+                statting the whole tree
+
+        Returns:
+            Delta of findings, or None if nothing in scope changed
+        """
+        start = time.monotonic()
+        if rels is None:
+            new = snapshot(self.root, self.exclude_globs)
+        else:
+            new = dict(self.snap)
+            for rel in rels:
+                sig = self._stat(rel) if in_scope(rel, self.exclude_globs) else None
+                if sig is None:
+                    new.pop(rel, None)
+                else:
+                    new[rel] = sig
+        changed, removed = diff_snapshots(self.snap, new)
+        baseline_changed = self._reload_baseline()
+        if not changed and not removed and not baseline_changed:
+            return None
+
+        before = {rel: self._visible(self.results.get(rel, [])) for rel in changed + removed}
+        self.snap = new
+        for rel in removed:
+            self.results.pop(rel, None)
+        self._scan(changed)
+
+        delta = Delta(files=changed + removed)
+        for rel in delta.files:
+            old, cur = before[rel], self._visible(self.results.get(rel, []))
+            delta.added += [f for fp, f in cur.items() if fp not in old]
+            delta.fixed += [f for fp, f in old.items() if fp not in cur]
+        delta.total = len(self.findings())
+        delta.seconds = time.monotonic() - start
+        return delta
+
+    def _stat(self, rel: str) -> Optional[FileSig]:
+        try:
+            st = (self.root / rel).stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _visible(self, findings: List[dict]) -> Dict[str, dict]:
+        return {finding_fingerprint(f): f for f in filter_with_baseline(findings, self._baseline)}
+
+    def _scan(self, rels: List[str]) -> None:
+        if not rels:
+            return
+        results: Dict[str, List[dict]] = {rel: [] for rel in rels}
+        for plugin in self.plugins:
+            todo: List[Tuple[Path, str]] = []
+            digests: Dict[str, str] = {}
+            for rel in rels:
+                path = self.root / rel
+                if self.cache is not None and plugin.cacheable:
+                    try:
+                        digests[rel] = hashlib.sha256(path.read_bytes()).hexdigest()
+                    except OSError:
+                        continue
+                    hit = self.cache.get(self._key(plugin, digests[rel]), str(path))
+                    if hit is not None:
+                        results[rel] += hit
+                        continue
+                todo.append((path, rel))
+            if not todo:
+                continue
+            ctx = AnalyzerContext(
+                root=self.root, files=[p for p, _ in todo], exclude_globs=self.exclude_globs
+            )
+            per_file, orphans = group_by_file(self._runners[plugin.name](ctx), todo)
+            for rel, found in per_file.items():
+                if self.cache is not None and plugin.cacheable and not orphans:
+                    self.cache.put(self._key(plugin, digests[rel]), found)
+                results[rel] += found
+            if orphans:
+                results[todo[0][1]] += orphans
+        for rel, found in results.items():
+            path = self.root / rel
+            try:
+                source: Optional[bytes] = path.read_bytes()
+            except OSError:
+                source = None
+            stamp_fingerprints(found, source=source, path=str(path), root=self.root)
+        self.results.update(results)
+
+    def _key(self, plugin: AnalyzerPlugin, digest: str) -> str:
+        return ResultCache.key(plugin.name, self._versions[plugin.name], digest)
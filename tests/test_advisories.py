@@ -0,0 +1,223 @@
+"""Test offline advisory database and delta updates."""
+
+import json
+from pathlib import Path
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app
+from specify_cli.advisories import Advisory, AdvisoryStore
+from specify_cli.analyzers.safety_analyzer import SafetyAnalyzer
+from specify_cli.api import audit
+from specify_cli.errors import AdvisoryDBError
+
+
+runner = CliRunner()
+
+
+def _adv(adv_id, package, specs, fix=None, severity="HIGH"):
+    return {
+        "id": adv_id,
+        "package": package,
+        "vulnerable_specs": specs,
+        "fix_version": fix,
+        "severity": severity,
+    }
+
+
+@pytest.fixture
+def dump(tmp_path):
+    """Create a full advisory dump at version 1."""
+    p = tmp_path / "dump.json"
+    p.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "advisories": [
+                    _adv("A-1", "Flask", ["<2.2.5"], "2.2.5"),
+                    _adv("A-2", "requests", [">=2.0,<2.31.0"], "2.31.0", "MEDIUM"),
+                    _adv("A-3", "jinja2", ["<3.1.3"], "3.1.3"),
+                ],
+            }
+        )
+    )
+    return p
+
+
+@pytest.fixture
+def store(tmp_path, dump):
+    """Advisory store populated from the dump."""
+    s = AdvisoryStore(tmp_path / "adv.db")
+    s.import_full(dump)
+    yield s
+    s.close()
+
+
+def _write_delta(tmp_path, name, **data):
+    p = tmp_path / name
+    p.write_text(json.dumps(data))
+    return p
+
+
+class TestAdvisory:
+    """Test advisory record validation and matching."""
+
+    def test_affects_any_range(self):
+        """A version is affected if it falls in any vulnerable range."""
+        adv = Advisory.from_dict(_adv("X", "pkg", ["<1.0", ">=2.0,<2.1"]))
+        assert adv.affects("0.9")
+        assert adv.affects("2.0.5")
+        assert not adv.affects("1.5")
+
+    def test_invalid_specifier_rejected(self):
+        """Unparseable specifiers are rejected at load time."""
+        with pytest.raises(AdvisoryDBError):
+            Advisory.from_dict(_adv("X", "pkg", ["not a spec"]))
+
+    def test_package_name_normalized(self):
+        """Package names are stored PEP 503-normalized."""
+        assert Advisory.from_dict(_adv("X", "Zope.Interface", ["<1"])).package == "zope-interface"
+
+
+class TestAdvisoryStore:
+    """Test import, delta application and result caching."""
+
+    def test_import_sets_version(self, store):
+        """Full import stamps the dump version."""
+        assert store.version == 1
+        assert store.stats()["advisories"] == 3
+
+    def test_check_matches_pins(self, store):
+        """Pinned versions are matched against advisory ranges."""
+        assert [a.advisory_id for a in store.check("flask", "2.0.0")] == ["A-1"]
+        assert store.check("flask", "2.3.0") == []
+
+    def test_delta_applies_added_changed_withdrawn(self, tmp_path, store):
+        """Deltas add, change and withdraw advisories and bump the version."""
+        delta = _write_delta(
+            tmp_path,
+            "d2.json",
+            base_version=1,
+            version=2,
+            added=[_adv("A-4", "urllib3", ["<1.26.18"], "1.26.18")],
+            changed=[_adv("A-1", "flask", ["<2.3.2"], "2.3.2")],
+            withdrawn=["A-3"],
+        )
+        r = store.apply_delta(delta)
+
+        assert store.version == 2
+        assert (r.added, r.changed, r.withdrawn) == (1, 1, 1)
+        assert r.touched_packages == {"urllib3", "flask", "jinja2"}
+        assert [a.advisory_id for a in store.check("flask", "2.3.0")] == ["A-1"]
+        assert store.check("jinja2", "3.0.0") == []
+
+    def test_delta_invalidates_only_touched_packages(self, tmp_path, store):
+        """Cached results survive a delta unless their package was touched."""
+        store.check("flask", "2.0.0")
+        store.check("requests", "2.25.0")
+
+        delta = _write_delta(
+            tmp_path,
+            "d2.json",
+            base_version=1,
+            version=2,
+            changed=[_adv("A-1", "flask", ["<2.3.2"], "2.3.2")],
+        )
+        r = store.apply_delta(delta)
+
+        assert r.invalidated_results == 1
+        rows = dict(store._conn.execute("SELECT package, db_version FROM dep_results").fetchall())
+        assert rows == {"requests": 2}
+
+    def test_delta_version_mismatch_rejected(self, tmp_path, store):
+        """A delta cut from another version is refused."""
+        delta = _write_delta(tmp_path, "d.json", base_version=5, version=6)
+        with pytest.raises(AdvisoryDBError):
+            store.apply_delta(delta)
+        assert store.version == 1
+
+    def test_delta_is_transactional(self, tmp_path, store, monkeypatch):
+        """A failure mid-delta leaves the store untouched."""
+        delta = _write_delta(
+            tmp_path,
+            "d2.json",
+            base_version=1,
+            version=2,
+            withdrawn=["A-1"],
+            added=[_adv("A-9", "pkg", ["<1"])],
+        )
+
+        def boom(version):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(store, "_set_version", boom)
+        with pytest.raises(RuntimeError):
+            store.apply_delta(delta)
+
+        assert store.version == 1
+        assert [a.advisory_id for a in store.advisories_for("flask")] == ["A-1"]
+        assert store.advisories_for("pkg") == []
+
+
+class TestOfflineScan:
+    """Test SafetyAnalyzer against the offline store."""
+
+    def test_offline_scan_uses_manifest_pins(self, tmp_path, store):
+        """Pins in requirements.txt are checked without the safety CLI."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "requirements.txt").write_text("Flask==2.0.0\nrequests==2.31.0\njinja2>=3\n")
+
+        findings = SafetyAnalyzer(proj, advisory_db=store.path).run()
+
+        assert [(f.package, f.advisory_id) for f in findings] == [("Flask", "A-1")]
+        assert findings[0].fix_version == "2.2.5"
+
+    def test_offline_scan_missing_db(self, tmp_path):
+        """A missing database is reported clearly."""
+        with pytest.raises(FileNotFoundError):
+            SafetyAnalyzer(tmp_path, advisory_db=tmp_path / "none.db").run()
+
+
+class TestAdvisoriesCommand:
+    """Test advisories CLI."""
+
+    def test_import_and_update(self, tmp_path, dump):
+        """Import then update through the CLI."""
+        db = tmp_path / "cli.db"
+        result = runner.invoke(app, ["advisories", "import", str(dump), "--db", str(db)])
+        assert result.exit_code == 0, result.output
+
+        delta = _write_delta(tmp_path, "d2.json", base_version=1, version=2, withdrawn=["A-2"])
+        result = runner.invoke(app, ["advisories", "update", str(delta), "--db", str(db)])
+        assert result.exit_code == 0, result.output
+
+        with AdvisoryStore(db) as s:
+            assert s.version == 2
+
+    def test_update_out_of_order_fails(self, tmp_path, dump):
+        """Out-of-order deltas exit with code 2."""
+        db = tmp_path / "cli.db"
+        runner.invoke(app, ["advisories", "import", str(dump), "--db", str(db)])
+        delta = _write_delta(tmp_path, "d3.json", base_version=2, version=3)
+        result = runner.invoke(app, ["advisories", "update", str(delta), "--db", str(db)])
+        assert result.exit_code == 2
+
+    def test_database_follows_project_path(self, tmp_path, dump, monkeypatch):
+        """Commands run from another directory share the project's database."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "requirements.txt").write_text("flask==2.0.0\n")
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+
+        result = runner.invoke(app, ["advisories", "import", str(dump), "--path", str(project)])
+        assert result.exit_code == 0, result.output
+        assert (project / ".speckit" / "advisories.db").exists()
+        assert not (elsewhere / ".speckit").exists()
+
+        found = audit(
+            project, bandit=False, advisory_db=Path(".speckit/advisories.db"), use_cache=False
+        )
+        assert [d["advisory_id"] for d in found.dependencies] == ["A-1"]
+        assert not (elsewhere / ".speckit").exists()
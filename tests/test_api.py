@@ -0,0 +1,191 @@
+"""Test the library-level audit API."""
+
+import json
+import time
+import pytest
+from specify_cli import runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.api import AuditError, audit, last_run_writer, report_writer
+from specify_cli.baseline import BASELINE_PATH, load_baseline, write_baseline
+
+
+def _scan(ctx):
+    """Stand-in analyzer flagging files that call eval()."""
+    return [
+        {
+            "rule_id": "B307",
+            "file_path": str(p),
+            "line": 2,
+            "severity": "MEDIUM",
+            "message": "eval",
+        }
+        for p in ctx.files
+        if "eval(" in p.read_text()
+    ]
+
+
+def _slow(ctx):
+    """Stand-in project-level analyzer that takes a while."""
+    time.sleep(3)
+    return []
+
+
+def _vulnerable(ctx):
+    """Stand-in dependency analyzer reporting one HIGH advisory right away."""
+    return [
+        {"package": "flask", "installed_version": "0.5", "advisory_id": "1", "severity": "HIGH"}
+    ]
+
+
+def _slow_scan(ctx):
+    """``_scan``, slowly."""
+    time.sleep(0.1)
+    return _scan(ctx)
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    plugins = {
+        "bandit": AnalyzerPlugin("bandit", f"{__name__}:_scan", cost="io"),
+        "slow": AnalyzerPlugin("slow", f"{__name__}:_slow", scope="project", cost="io"),
+        "slow-bandit": AnalyzerPlugin("slow-bandit", f"{__name__}:_slow_scan", cost="io"),
+        "deps": AnalyzerPlugin(
+            "deps", f"{__name__}:_vulnerable", scope="project", cost="io", kind="dependency"
+        ),
+    }
+    monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+    monkeypatch.setattr("specify_cli.api.discover_plugins", lambda: plugins)
+
+
+class TestAudit:
+    """Test audit() results and reporters."""
+
+    def test_result_without_reporters(self, tmp_path, plugins):
+        (tmp_path / "a.py").write_text("x = 1\neval('1')\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+
+        result = audit(tmp_path, safety=False, fail_on="MEDIUM")
+
+        assert result.exit_code == 1 and not result.passed
+        assert [f["file_path"] for f in result] == [str(tmp_path / "a.py")]
+        assert result.table() == [("MEDIUM", "B307", f"{tmp_path / 'a.py'}:2", "eval")]
+        assert "bandit" in result.timings
+        assert result.reports == []
+        assert not (tmp_path / ".speckit" / "analysis").exists()
+
+    def test_threshold_from_config(self, tmp_path, plugins):
+        (tmp_path / "a.py").write_text("eval('1')\n")
+        assert audit(tmp_path, safety=False).passed  # config default is HIGH
+
+    def test_reporters_write_cli_outputs(self, tmp_path, plugins):
+        (tmp_path / "a.py").write_text("eval('1')\n")
+        out = tmp_path / "out"
+
+        result = audit(
+            tmp_path,
+            safety=False,
+            reporters=[report_writer("sarif", out), last_run_writer(out)],
+        )
+
+        assert result.reports == [out / "report.sarif", out / "last_run.json"]
+        sarif = json.loads((out / "report.sarif").read_text())
+        assert sarif["runs"][0]["results"][0]["ruleId"] == "B307"
+        assert json.loads((out / "last_run.json").read_text())["code"] == result.code
+
+    def test_sharded_report_name_and_no_last_run(self, tmp_path, plugins):
+        (tmp_path / "a.py").write_text("eval('1')\n")
+        out = tmp_path / "out"
+
+        result = audit(
+            tmp_path,
+            safety=False,
+            shard=(0, 1),
+            reporters=[report_writer("json", out), last_run_writer(out)],
+        )
+
+        assert result.reports == [out / "analysis.shard-0-of-1.json"]
+        assert json.loads(result.reports[0].read_text())["shard"] == {"index": 0, "count": 1}
+
+    def test_baseline_closed_after_audit(self, tmp_path, plugins, monkeypatch):
+        (tmp_path / "a.py").write_text("x = 1\neval('1')\n")
+        write_baseline(audit(tmp_path, safety=False).code, tmp_path / BASELINE_PATH)
+        loaded = []
+
+        def _load(*args, **kwargs):
+            loaded.append(load_baseline(*args, **kwargs))
+            return loaded[-1]
+
+        monkeypatch.setattr("specify_cli.api.load_baseline", _load)
+        result = audit(tmp_path, safety=False)
+
+        assert result.code == [] and result.suppressed == 1
+        assert len(loaded) == 1 and len(loaded[0]) == 0  # unmapped once the run finished
+
+    def test_strict_requires_analyzers(self, tmp_path, plugins):
+        with pytest.raises(AuditError):
+            audit(tmp_path, safety=False, analyzers=["missing"], strict=True)
+
+
+class TestGate:
+    """Test max_findings and fail-fast gating."""
+
+    def test_max_findings_from_config(self, tmp_path, plugins):
+        for i in range(3):
+            (tmp_path / f"m{i}.py").write_text("eval('1')\n")
+        (tmp_path / ".speckit.toml").write_text("[ci]\nmax_findings = 2\n")
+
+        result = audit(tmp_path, safety=False)
+
+        assert result.exit_code == 1 and len(result.code) == 3
+        assert result.failure == "Exceeded maximum findings limit (3 > 2)"
+        assert not result.failed_fast
+        assert audit(tmp_path, safety=False, max_findings=-1).passed
+
+    def test_fail_fast_cancels_and_writes_partial_report(self, tmp_path, plugins):
+        for i in range(40):
+            (tmp_path / f"m{i:02}.py").write_text("eval('1')\n")
+        out = tmp_path / "out"
+
+        result = audit(
+            tmp_path,
+            safety=False,
+            analyzers=["slow"],
+            use_cache=False,
+            fail_on="MEDIUM",
+            fail_fast=True,
+            reporters=[report_writer("json", out), last_run_writer(out)],
+        )
+
+        assert result.exit_code == 1 and result.failed_fast and result.partial
+        assert 0 < len(result.code) < 40
+        assert result.incomplete == ["slow"]
+        assert result.seconds < 2.5  # did not wait for the project-level analyzer
+        report = json.loads((out / "analysis.json").read_text())
+        assert report["partial"] is True
+        assert report["failed_fast"] == result.failure
+        assert result.reports == [out / "analysis.json"]  # partial: last_run.json not replaced
+
+    def test_fail_fast_on_dependency_finding(self, tmp_path, plugins):
+        """A dependency breach cancels the run while files are still being analyzed."""
+        for i in range(40):
+            (tmp_path / f"m{i:02}.py").write_text("x = 1\n")
+
+        result = audit(
+            tmp_path,
+            bandit=False,
+            safety=False,
+            analyzers=["slow-bandit", "deps"],
+            use_cache=False,
+            max_workers=1,
+            fail_on="HIGH",
+            fail_fast=True,
+        )
+
+        assert result.exit_code == 1 and result.failed_fast and result.partial
+        assert [d["package"] for d in result.dependencies] == ["flask"]
+        assert result.seconds < 2.0  # 40 files at 0.1s per batch were not all analyzed
+
+    def test_fail_fast_completes_when_gate_passes(self, tmp_path, plugins):
+        (tmp_path / "a.py").write_text("eval('1')\n")
+        result = audit(tmp_path, safety=False, fail_on="HIGH", fail_fast=True)
+        assert result.passed and not result.failed_fast and not result.partial
@@ -0,0 +1,156 @@
+"""Test the asyncio runner and Safety's async subprocess path."""
+
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import sys
+import pytest
+from specify_cli import runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.analyzers.safety_analyzer import SafetyAnalyzer
+from specify_cli.async_runner import run_all_async
+from specify_cli.runner import RunConfig, run_all
+
+CLEANED_UP = []
+
+
+def _scan(ctx):
+    """Stand-in analyzer with one finding per file."""
+    return [{"rule_id": "X1", "file_path": str(p), "line": 1, "message": "m"} for p in ctx.files]
+
+
+async def _hang(ctx):
+    """Stand-in external tool that never finishes."""
+    try:
+        await asyncio.sleep(60)
+    finally:
+        CLEANED_UP.append(ctx.root)
+    return []
+
+
+def _py(code: str) -> str:
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    plugins = {
+        "bandit": AnalyzerPlugin("bandit", f"{__name__}:_scan", cost="io"),
+        "tool": AnalyzerPlugin(
+            "tool",
+            f"{__name__}:_scan",
+            scope="project",
+            async_target=f"{__name__}:_hang",
+        ),
+    }
+    monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+    CLEANED_UP.clear()
+
+
+def _tree(tmp_path, n=5):
+    for i in range(n):
+        (tmp_path / f"m{i}.py").write_text(f"x = {i}\n")
+
+
+class TestRunAllAsync:
+    """Test streaming, parity with run_all and cancellation."""
+
+    def test_collect_matches_run_all(self, tmp_path, plugins):
+        _tree(tmp_path)
+        cfg = RunConfig(path=tmp_path, use_safety=False, use_cache=False, batch_size=2)
+
+        results = asyncio.run(run_all_async(cfg).collect())
+
+        assert results == run_all(cfg)
+        assert "bandit" in results.timings
+
+    def test_streams_per_file_in_order(self, tmp_path, plugins):
+        _tree(tmp_path)
+        sunk = []
+        cfg = RunConfig(
+            path=tmp_path, use_safety=False, batch_size=2, sinks=[lambda n, f: sunk.append(n)]
+        )
+
+        async def _consume():
+            return [(name, fs[0]["file_path"]) async for name, fs in run_all_async(cfg)]
+
+        chunks = asyncio.run(_consume())
+        assert chunks == [("bandit", str(tmp_path / f"m{i}.py")) for i in range(5)]
+        assert sunk == ["bandit"] * 5
+        again = run_all_async(cfg)
+        asyncio.run(again.collect())
+        assert again.results.cached == 5
+
+    def test_deadline_cancels_async_plugin(self, tmp_path, plugins):
+        _tree(tmp_path, 1)
+        cfg = RunConfig(path=tmp_path, use_safety=False, analyzers=["tool"], timeout=0.3)
+
+        results = asyncio.run(run_all_async(cfg).collect())
+
+        assert results.incomplete == ["tool"]
+        assert "tool" not in results
+        assert len(results["bandit"]) == 1
+        assert CLEANED_UP == [tmp_path]
+
+    def test_closing_early_cancels_outstanding_work(self, tmp_path, plugins):
+        _tree(tmp_path, 1)
+        cfg = RunConfig(path=tmp_path, use_safety=False, analyzers=["tool"])
+
+        async def _first():
+            run = run_all_async(cfg)
+            async for chunk in run:
+                await run.aclose()
+                return chunk
+
+        assert asyncio.run(_first())[0] == "bandit"
+        assert CLEANED_UP == [tmp_path]
+
+
+class TestSafetyAsync:
+    """Test safety on asyncio.create_subprocess_exec."""
+
+    def test_stream_builds_findings(self, tmp_path):
+        payload = {"vulnerabilities": [{"package_name": "flask", "vulnerability_id": "1"}]}
+        code = f"import sys; sys.stdout.write({json.dumps(json.dumps(payload))}); sys.exit(1)"
+
+        findings = asyncio.run(SafetyAnalyzer(tmp_path)._run_stream_async(_py(code)))
+
+        assert [f.package for f in findings] == ["flask"]
+
+    def test_bad_exit_code_raises(self, tmp_path):
+        code = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            asyncio.run(SafetyAnalyzer(tmp_path)._run_stream_async(_py(code)))
+        assert "boom" in exc_info.value.stderr
+
+    def test_timeout_kills_process(self, tmp_path):
+        analyzer = SafetyAnalyzer(tmp_path, timeout=0.3)
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(analyzer._run_stream_async(_py("import time; time.sleep(30)")))
+
+    def test_cancel_kills_process(self, tmp_path, monkeypatch):
+        started = []
+        spawn = asyncio.create_subprocess_exec
+
+        async def _spawn(*args, **kwargs):
+            proc = await spawn(*args, **kwargs)
+            started.append(proc.pid)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", _spawn)
+
+        async def _cancel():
+            task = asyncio.create_task(
+                SafetyAnalyzer(tmp_path)._run_stream_async(_py("import time; time.sleep(30)"))
+            )
+            while not started:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(_cancel())
+        with pytest.raises(ProcessLookupError):
+            os.kill(started[0], 0)  # killed and reaped
@@ -1,7 +1,7 @@
 """Test baseline management functionality."""
 
 import json
-from specify_cli.baseline import Baseline
+from specify_cli.baseline import Baseline, load_baseline
 
 
 class TestBaselineInit:
@@ -386,3 +386,99 @@ class TestGetBaselinedHashes:
         assert len(hashes) == 2
         assert hash1 in hashes
         assert hash2 in hashes
+
+
+class TestJournal:
+    """Test journaled saves, replay and compaction."""
+
+    def _findings(self, n):
+        return [
+            {"file": f"f{i}.py", "line": i, "rule_id": "B101", "message": f"m{i}"} for i in range(n)
+        ]
+
+    def test_save_appends_instead_of_rewriting(self, tmp_path):
+        """Test saves after the first only append to the journal."""
+        baseline_path = tmp_path / "baseline.json"
+        one, two, three = self._findings(3)
+        baseline = Baseline(baseline_path)
+        baseline.add_finding(one)
+        baseline.add_finding(two)
+        baseline.save()
+        snapshot = baseline_path.read_text()
+
+        baseline.add_finding(three)
+        baseline.remove_finding(one)
+        baseline.save()
+
+        assert baseline_path.read_text() == snapshot
+        records = [json.loads(line) for line in baseline.journal_path.read_text().splitlines()]
+        assert [r["op"] for r in records] == ["add", "remove"]
+
+        reloaded = Baseline(baseline_path)
+        assert set(reloaded.findings) == set(baseline.findings)
+        assert reloaded.metadata["finding_count"] == 2
+        assert not reloaded.is_baselined(one)
+        assert set(load_baseline(baseline_path)) == set(baseline.findings)
+
+    def test_threshold_and_explicit_compaction(self, tmp_path):
+        """Test the journal is folded into the snapshot."""
+        baseline_path = tmp_path / "baseline.json"
+        findings = self._findings(4)
+        baseline = Baseline(baseline_path, compact_threshold=2)
+        baseline.add_finding(findings[0])
+        baseline.save()
+        baseline.add_finding(findings[1])
+        baseline.save()
+        assert baseline.journal_path.exists()
+
+        baseline.add_finding(findings[2])
+        baseline.save()  # journal would reach the threshold
+        assert not baseline.journal_path.exists()
+        assert len(json.loads(baseline_path.read_text())["findings"]) == 3
+
+        baseline.add_finding(findings[3])
+        baseline.save()
+        baseline.compact()
+        assert not baseline.journal_path.exists()
+        assert Baseline(baseline_path).findings.keys() == baseline.findings.keys()
+
+    def test_torn_record_is_skipped(self, tmp_path):
+        """Test a record cut short by a crash doesn't hide later ones."""
+        baseline_path = tmp_path / "baseline.json"
+        one, two, three = self._findings(3)
+        baseline = Baseline(baseline_path)
+        baseline.add_finding(one)
+        baseline.save()
+        baseline.add_finding(two)
+        baseline.save()
+        with open(baseline.journal_path, "a") as fh:
+            fh.write('{"op": "add", "fingerp')
+
+        baseline = Baseline(baseline_path)
+        baseline.add_finding(three)
+        baseline.save()
+
+        reloaded = Baseline(baseline_path)
+        assert all(reloaded.is_baselined(f) for f in (one, two, three))
+        assert reloaded.journal_path.read_text().count("\n") == 3
+
+    def test_rematch_moves_entries(self, tmp_path):
+        """Test entries follow findings that moved to another line."""
+        baseline_path = tmp_path / "baseline.json"
+        finding = {"file": "a.py", "line": 3, "rule_id": "B101", "message": "m"}
+        finding["context_fingerprint"] = "c" * 64
+        baseline = Baseline(baseline_path)
+        baseline.add_finding(dict(finding), reason="accepted risk")
+        baseline.save()
+
+        moved = dict(finding, line=7)
+        baseline = Baseline(baseline_path)
+        assert not baseline.is_baselined(moved)
+        assert baseline.rematch([moved]) == 1
+        baseline.save()
+
+        reloaded = Baseline(baseline_path)
+        assert reloaded.is_baselined(moved) and not reloaded.is_baselined(finding)
+        [entry] = reloaded.findings.values()
+        assert entry["reason"] == "accepted risk"
+        assert reloaded.rematch([moved]) == 0
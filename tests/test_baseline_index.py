@@ -0,0 +1,192 @@
+"""Test the compiled baseline index, migration from both JSON formats and shards."""
+
+import hashlib
+import json
+import os
+import pytest
+from specify_cli.baseline import (
+    Baseline,
+    ShardedBaseline,
+    filter_with_baseline,
+    fingerprint,
+    load_baseline,
+    shard_key,
+    write_baseline,
+    write_sharded_baseline,
+)
+from specify_cli.baseline_index import BaselineIndex, index_path, write_index
+
+FINDINGS = [
+    {"file_path": f"src/m{i}.py", "line": i, "rule_id": "B101", "message": "assert"}
+    for i in range(50)
+]
+
+
+def _legacy_hash(f):
+    key = "|".join([f.get("file", ""), str(f.get("line", 0)), f["rule_id"], f["message"]])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class TestBaselineIndex:
+    """Test lookups and the on-disk format."""
+
+    def test_membership(self, tmp_path):
+        fps = [fingerprint(f) for f in FINDINGS]
+        index = BaselineIndex.open(write_index(tmp_path / "b.idx", fps + ["not-hex"]))
+
+        assert len(index) == 50 and all(fp in index for fp in fps)
+        assert fingerprint({"file_path": "other.py"}) not in index
+        assert "not-hex" not in index and 42 not in index
+        assert list(index) == sorted(fps)
+
+    def test_empty_and_closed(self, tmp_path):
+        assert not BaselineIndex() and len(BaselineIndex.build([])) == 0
+        index = BaselineIndex.open(write_index(tmp_path / "b.idx", [fingerprint(FINDINGS[0])]))
+        index.close()
+        assert not index and fingerprint(FINDINGS[0]) not in index
+
+    def test_rejects_other_files(self, tmp_path):
+        (tmp_path / "b.idx").write_bytes(b"{}")
+        with pytest.raises(ValueError):
+            BaselineIndex.open(tmp_path / "b.idx")
+
+
+class TestLoadBaseline:
+    """Test compiling, reusing and rebuilding the index."""
+
+    def test_fingerprint_list_compiles_once(self, tmp_path):
+        path = write_baseline(FINDINGS[:10], tmp_path / "baseline.json")
+        assert index_path(path).exists()
+
+        index = load_baseline(path)
+        assert isinstance(index, BaselineIndex) and len(index) == 10
+        assert filter_with_baseline(FINDINGS, index) == FINDINGS[10:]
+
+        mtime = index_path(path).stat().st_mtime_ns
+        load_baseline(path)
+        assert index_path(path).stat().st_mtime_ns == mtime  # reused, not rebuilt
+
+    def test_rebuilt_when_json_changes(self, tmp_path):
+        path = write_baseline(FINDINGS[:10], tmp_path / "baseline.json")
+        data = json.loads(path.read_text())
+        data["fingerprints"] = [fingerprint(f) for f in FINDINGS[10:15]]
+        path.write_text(json.dumps(data))
+
+        index = load_baseline(path)
+        assert len(index) == 5 and fingerprint(FINDINGS[12]) in index
+
+    def test_missing_or_corrupt(self, tmp_path):
+        assert len(load_baseline(tmp_path / "baseline.json")) == 0
+        path = write_baseline(FINDINGS[:3], tmp_path / "baseline.json")
+        index_path(path).write_bytes(b"garbage")
+        assert len(load_baseline(path)) == 3
+
+    def test_standalone_index(self, tmp_path):
+        fps = [fingerprint(f) for f in FINDINGS[:4]]
+        write_index(tmp_path / "baseline.idx", fps)
+        assert len(load_baseline(tmp_path / "baseline.idx")) == 4
+        assert len(load_baseline(tmp_path / "baseline.json")) == 4  # no JSON: index alone
+
+    def test_read_only_directory_falls_back_to_memory(self, tmp_path):
+        path = write_baseline(FINDINGS[:3], tmp_path / "ro" / "baseline.json")
+        os.remove(index_path(path))
+        os.chmod(path.parent, 0o500)
+        try:
+            if os.access(path.parent, os.W_OK):
+                pytest.skip("running as root")
+            assert len(load_baseline(path)) == 3
+        finally:
+            os.chmod(path.parent, 0o700)
+
+
+class TestMigration:
+    """Test that Baseline files (1.0 keys) use the same fingerprints."""
+
+    def _legacy_file(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        findings = [dict(f, file=f["file_path"]) for f in FINDINGS[:3]]
+        path.write_text(
+            json.dumps(
+                {
+                    "version": "1.0",
+                    "findings": {
+                        _legacy_hash(f): {"finding": f, "reason": "adopted"} for f in findings
+                    },
+                }
+            )
+        )
+        return path
+
+    def test_load_baseline_matches_run_findings(self, tmp_path):
+        index = load_baseline(self._legacy_file(tmp_path))
+        assert filter_with_baseline(FINDINGS, index) == FINDINGS[3:]
+
+    def test_baseline_class_rekeys_on_save(self, tmp_path):
+        path = self._legacy_file(tmp_path)
+        baseline = Baseline(path)
+        legacy = dict(FINDINGS[0], file=FINDINGS[0]["file_path"])
+        assert baseline.is_baselined(legacy)  # by its 1.0 key
+
+        baseline.save()
+
+        data = json.loads(path.read_text())
+        assert data["version"] == "2.0"
+        assert set(data["findings"]) == {fingerprint(f) for f in FINDINGS[:3]}
+        assert set(load_baseline(path)) == set(data["findings"])
+        assert Baseline(path).is_baselined(FINDINGS[2])
+
+
+class TestShardedBaseline:
+    """Test per-directory shards opened on demand."""
+
+    def _findings(self, root):
+        rels = ["src/a.py", "src/pkg/b.py", "tests/t.py", "setup.py"]
+        return [
+            {"file_path": str(root / rel), "line": 1, "rule_id": "B101", "message": "m"}
+            for rel in rels
+        ]
+
+    def test_shard_key(self):
+        assert shard_key("src/pkg/b.py") == "src"
+        assert shard_key("src/pkg/b.py", depth=2) == "src/pkg"
+        assert shard_key("src/a.py", depth=2) == "src"
+        assert shard_key("setup.py") == "@root"
+
+    def test_only_shards_with_findings_are_opened(self, tmp_path):
+        path = tmp_path / ".speckit" / "baseline.json"
+        findings = self._findings(tmp_path)
+        directory = write_sharded_baseline(findings, path, root=tmp_path)
+
+        manifest = json.loads((directory / "manifest.json").read_text())
+        assert sorted(manifest["shards"]) == ["@root", "src", "tests"]
+        assert manifest["shards"]["src"]["count"] == 2
+
+        baseline = load_baseline(path, root=tmp_path)
+        assert isinstance(baseline, ShardedBaseline) and len(baseline) == 4
+        new = dict(findings[0], line=2)
+        assert filter_with_baseline([findings[1], new], baseline) == [new]
+        assert baseline.loaded == ["src"]
+        assert fingerprint(findings[2]) in baseline  # a bare fingerprint opens every shard
+        assert baseline.loaded == ["@root", "src", "tests"]
+
+    def test_rewrite_drops_stale_shards(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        findings = self._findings(tmp_path)
+        write_sharded_baseline(findings, path, root=tmp_path, depth=2)
+        assert (tmp_path / "baseline" / "src%2Fpkg.json").exists()
+
+        directory = write_sharded_baseline(findings[:1], path, root=tmp_path, depth=2)
+
+        assert sorted(p.name for p in directory.iterdir()) == [
+            "manifest.json",
+            "src.idx",
+            "src.json",
+        ]
+        assert filter_with_baseline(findings, load_baseline(path, root=tmp_path)) == findings[1:]
+
+    def test_json_baseline_takes_precedence(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        findings = self._findings(tmp_path)
+        write_sharded_baseline(findings, path, root=tmp_path)
+        write_baseline(findings[:1], path)
+        assert isinstance(load_baseline(path, root=tmp_path), BaselineIndex)
@@ -0,0 +1,74 @@
+"""Test shared baselines: Bloom filter prefilter over the exact index."""
+
+import hashlib
+import pytest
+from specify_cli.baseline import (
+    CombinedBaseline,
+    filter_with_baseline,
+    fingerprint,
+    load_baseline,
+    write_baseline,
+)
+from specify_cli.baseline_index import BaselineIndex
+from specify_cli.baseline_shared import SharedBaseline, bloom_path, publish_shared_baseline
+from specify_cli.config import load_config
+
+
+def _fps(prefix, n):
+    return [hashlib.sha256(f"{prefix}{i}".encode()).hexdigest() for i in range(n)]
+
+
+class TestSharedBaseline:
+    """Test publishing and lookups."""
+
+    def test_membership_and_prefilter(self, tmp_path):
+        accepted = _fps("org", 5000)
+        publish_shared_baseline(accepted + ["not-hex"], tmp_path / "org")
+        shared = SharedBaseline(tmp_path / "org")
+
+        assert len(shared) == 5000 and all(fp in shared for fp in accepted[:500])
+        assert shared.exact_lookups == 500
+
+        shared.exact_lookups = 0
+        assert not any(fp in shared for fp in _fps("new", 5000))
+        # Misses are answered by the filter; ~1% reach the exact index
+        assert shared.exact_lookups < 150
+        assert "not-hex" not in shared and None not in shared
+        assert sorted(shared) == sorted(accepted)
+
+    def test_either_file_names_it(self, tmp_path):
+        exact = publish_shared_baseline(_fps("org", 10), tmp_path / "org")
+        assert exact.name == "org.idx" and bloom_path(exact).exists()
+        assert _fps("org", 1)[0] in SharedBaseline(exact)
+
+    def test_rejects_other_files(self, tmp_path):
+        bloom_path(tmp_path / "org").write_bytes(b"SKBI")
+        with pytest.raises(ValueError):
+            SharedBaseline(tmp_path / "org")
+
+
+class TestCombinedBaseline:
+    """Test consulting a repository baseline together with a shared one."""
+
+    def test_either_baseline_suppresses(self, tmp_path):
+        local, org, new = (
+            {"file_path": f"src/{name}.py", "line": 1, "rule_id": "B101", "message": "m"}
+            for name in ("local", "org", "new")
+        )
+        write_baseline([local], tmp_path / "baseline.json")
+        publish_shared_baseline([fingerprint(org)], tmp_path / "org")
+
+        baseline = load_baseline(tmp_path / "baseline.json", shared=tmp_path / "org")
+
+        assert isinstance(baseline, CombinedBaseline) and len(baseline) == 2
+        assert filter_with_baseline([local, org, new], baseline) == [new]
+
+    def test_unavailable_shared_baseline_is_skipped(self, tmp_path):
+        baseline = load_baseline(tmp_path / "baseline.json", shared=tmp_path / "missing")
+        assert isinstance(baseline, BaselineIndex)
+
+    def test_config_setting(self, tmp_path, monkeypatch):
+        (tmp_path / ".speckit.toml").write_text('[analysis]\nshared_baseline = "/srv/org"\n')
+        assert load_config(tmp_path).analysis.shared_baseline == "/srv/org"
+        monkeypatch.setenv("SPECKIT_SHARED_BASELINE", "/mnt/org")
+        assert load_config(tmp_path).analysis.shared_baseline == "/mnt/org"
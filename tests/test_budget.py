@@ -0,0 +1,119 @@
+"""Test time-budgeted runs and risk-prioritized file ordering."""
+
+import json
+import os
+import time
+from specify_cli import runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.budget import TimeBudget, load_history, prioritize
+from specify_cli.runner import RunConfig, run_all
+
+
+def _write(path, text, mtime):
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+class TestPrioritize:
+    """Test file ordering for budgeted runs."""
+
+    def test_changed_then_density_then_size(self, tmp_path):
+        old = time.time() - 3600
+        _write(tmp_path / "small.py", "x = 1\n", old)
+        _write(tmp_path / "big.py", "x = 1\n" * 500, old)
+        _write(tmp_path / "risky.py", "x = 1\n", old)
+        _write(tmp_path / "edited.py", "x = 1\n", old)
+        _write(tmp_path / "newest.py", "x = 1\n", old + 60)
+        history = {str(tmp_path / "risky.py"): 3}
+
+        order = prioritize(
+            tmp_path,
+            sorted(tmp_path.glob("*.py")),
+            history,
+            changed={"edited.py"},
+            since=old + 30,
+        )
+        assert [p.name for p in order] == [
+            "newest.py",
+            "edited.py",
+            "risky.py",
+            "big.py",
+            "small.py",
+        ]
+
+    def test_history_from_last_run(self, tmp_path):
+        (tmp_path / "last_run.json").write_text(
+            json.dumps({"code": [{"file_path": "./a.py"}, {"file_path": "a.py"}]})
+        )
+        assert load_history(tmp_path) == {"a.py": 2}
+        assert load_history(tmp_path / "missing") == {}
+
+
+class TestTimeBudget:
+    """Test dispatch decisions."""
+
+    def test_reserve_and_estimate(self):
+        budget = TimeBudget(10)
+        assert budget.reserve == 1.0
+        assert budget.can_start()
+        budget.record(20.0)
+        assert budget.estimate() == 20.0
+        assert not budget.can_start()
+
+
+def _slow_per_file(ctx):
+    """Stand-in analyzer taking 0.2s per file."""
+    time.sleep(0.2 * len(ctx.files))
+    return [{"rule_id": "X1", "file_path": str(p), "line": 1, "message": "m"} for p in ctx.files]
+
+
+class TestBudgetedRun:
+    """Test partial results under a time budget."""
+
+    def test_partial_results_in_priority_order(self, tmp_path, monkeypatch):
+        plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_slow_per_file", cost="io")}
+        monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+        old = time.time() - 3600
+        for i in range(20):
+            _write(tmp_path / f"m{i:02d}.py", f"x = {i}\n", old)
+        history = tmp_path / "out"
+        history.mkdir()
+        (history / "last_run.json").write_text("{}")
+        os.utime(history / "last_run.json", (old + 10, old + 10))
+        _write(tmp_path / "m17.py", "x = 'edited'\n", old + 20)
+
+        start = time.monotonic()
+        results = run_all(
+            RunConfig(
+                path=tmp_path,
+                use_safety=False,
+                use_cache=False,
+                max_workers=1,
+                batch_size=1,
+                time_budget=1.5,
+                history_dir=history,
+            )
+        )
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1.5
+        assert results.partial
+        cov = results.coverage
+        assert cov["files_total"] == 20
+        assert 0 < cov["files_analyzed"] < 20
+        assert cov["files_analyzed"] + cov["files_skipped"] == 20
+        assert cov["budget_seconds"] == 1.5
+        assert results["bandit"][0]["file_path"] == str(tmp_path / "m17.py")
+        assert len(results["bandit"]) == cov["files_analyzed"]
+
+    def test_complete_within_budget(self, tmp_path, monkeypatch):
+        plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_slow_per_file", cost="io")}
+        monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+        (tmp_path / "a.py").write_text("a = 1\n")
+
+        results = run_all(
+            RunConfig(path=tmp_path, use_safety=False, use_cache=False, time_budget=30)
+        )
+        assert not results.partial
+        assert results.coverage["files_analyzed"] == results.coverage["files_total"] == 1
+        assert results.coverage["percent"] == 100.0
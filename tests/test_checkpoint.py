@@ -0,0 +1,161 @@
+"""Test checkpointing and resuming interrupted runs."""
+
+import json
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app, runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.checkpoint import Checkpoint, clear_checkpoint
+from specify_cli.runner import RunConfig, run_all
+
+SCANNED = []
+
+
+def _scan(ctx):
+    """Stand-in analyzer that fails on files containing 'boom'."""
+    out = []
+    for p in ctx.files:
+        if "boom" in p.read_text():
+            raise RuntimeError("runner preempted")
+        SCANNED.append(p.name)
+        out.append({"rule_id": "X1", "file_path": str(p), "line": 1, "message": "m"})
+    return out
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_scan", cost="io")}
+    monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+    SCANNED.clear()
+
+
+def _cfg(tmp_path, resume=False):
+    return RunConfig(
+        path=tmp_path / "src",
+        use_safety=False,
+        use_cache=False,
+        batch_size=1,
+        max_workers=1,
+        checkpoint_dir=tmp_path / "out",
+        resume=resume,
+    )
+
+
+class TestCheckpoint:
+    """Test the on-disk checkpoint format."""
+
+    def test_roundtrip_verifies_hash(self, tmp_path):
+        cp = Checkpoint(tmp_path, "k")
+        cp.discovered("a.py")
+        cp.discovered("b.py")
+        cp.record("a.py", "d1", {"bandit": [{"file_path": "/x/a.py", "line": 3}]})
+        cp.flush()
+        with open(cp.results_path, "a") as fh:
+            fh.write('{"rel": "b.py", "dig')  # torn by the interruption
+
+        assert json.loads(cp.state_path.read_text())["pending"] == ["b.py"]
+        again = Checkpoint(tmp_path, "k")
+        assert again.load() == 1
+        assert again.restore("a.py", "d1", "/y/a.py") == {
+            "bandit": [{"line": 3, "file_path": "/y/a.py"}]
+        }
+        assert again.restore("a.py", "changed", "/y/a.py") is None
+        assert again.restore("b.py", "d2", "/y/b.py") is None
+
+    def test_torn_write_then_second_resume(self, tmp_path):
+        """Results recorded after resuming from a torn write survive the next resume."""
+        cp = Checkpoint(tmp_path, "k")
+        cp.record("a.py", "d1", {"bandit": []})
+        cp.flush()
+        with open(cp.results_path, "a") as fh:
+            fh.write('{"rel": "b.py", "dig')  # torn by SIGKILL
+
+        resumed = Checkpoint(tmp_path, "k")
+        assert resumed.load() == 1
+        resumed.record("c.py", "d3", {"bandit": [{"line": 1}]})
+        resumed.flush()
+
+        again = Checkpoint(tmp_path, "k")
+        assert again.load() == 2
+        assert again.restore("c.py", "d3", "/y/c.py") == {
+            "bandit": [{"line": 1, "file_path": "/y/c.py"}]
+        }
+
+    def test_other_settings_start_over(self, tmp_path):
+        cp = Checkpoint(tmp_path, "k")
+        cp.record("a.py", "d1", {"bandit": []})
+        cp.flush()
+        assert Checkpoint(tmp_path, "other").load() == 0
+        assert not cp.directory.exists()
+
+
+class TestResume:
+    """Test resuming run_all from a checkpoint."""
+
+    def test_resume_after_failure(self, tmp_path, plugins):
+        src = tmp_path / "src"
+        src.mkdir()
+        for name in ("a", "b", "c"):
+            (src / f"{name}.py").write_text(f"{name} = 1\n")
+        (src / "z.py").write_text("boom = 1\n")
+
+        with pytest.raises(RuntimeError):
+            run_all(_cfg(tmp_path))
+        cp_dir = tmp_path / "out" / "checkpoint"
+        state = json.loads((cp_dir / "state.json").read_text())
+        lines = (cp_dir / "results.jsonl").read_text().splitlines()
+        done = {json.loads(line)["rel"] for line in lines}
+        assert "z.py" in state["pending"]
+        assert state["completed"] == len(done)
+
+        SCANNED.clear()
+        (src / "z.py").write_text("z = 1\n")
+        (src / "a.py").write_text("a = 2\n")  # changed since the checkpoint
+        results = run_all(_cfg(tmp_path, resume=True))
+
+        assert results.resumed == len(done - {"a.py"})
+        assert set(SCANNED) == {"a.py", "b.py", "c.py", "z.py"} - (done - {"a.py"})
+        assert [f["file_path"] for f in results["bandit"]] == [
+            str(src / f"{n}.py") for n in ("a", "b", "c", "z")
+        ]
+
+    def test_without_resume_starts_fresh(self, tmp_path, plugins):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text("a = 1\n")
+        run_all(_cfg(tmp_path))
+        SCANNED.clear()
+
+        results = run_all(_cfg(tmp_path))
+        assert results.resumed == 0
+        assert SCANNED == ["a.py"]
+        clear_checkpoint(tmp_path / "out")
+        assert not (tmp_path / "out" / "checkpoint").exists()
+
+
+class TestResumeCommand:
+    """Test checkpoint handling in 'specify audit run'."""
+
+    def test_checkpoint_removed_after_complete_report(self, tmp_path):
+        (tmp_path / "a.py").write_text("a = 1\n")
+        out_dir = tmp_path / ".speckit" / "analysis"
+        stale = Checkpoint(out_dir, "old")
+        stale.record("a.py", "d", {"bandit": []})
+        stale.flush()
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "audit",
+                "run",
+                "--path",
+                str(tmp_path),
+                "--no-safety",
+                "--output",
+                "json",
+                "--resume",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert (out_dir / "analysis.json").exists()
+        assert not (out_dir / "checkpoint").exists()
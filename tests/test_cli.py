@@ -170,6 +170,18 @@ class TestHelpers:
             assert len(key) > 0
 
 
+class TestLazyExports:
+    """Test the package's lazily resolved public names."""
+
+    def test_main_is_the_entry_point(self):
+        """``specify_cli.main`` is the function whether or not the CLI module was imported."""
+        import specify_cli
+        import specify_cli._app
+
+        assert callable(specify_cli.main)
+        assert specify_cli.main is specify_cli._app.main
+
+
 # Integration-style tests would go here
 # These would require actual file system operations and are harder to mock
 # For now, we have basic unit tests covering core functionality
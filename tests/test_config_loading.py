@@ -32,3 +32,26 @@ def test_config_defaults_when_no_file(tmp_path: Path):
     assert cfg.analysis.fail_on == "HIGH"  # Default severity
     assert cfg.output.format == "sarif"  # Default format
     assert cfg.output.directory == ".speckit/analysis"  # Default directory
+
+
+def test_ci_fail_on_severity_is_fallback_threshold(tmp_path: Path):
+    """[ci].fail_on_severity gates only when [analysis].fail_on is unset."""
+    config_file = tmp_path / ".speckit.toml"
+    config_file.write_text("[ci]\nfail_on_severity='LOW'\n")
+    assert load_config(tmp_path).analysis.fail_on == "LOW"
+
+    config_file.write_text("[analysis]\nfail_on='CRITICAL'\n[ci]\nfail_on_severity='LOW'\n")
+    assert load_config(tmp_path).analysis.fail_on == "CRITICAL"
+
+
+def test_ci_env_overrides(tmp_path: Path, monkeypatch):
+    """SPECKIT_FAIL_ON_SEVERITY and SPECKIT_MAX_FINDINGS override [ci]."""
+    (tmp_path / ".speckit.toml").write_text("[ci]\nfail_on_severity='HIGH'\nmax_findings=5\n")
+    monkeypatch.setenv("SPECKIT_FAIL_ON_SEVERITY", "MEDIUM")
+    monkeypatch.setenv("SPECKIT_MAX_FINDINGS", "0")
+
+    cfg = load_config(tmp_path)
+
+    assert cfg.ci.fail_on_severity == "MEDIUM"
+    assert cfg.ci.max_findings == 0
+    assert cfg.analysis.fail_on == "MEDIUM"
@@ -0,0 +1,105 @@
+"""Test scan daemon and its thin client."""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+import pytest
+from specify_cli import daemon_client
+from specify_cli.daemon import DaemonError, ScanDaemon
+
+
+@pytest.fixture
+def sock():
+    # AF_UNIX paths are limited to ~100 bytes, so avoid deep pytest tmp dirs
+    d = Path(tempfile.mkdtemp(prefix="sk"))
+    yield d / "d.sock"
+    shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def running(sock):
+    d = ScanDaemon(sock, idle_timeout=30)
+    t = threading.Thread(target=d.serve, daemon=True)
+    t.start()
+    deadline = time.monotonic() + 5
+    while not daemon_client.is_running(sock) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    yield d
+    d.shutdown()
+    t.join(timeout=5)
+
+
+def _project(tmp_path):
+    (tmp_path / "app.py").write_text("import os\nos.system('ls ' + name)\n")
+    (tmp_path / "ok.py").write_text("x = 1\n")
+    return tmp_path
+
+
+class TestDaemon:
+    """Test request handling over the socket."""
+
+    def test_ping_and_scan(self, running, sock, tmp_path):
+        project = _project(tmp_path)
+        assert daemon_client.request({"op": "ping"}, sock)["ok"] is True
+
+        resp = daemon_client.request({"op": "scan", "root": str(project), "fail_on": "LOW"}, sock)
+
+        assert resp["exit_code"] == 1
+        assert {Path(f["file_path"]).name for f in resp["findings"]} == {"app.py"}
+        assert str(project.resolve()) in daemon_client.request({"op": "ping"}, sock)["repos"]
+
+    def test_scan_selected_files_rescans_only_changes(self, running, sock, tmp_path):
+        project = _project(tmp_path)
+        payload = {"op": "scan", "root": str(project), "files": [str(project / "ok.py")]}
+        assert daemon_client.request(payload, sock)["findings"] == []
+
+        (project / "ok.py").write_text("import os\nos.system('ls ' + name)\nx = 2\n")
+        resp = daemon_client.request(payload, sock)
+
+        assert resp["rescanned"] == 1
+        assert {Path(f["file_path"]).name for f in resp["findings"]} == {"ok.py"}
+
+    def test_bad_request_reports_error(self, running, sock):
+        assert "error" in daemon_client.request({"op": "scan", "root": "/no/such/dir"}, sock)
+        assert "error" in daemon_client.request({"op": "bogus"}, sock)
+
+    def test_second_daemon_refused(self, running, sock):
+        with pytest.raises(DaemonError):
+            ScanDaemon(sock).serve()
+
+    def test_idle_shutdown(self, sock):
+        d = ScanDaemon(sock, idle_timeout=0.3)
+        t = threading.Thread(target=d.serve, daemon=True)
+        t.start()
+        t.join(timeout=5)
+        assert not t.is_alive()
+        assert not sock.exists()
+
+
+class TestClient:
+    """Test the stdlib-only client."""
+
+    def test_client_exit_codes(self, running, sock, tmp_path, monkeypatch, capsys):
+        project = _project(tmp_path)
+        monkeypatch.setenv(daemon_client.SOCKET_ENV, str(sock))
+
+        assert daemon_client.main(["--path", str(project), "--fail-on", "LOW"]) == 1
+        assert "app.py:2" in capsys.readouterr().out
+
+    def test_client_without_daemon(self, sock, monkeypatch, capsys):
+        monkeypatch.setenv(daemon_client.SOCKET_ENV, str(sock))
+        assert daemon_client.main([]) == 2
+        assert "not running" in capsys.readouterr().err
+
+    def test_client_import_is_light(self):
+        """The client never pulls in typer, rich or the analyzers."""
+        code = (
+            "import sys, specify_cli.daemon_client;"
+            "print(sorted(m for m in ('typer', 'rich', 'bandit') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.strip() == "[]", out.stderr
@@ -0,0 +1,120 @@
+"""Test fleet audits of many repositories."""
+
+import json
+from pathlib import Path
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app, fleet, runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.fleet import FleetError, read_manifest, run_fleet
+
+SCANNED = []
+
+
+def _scan(ctx):
+    """Stand-in analyzer flagging files that call eval()."""
+    out = []
+    for p in ctx.files:
+        SCANNED.append(p.name)
+        if "eval(" in p.read_text():
+            out.append(
+                {
+                    "rule_id": "B307",
+                    "file_path": str(p),
+                    "line": 1,
+                    "severity": "MEDIUM",
+                    "message": "eval",
+                }
+            )
+    return out
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_scan", cost="io")}
+    monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+    monkeypatch.setattr(fleet, "discover_plugins", lambda: plugins)
+    SCANNED.clear()
+
+
+def _repo(root, name, files):
+    repo = root / name
+    for rel, text in files.items():
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(text)
+    return repo
+
+
+class TestManifest:
+    """Test manifest parsing."""
+
+    def test_comments_blank_lines_and_relative_paths(self, tmp_path):
+        manifest = tmp_path / "repos.txt"
+        manifest.write_text("# nightly\nsvc-a\n\n/abs/svc-b  # pinned\n")
+        assert read_manifest(manifest) == [tmp_path / "svc-a", Path("/abs/svc-b")]
+
+    def test_missing_manifest(self, tmp_path):
+        with pytest.raises(FleetError):
+            read_manifest(tmp_path / "nope.txt")
+
+
+class TestRunFleet:
+    """Test shared-cache fleet runs."""
+
+    def test_vendored_file_scanned_once(self, tmp_path, plugins):
+        vendored = "def helper():\n    return eval('1')\n"
+        a = _repo(tmp_path, "a", {"app.py": "x = 1\n", "vendor/six.py": vendored})
+        b = _repo(tmp_path, "b", {"main.py": "y = 2\n", "third_party/six.py": vendored})
+
+        summary = run_fleet([a, b], tmp_path / "out")
+
+        assert sorted(SCANNED) == ["app.py", "main.py", "six.py"]
+        repos = {r["name"]: r for r in summary["repositories"]}
+        assert repos["a"]["code"] == repos["b"]["code"] == 1
+        assert repos["b"]["cached"] == 1
+        report = json.loads((tmp_path / "out" / "b" / "analysis.json").read_text())
+        assert report["code"][0]["file_path"] == str(b / "third_party" / "six.py")
+        assert summary["totals"]["code"] == 2
+        assert summary["exit_code"] == 0  # default threshold is HIGH
+        assert json.loads((tmp_path / "out" / "summary.json").read_text()) == summary
+
+    def test_bad_repo_does_not_stop_fleet(self, tmp_path, plugins):
+        a = _repo(tmp_path, "a", {"app.py": "eval('1')\n"})
+        summary = run_fleet([tmp_path / "missing", a], tmp_path / "out", fail_on="MEDIUM")
+
+        first, second = summary["repositories"]
+        assert first["error"] == "not a directory"
+        assert second["exit_code"] == 1
+        assert summary["exit_code"] == 2
+        assert summary["totals"]["errors"] == 1
+
+    def test_name_collisions(self, tmp_path, plugins):
+        one = _repo(tmp_path / "x", "svc", {"a.py": "a = 1\n"})
+        two = _repo(tmp_path / "y", "svc", {"b.py": "b = 1\n"})
+        summary = run_fleet([one, two], tmp_path / "out")
+        assert [r["name"] for r in summary["repositories"]] == ["svc", "svc-2"]
+        assert (tmp_path / "out" / "svc-2" / "analysis.json").exists()
+
+
+class TestFleetCommand:
+    """Test 'specify audit fleet'."""
+
+    def test_cli_writes_summary(self, tmp_path, plugins):
+        _repo(tmp_path, "a", {"app.py": "eval('1')\n"})
+        (tmp_path / "repos.txt").write_text("a\n")
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "audit",
+                "fleet",
+                "--manifest",
+                str(tmp_path / "repos.txt"),
+                "--out",
+                str(tmp_path / "out"),
+                "--fail-on",
+                "MEDIUM",
+            ],
+        )
+        assert result.exit_code == 1, result.output
+        assert (tmp_path / "out" / "summary.json").exists()
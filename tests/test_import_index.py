@@ -0,0 +1,113 @@
+"""Test import-reachability index and dependency ranking."""
+
+import json
+from specify_cli.discovery import discover_python_files
+from specify_cli.import_index import (
+    ImportIndex,
+    extract_imports,
+    normalize_dist,
+    tag_reachability,
+)
+
+
+class TestExtractImports:
+    """Test AST import extraction."""
+
+    def test_collects_top_level_modules(self):
+        """Import and from-import statements yield top-level names."""
+        src = b"import os.path\nimport yaml as y\nfrom requests.adapters import HTTPAdapter\n"
+        assert extract_imports(src) == {"os", "yaml", "requests"}
+
+    def test_ignores_relative_imports(self):
+        """Relative imports never refer to distributions."""
+        assert extract_imports(b"from . import sibling\nfrom .pkg import x\n") == set()
+
+    def test_syntax_error_yields_empty(self):
+        """Unparseable modules contribute nothing."""
+        assert extract_imports(b"def broken(:\n") == set()
+
+    def test_nested_imports_found(self):
+        """Imports inside functions are still reachable."""
+        src = b"def f():\n    import jinja2\n    return jinja2\n"
+        assert extract_imports(src) == {"jinja2"}
+
+
+class TestImportIndex:
+    """Test incremental index behaviour."""
+
+    def test_reuses_unchanged_files(self, tmp_path):
+        """Second update only re-parses files whose content changed."""
+        (tmp_path / "a.py").write_text("import flask\n")
+        (tmp_path / "b.py").write_text("import yaml\n")
+
+        index = ImportIndex(tmp_path)
+        index.update(discover_python_files(tmp_path))
+        index.save()
+        assert index.parsed == 2
+
+        (tmp_path / "b.py").write_text("import requests\n")
+        index2 = ImportIndex(tmp_path)
+        index2.update(discover_python_files(tmp_path))
+
+        assert index2.parsed == 1
+        assert index2.reused == 1
+        assert index2.modules() == {"flask", "requests"}
+
+    def test_prunes_deleted_files(self, tmp_path):
+        """Entries for files no longer present are dropped."""
+        (tmp_path / "a.py").write_text("import flask\n")
+        index = ImportIndex(tmp_path)
+        index.update(discover_python_files(tmp_path))
+        (tmp_path / "a.py").unlink()
+        index.update(discover_python_files(tmp_path))
+        assert index.modules() == set()
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        """A corrupt cache file is rebuilt rather than raising."""
+        cache = tmp_path / ".speckit" / "cache" / "imports.json"
+        cache.parent.mkdir(parents=True)
+        cache.write_text("{not json")
+        index = ImportIndex(tmp_path)
+        assert index.entries == {}
+
+    def test_save_writes_versioned_cache(self, tmp_path):
+        """Saved cache records per-file hashes."""
+        (tmp_path / "a.py").write_text("import flask\n")
+        index = ImportIndex(tmp_path)
+        index.update(discover_python_files(tmp_path))
+        data = json.loads(index.save().read_text())
+        assert data["version"] == 1
+        assert "hash" in data["files"]["a.py"]
+
+
+class TestTagReachability:
+    """Test tagging and ranking of dependency findings."""
+
+    def test_imported_findings_ranked_first(self, tmp_path):
+        """Findings for imported packages come before the rest."""
+        (tmp_path / "app.py").write_text("import flask\n")
+        index = ImportIndex(tmp_path)
+        index.update(discover_python_files(tmp_path))
+
+        findings = [
+            {"package": "unused-lib", "advisory_id": "1"},
+            {"package": "Flask", "advisory_id": "2"},
+        ]
+        ranked = tag_reachability(findings, index)
+
+        assert [f["package"] for f in ranked] == ["Flask", "unused-lib"]
+        assert ranked[0]["imported"] is True
+        assert ranked[1]["imported"] is False
+
+    def test_distribution_mapped_from_metadata(self, tmp_path):
+        """Modules map to their distribution via installed top-level data."""
+        # pytest is installed in the test environment and exposes "_pytest"
+        (tmp_path / "t.py").write_text("import _pytest\n")
+        index = ImportIndex(tmp_path)
+        index.update(discover_python_files(tmp_path))
+        assert "pytest" in index.imported_distributions()
+
+    def test_normalize_dist(self):
+        """PEP 503 normalization collapses separators and case."""
+        assert normalize_dist("Zope.Interface") == "zope-interface"
+        assert normalize_dist("typing_extensions") == "typing-extensions"
@@ -0,0 +1,30 @@
+"""Test dependency manifest parsing."""
+
+import json
+from specify_cli.manifest import parse_manifest, parse_requirements
+
+
+def test_requirements_pins_only():
+    """Only exact pins are returned, with line numbers."""
+    text = "# comment\nflask==2.0.0\nrequests>=2\n-e .\nuvicorn[standard]==0.23.1 ; python_version>'3'\n"
+    pins = parse_requirements(text)
+    assert [(p.name, p.version, p.line) for p in pins] == [
+        ("flask", "2.0.0", 2),
+        ("uvicorn", "0.23.1", 5),
+    ]
+
+
+def test_poetry_lock(tmp_path):
+    """Packages in poetry.lock are pins."""
+    p = tmp_path / "poetry.lock"
+    p.write_text('[[package]]\nname = "flask"\nversion = "2.0.0"\n')
+    assert [(x.name, x.version) for x in parse_manifest(p)] == [("flask", "2.0.0")]
+
+
+def test_pipfile_lock(tmp_path):
+    """Pipfile.lock default and develop sections are read."""
+    p = tmp_path / "Pipfile.lock"
+    p.write_text(
+        json.dumps({"default": {"flask": {"version": "==2.0.0"}}, "develop": {"pytest": {}}})
+    )
+    assert [(x.name, x.version) for x in parse_manifest(p)] == [("flask", "2.0.0")]
@@ -0,0 +1,109 @@
+"""Test staged pipeline and result cache."""
+
+import threading
+import time
+import pytest
+from specify_cli.pipeline import Pipeline
+from specify_cli.result_cache import ResultCache
+
+
+class TestPipeline:
+    """Test stage wiring, backpressure and cancellation."""
+
+    def test_stages_chain_in_order(self):
+        """Items pass through every stage in source order."""
+        pipe = Pipeline(maxsize=2)
+        pipe.source("numbers", range(10))
+        pipe.stage("double", lambda n: [n * 2])
+        pipe.stage("odd-only", lambda n: [n + 1] if n % 4 == 0 else [])
+        assert list(pipe.run()) == [1, 5, 9, 13, 17]
+        assert pipe.completed
+        assert pipe.stats["double"].items_in == 10
+        assert pipe.stats["odd-only"].items_out == 5
+
+    def test_flush_emits_buffered_items(self):
+        """A stage's flush runs once at end of input."""
+        buf = []
+
+        def collect(n):
+            buf.append(n)
+            return []
+
+        pipe = Pipeline()
+        pipe.source("src", range(3))
+        pipe.stage("batch", collect, flush=lambda: [sum(buf)])
+        assert list(pipe.run()) == [3]
+
+    def test_backpressure_bounds_in_flight(self):
+        """A slow consumer limits how far the source runs ahead."""
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        pipe = Pipeline(maxsize=2)
+        pipe.source("src", source())
+        pipe.stage("pass", lambda n: [n])
+        it = pipe.run()
+        next(it)
+        time.sleep(0.2)
+        # Two queues of depth 2 plus one item held by each thread
+        assert len(produced) <= 8
+        it.close()
+
+    def test_stage_error_propagates(self):
+        """An exception in a stage is raised to the consumer."""
+
+        def boom(n):
+            raise ValueError("bad item")
+
+        pipe = Pipeline()
+        pipe.source("src", range(3))
+        pipe.stage("boom", boom)
+        with pytest.raises(ValueError):
+            list(pipe.run())
+
+    def test_deadline_stops_pipeline(self):
+        """Stages still busy at the deadline are abandoned."""
+        release = threading.Event()
+
+        def slow(n):
+            release.wait(2.0)
+            return [n]
+
+        pipe = Pipeline()
+        pipe.source("src", range(3))
+        pipe.stage("slow", slow)
+        start = time.monotonic()
+        assert list(pipe.run(deadline=time.monotonic() + 0.2)) == []
+        release.set()
+        assert pipe.timed_out
+        assert time.monotonic() - start < 1.0
+
+
+class TestResultCache:
+    """Test content-addressed result storage."""
+
+    def test_round_trip_rebinds_path(self, tmp_path):
+        """Entries are path-independent and re-attached on read."""
+        cache = ResultCache(tmp_path)
+        key = ResultCache.key("bandit", "1.0", "abc")
+        cache.put(key, [{"file_path": "a.py", "line": 3}])
+        assert cache.get(key, "b/copy.py") == [{"file_path": "b/copy.py", "line": 3}]
+        assert cache.hits == 1
+
+    def test_key_depends_on_version(self):
+        """A new analyzer version never reuses old entries."""
+        assert ResultCache.key("bandit", "1.0", "abc") != ResultCache.key("bandit", "1.1", "abc")
+
+    def test_miss_and_corrupt_entry(self, tmp_path):
+        """Missing and unreadable entries are misses."""
+        cache = ResultCache(tmp_path)
+        key = ResultCache.key("bandit", "1.0", "abc")
+        assert cache.get(key, "a.py") is None
+        cache.put(key, [])
+        cache._path(key).write_text("{oops")
+        assert cache.get(key, "a.py") is None
+        assert cache.misses == 2
@@ -0,0 +1,63 @@
+"""Test analyzer plugin registry."""
+
+import subprocess
+import sys
+from specify_cli.analyzers import registry
+from specify_cli.analyzers.registry import (
+    AnalyzerContext,
+    AnalyzerPlugin,
+    discover_plugins,
+    get_plugin,
+)
+
+
+def _echo(ctx):
+    return [{"root": str(ctx.root), "files": len(ctx.files)}]
+
+
+class TestAnalyzerPlugin:
+    """Test plugin declarations."""
+
+    def test_builtins_registered(self):
+        """Bandit and Safety are always available by name."""
+        plugins = discover_plugins()
+        assert plugins["bandit"].cost == "cpu"
+        assert plugins["bandit"].scope == "file"
+        assert plugins["safety"].kind == "dependency"
+        assert plugins["safety"].cacheable is False
+
+    def test_load_resolves_target(self, tmp_path):
+        """load() imports the target callable on demand."""
+        plugin = AnalyzerPlugin("echo", f"{__name__}:_echo")
+        out = plugin.load()(AnalyzerContext(root=tmp_path, files=[tmp_path / "a.py"]))
+        assert out == [{"root": str(tmp_path), "files": 1}]
+
+    def test_available_checks_requirements(self):
+        """Missing modules or executables make a plugin unavailable."""
+        assert AnalyzerPlugin("x", "m:f", requires_modules=("json",)).available()
+        assert not AnalyzerPlugin("x", "m:f", requires_modules=("no_such_mod_xyz",)).available()
+        assert not AnalyzerPlugin("x", "m:f", requires_executables=("no-such-exe-xyz",)).available()
+
+    def test_get_plugin_unknown(self):
+        """Unknown names raise KeyError."""
+        try:
+            get_plugin("does-not-exist")
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("expected KeyError")
+
+
+class TestLazyImports:
+    """Test that analyzers are not imported at CLI startup."""
+
+    def test_cli_import_does_not_load_bandit(self):
+        """Importing the CLI must not pull in bandit."""
+        code = "import sys, specify_cli.cli; print('bandit' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.strip() == "False", out.stderr
+
+    def test_registry_module_is_light(self):
+        """The declaration module does not import analyzer implementations."""
+        assert not hasattr(registry, "BanditAnalyzer")
+        assert not hasattr(registry, "SafetyAnalyzer")
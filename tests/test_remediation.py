@@ -0,0 +1,115 @@
+"""Test batch remediation planning and the deps plan command."""
+
+import json
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app
+from specify_cli.advisories import Advisory, AdvisoryStore
+from specify_cli.manifest import Pin, patch_requirements
+from specify_cli.remediation import lowest_safe_version, plan_upgrades
+
+
+runner = CliRunner()
+
+
+def _adv(adv_id, package, specs, fix=None):
+    return Advisory.from_dict(
+        {"id": adv_id, "package": package, "vulnerable_specs": specs, "fix_version": fix}
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a requirements file and a populated advisory DB."""
+    (tmp_path / "requirements.txt").write_text(
+        "# app deps\nflask==2.0.0\nrequests==2.25.0  # http\njinja2==3.1.4\nlegacy==1.0\n"
+    )
+    dump = tmp_path / "dump.json"
+    dump.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "advisories": [
+                    {
+                        "id": "F-1",
+                        "package": "flask",
+                        "vulnerable_specs": ["<2.2.5"],
+                        "fix_version": "2.2.5",
+                    },
+                    {
+                        "id": "F-2",
+                        "package": "flask",
+                        "vulnerable_specs": [">=2.2.0,<2.3.2"],
+                        "fix_version": "2.3.2",
+                    },
+                    {"id": "R-1", "package": "requests", "vulnerable_specs": ["<2.31.0"]},
+                    {"id": "L-1", "package": "legacy", "vulnerable_specs": [">=0"]},
+                ],
+            }
+        )
+    )
+    with AdvisoryStore(tmp_path / ".speckit" / "advisories.db") as store:
+        store.import_full(dump)
+    return tmp_path
+
+
+class TestLowestSafeVersion:
+    """Test per-package solving."""
+
+    def test_skips_fix_inside_other_advisory(self):
+        """A fix version still covered by another advisory is not chosen."""
+        advs = [_adv("A", "p", ["<2.2.5"], "2.2.5"), _adv("B", "p", [">=2.2.0,<2.3.2"], "2.3.2")]
+        assert lowest_safe_version("2.0.0", advs) == "2.3.2"
+
+    def test_uses_upper_bound_without_fix(self):
+        """The exclusive upper bound of a range is a candidate."""
+        assert lowest_safe_version("1.0", [_adv("A", "p", ["<1.4"])]) == "1.4"
+
+    def test_no_fix_returns_none(self):
+        """Open-ended ranges have no safe version."""
+        assert lowest_safe_version("1.0", [_adv("A", "p", [">=0"])]) is None
+
+
+class TestPlanUpgrades:
+    """Test planning across packages."""
+
+    def test_plan_in_manifest_order(self, project):
+        """Only vulnerable pins are planned, in manifest order."""
+        pins = [Pin("flask", "2.0.0", 2), Pin("jinja2", "3.1.4", 4), Pin("legacy", "1.0", 5)]
+        with AdvisoryStore(project / ".speckit" / "advisories.db") as store:
+            plan = plan_upgrades(pins, store)
+        assert [(u.package, u.target) for u in plan] == [("flask", "2.3.2"), ("legacy", None)]
+        assert plan[0].advisories == ["F-1"]
+
+
+def test_patch_requirements_preserves_layout():
+    """Only the version token changes on patched lines."""
+    text = "flask==2.0.0 ; python_version>'3'\nrequests==2.25.0  # http\n"
+    assert patch_requirements(text, {2: "2.31.0"}) == (
+        "flask==2.0.0 ; python_version>'3'\nrequests==2.31.0  # http\n"
+    )
+
+
+class TestDepsPlanCommand:
+    """Test the deps plan CLI."""
+
+    def test_diff_output(self, project):
+        """Diff output bumps every resolvable pin."""
+        result = runner.invoke(app, ["deps", "plan", "--path", str(project), "--format", "diff"])
+        assert result.exit_code == 1  # legacy has no known fix
+        assert "+flask==2.3.2" in result.stdout
+        assert "+requests==2.31.0  # http" in result.stdout
+        assert "+jinja2" not in result.stdout
+
+    def test_write_patches_manifest(self, project):
+        """--write rewrites the manifest in place."""
+        runner.invoke(app, ["deps", "plan", "--path", str(project), "--write"])
+        text = (project / "requirements.txt").read_text()
+        assert "flask==2.3.2" in text
+        assert "# app deps" in text
+
+    def test_missing_db(self, tmp_path):
+        """A missing advisory DB exits with code 2."""
+        (tmp_path / "requirements.txt").write_text("flask==2.0.0\n")
+        result = runner.invoke(app, ["deps", "plan", "--path", str(tmp_path)])
+        assert result.exit_code == 2
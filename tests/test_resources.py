@@ -0,0 +1,104 @@
+"""Test container-aware worker sizing."""
+
+import json
+import pytest
+from specify_cli import resources
+from specify_cli.config import load_config
+from specify_cli.errors import ConfigError
+from specify_cli.resources import (
+    auto_workers,
+    cpu_quota,
+    memory_limit,
+    resolve_workers,
+    worker_footprint,
+)
+
+MiB = 1024 * 1024
+
+
+def _cgroup(tmp_path, membership, files):
+    root = tmp_path / "cgroup"
+    for rel, text in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text(membership)
+    return root, proc
+
+
+class TestCgroupLimits:
+    """Test reading CPU quota and memory limits."""
+
+    def test_v2_quota_and_memory(self, tmp_path):
+        root, proc = _cgroup(
+            tmp_path,
+            "0::/kubepods/pod1\n",
+            {
+                "kubepods/pod1/cpu.max": "200000 100000\n",
+                "kubepods/pod1/memory.max": "1073741824\n",
+            },
+        )
+        assert cpu_quota(root, proc) == 2.0
+        assert memory_limit(root, proc) == 1024 * MiB
+
+    def test_v2_unlimited(self, tmp_path):
+        root, proc = _cgroup(tmp_path, "0::/\n", {"cpu.max": "max 100000\n", "memory.max": "max"})
+        assert cpu_quota(root, proc) is None
+        assert memory_limit(root, proc) != "max"  # falls back to physical memory
+
+    def test_v1_quota(self, tmp_path):
+        root, proc = _cgroup(
+            tmp_path,
+            "4:cpu,cpuacct:/docker/abc\n3:memory:/docker/abc\n",
+            {
+                "cpu,cpuacct/docker/abc/cpu.cfs_quota_us": "150000",
+                "cpu,cpuacct/docker/abc/cpu.cfs_period_us": "100000",
+                "memory/docker/abc/memory.limit_in_bytes": str(512 * MiB),
+            },
+        )
+        assert cpu_quota(root, proc) == 1.5
+        assert memory_limit(root, proc) == 512 * MiB
+
+    def test_v1_no_quota(self, tmp_path):
+        root, proc = _cgroup(
+            tmp_path,
+            "1:cpu:/\n",
+            {"cpu/cpu.cfs_quota_us": "-1", "cpu/cpu.cfs_period_us": "100000"},
+        )
+        assert cpu_quota(root, proc) is None
+
+
+class TestAutoWorkers:
+    """Test the chosen worker count."""
+
+    def test_quota_caps_host_cpus(self, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 64)
+        monkeypatch.setattr(resources, "cpu_quota", lambda: 1.5)
+        monkeypatch.setattr(resources, "memory_limit", lambda: None)
+        assert auto_workers() == 2
+
+    def test_memory_caps_by_measured_footprint(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(resources, "available_cpus", lambda: 8)
+        monkeypatch.setattr(resources, "cpu_quota", lambda: None)
+        monkeypatch.setattr(resources, "memory_limit", lambda: 1024 * MiB)
+        monkeypatch.setattr(resources, "_maxrss", lambda children=False: 100 * MiB)
+        (tmp_path / "workers.json").write_text(json.dumps({"worker_rss_bytes": 300 * MiB}))
+
+        assert worker_footprint(tmp_path) == 300 * MiB
+        assert auto_workers(tmp_path) == 3
+        assert auto_workers() == 3  # default 256 MiB footprint
+
+    def test_resolve(self, monkeypatch):
+        monkeypatch.setattr(resources, "auto_workers", lambda history_dir=None: 5)
+        assert resolve_workers(3) == 3
+        assert resolve_workers("auto") == 5
+        assert resolve_workers(None) == 5
+        for bad in (0, "many"):
+            with pytest.raises(ConfigError):
+                resolve_workers(bad)
+
+    def test_config_setting(self, tmp_path, monkeypatch):
+        (tmp_path / ".speckit.toml").write_text('[performance]\nmax_workers = "auto"\n')
+        assert load_config(tmp_path).performance.max_workers == "auto"
+        monkeypatch.setenv("SPECKIT_MAX_WORKERS", "3")
+        assert load_config(tmp_path).performance.max_workers == "3"
@@ -1,6 +1,9 @@
 """Test analysis runner orchestration."""
 
+import time
 import pytest
+from specify_cli import runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
 from specify_cli.runner import RunConfig, run_all
 
 
@@ -122,3 +125,171 @@ class TestRunAll:
             # Common fields from Bandit
             if finding:  # If there are any findings
                 assert "rule_id" in finding or "severity" in finding
+
+
+def _slow_scan(ctx):
+    """Stand-in file analyzer that takes one second."""
+    time.sleep(1.0)
+    return [{"rule_id": "B000", "file_path": str(ctx.root / "app.py")}]
+
+
+def _slow_deps(ctx):
+    time.sleep(1.0)
+    return []
+
+
+def _no_deps(ctx):
+    return []
+
+
+def _missing_cli(ctx):
+    raise FileNotFoundError("safety CLI not found")
+
+
+def _fake_plugins(monkeypatch, code, deps):
+    """Register stand-in bandit/safety plugins backed by the functions above."""
+    plugins = {
+        "bandit": AnalyzerPlugin("bandit", f"{__name__}:{code.__name__}", scope="file", cost="cpu"),
+        "safety": AnalyzerPlugin(
+            "safety", f"{__name__}:{deps.__name__}", scope="project", cost="io", kind="dependency"
+        ),
+    }
+    monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+
+
+class TestConcurrentRun:
+    """Test concurrent execution and the global deadline."""
+
+    def test_analyzers_overlap(self, tmp_path, monkeypatch):
+        """Wall time is close to the slowest analyzer, not the sum."""
+        (tmp_path / "app.py").write_text("print('app')\n")
+        _fake_plugins(monkeypatch, _slow_scan, _slow_deps)
+
+        start = time.monotonic()
+        results = run_all(RunConfig(path=tmp_path))
+        elapsed = time.monotonic() - start
+
+        assert results["bandit"][0]["rule_id"] == "B000"
+        assert results["safety"] == []
+        assert elapsed < 1.8, f"analyzers ran sequentially ({elapsed:.2f}s)"
+        assert set(results.timings) == {"bandit", "safety"}
+
+    def test_timeout_reports_unfinished(self, tmp_path, monkeypatch):
+        """Analyzers still running at the deadline are cancelled and reported."""
+        (tmp_path / "app.py").write_text("print('app')\n")
+        _fake_plugins(monkeypatch, _slow_scan, _no_deps)
+
+        start = time.monotonic()
+        results = run_all(RunConfig(path=tmp_path, timeout=0.3))
+
+        assert time.monotonic() - start < 0.9
+        assert results.incomplete == ["bandit"]
+        assert "bandit" not in results
+        assert results["safety"] == []
+
+    def test_analyzer_errors_propagate(self, tmp_path, monkeypatch):
+        """Failures other than the deadline still raise."""
+        _fake_plugins(monkeypatch, _slow_scan, _missing_cli)
+        with pytest.raises(FileNotFoundError):
+            run_all(RunConfig(path=tmp_path, use_bandit=False))
+
+
+class TestPluginScheduling:
+    """Test plugin selection by name."""
+
+    def test_extra_plugin_runs(self, tmp_path, monkeypatch):
+        """Plugins named in RunConfig.analyzers run alongside the built-ins."""
+        (tmp_path / "app.py").write_text("print('app')\n")
+        plugins = {
+            "extra": AnalyzerPlugin("extra", f"{__name__}:_no_deps", scope="project", cost="io")
+        }
+        monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+
+        cfg = RunConfig(path=tmp_path, use_bandit=False, use_safety=False, analyzers=["extra"])
+        assert cfg.enabled_analyzers() == ["extra"]
+        assert run_all(cfg) == {"extra": []}
+
+    def test_unknown_plugin_skipped(self, tmp_path):
+        """Unregistered names are skipped rather than failing the run."""
+        cfg = RunConfig(path=tmp_path, use_bandit=False, use_safety=False, analyzers=["nope"])
+        assert run_all(cfg) == {}
+
+
+def _per_file(ctx):
+    """Stand-in file analyzer with one finding per file."""
+    return [{"rule_id": "X1", "file_path": str(p), "line": 1, "message": "m"} for p in ctx.files]
+
+
+class TestStagedPipeline:
+    """Test cache reuse, baseline filtering and sinks in the pipeline."""
+
+    def _plugins(self, monkeypatch):
+        plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_per_file", cost="io")}
+        monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+
+    def test_unchanged_files_served_from_cache(self, tmp_path, monkeypatch):
+        """A second run reuses results for files whose content did not change."""
+        self._plugins(monkeypatch)
+        for i in range(5):
+            (tmp_path / f"m{i}.py").write_text(f"x = {i}\n")
+        cfg = RunConfig(path=tmp_path, use_safety=False, batch_size=2)
+
+        first = run_all(cfg)
+        (tmp_path / "m0.py").write_text("x = 'changed'\n")
+        second = run_all(cfg)
+
+        assert first.cached == 0
+        assert second.cached == 4
+        # m0.py's flagged line changed, and with it its context fingerprint
+        assert second["bandit"][1:] == first["bandit"][1:]
+        assert [f["line"] for f in second["bandit"]] == [f["line"] for f in first["bandit"]]
+        assert [f["file_path"] for f in second["bandit"]] == [
+            str(tmp_path / f"m{i}.py") for i in range(5)
+        ]
+
+    def test_baseline_filter_and_sinks(self, tmp_path, monkeypatch):
+        """Baselined findings are dropped in-pipeline; sinks see the rest."""
+        from specify_cli.baseline import _fingerprint
+
+        self._plugins(monkeypatch)
+        (tmp_path / "a.py").write_text("a = 1\n")
+        (tmp_path / "b.py").write_text("b = 1\n")
+        known = {"rule_id": "X1", "file_path": str(tmp_path / "a.py"), "line": 1, "message": "m"}
+        seen = []
+
+        results = run_all(
+            RunConfig(
+                path=tmp_path,
+                use_safety=False,
+                use_cache=False,
+                baseline={_fingerprint(known, tmp_path)},
+                sinks=[lambda name, findings: seen.extend(findings)],
+            )
+        )
+
+        assert [f["file_path"] for f in results["bandit"]] == [str(tmp_path / "b.py")]
+        assert results.suppressed == {"bandit": 1}
+        assert seen == results["bandit"]
+        assert results.stages["read"].items_out == 2
+
+    def test_fingerprint_computed_once(self, tmp_path, monkeypatch):
+        """Fingerprints are stamped at ingestion and reused by baseline filtering."""
+        from specify_cli import baseline
+
+        self._plugins(monkeypatch)
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text("x = 1\n")
+        calls = []
+        original = baseline.fingerprint
+        monkeypatch.setattr(
+            baseline, "fingerprint", lambda f, root=None: calls.append(f) or original(f, root)
+        )
+
+        results = run_all(
+            RunConfig(path=tmp_path, use_safety=False, use_cache=False, baseline={"0" * 64})
+        )
+
+        assert len(calls) == 2
+        assert [f["fingerprint"] for f in results["bandit"]] == [
+            original(f, tmp_path) for f in results["bandit"]
+        ]
@@ -1,9 +1,13 @@
 """Test Safety analyzer error handling."""
 
-import pytest
+import json
+import shlex
 import shutil
+import subprocess
+import sys
+import pytest
 from pathlib import Path
-from specify_cli.analyzers.safety_analyzer import SafetyAnalyzer
+from specify_cli.analyzers.safety_analyzer import SafetyAnalyzer, VulnerabilityStream
 
 
 def test_safety_missing_cli_raises(tmp_path: Path, monkeypatch):
@@ -19,3 +23,96 @@ def test_safety_missing_cli_raises(tmp_path: Path, monkeypatch):
         SafetyAnalyzer(tmp_path).run()
 
     assert "safety" in str(exc_info.value).lower()
+
+
+def _py(code: str) -> str:
+    """Build a command line that runs a Python snippet."""
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+def test_safety_stream_builds_findings(tmp_path: Path):
+    """Verify findings are built from streamed JSON output."""
+    payload = {
+        "vulnerabilities": [
+            {"package_name": "flask", "installed_version": "0.5", "vulnerability_id": "1"},
+            {"package_name": "jinja2", "installed_version": "2.0", "vulnerability_id": "2"},
+        ]
+    }
+    code = f"import sys; sys.stdout.write({json.dumps(json.dumps(payload))}); sys.exit(1)"
+
+    findings = SafetyAnalyzer(tmp_path)._run_stream(_py(code))
+
+    assert [f.package for f in findings] == ["flask", "jinja2"]
+    assert findings[1].advisory_id == "2"
+
+
+def test_safety_stream_truncated_output_raises(tmp_path: Path):
+    """Verify truncated JSON surfaces as JSONDecodeError."""
+    code = 'import sys; sys.stdout.write(\'{"vulnerabilities": [{"package": "x"}\')'
+
+    with pytest.raises(json.JSONDecodeError):
+        SafetyAnalyzer(tmp_path)._run_stream(_py(code))
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "Login required. Run 'safety auth login' first.\n",
+        '{"vulnerabilities": 5}',
+        '{"vulnerabilities": []}\nWarning: report truncated',
+        "",
+    ],
+)
+def test_safety_stream_non_json_output_raises(tmp_path: Path, output: str):
+    """Verify output that is not one JSON document is not read as a clean result."""
+    code = f"import sys; sys.stdout.write({output!r})"
+
+    with pytest.raises(json.JSONDecodeError):
+        SafetyAnalyzer(tmp_path)._run_stream(_py(code))
+
+
+def test_safety_non_json_output_falls_back_to_legacy(tmp_path: Path, monkeypatch):
+    """Verify garbage from ``safety scan`` triggers the legacy command."""
+    legacy = {"vulnerabilities": [{"package_name": "flask", "vulnerability_id": "1"}]}
+    primary = _py("print('Authentication required')")
+    fallback = _py(f"import sys; sys.stdout.write({json.dumps(legacy)!r})")
+    monkeypatch.setattr(SafetyAnalyzer, "_commands", lambda self: (primary, fallback))
+
+    assert [f.package for f in SafetyAnalyzer(tmp_path).run()] == ["flask"]
+
+    monkeypatch.setattr(SafetyAnalyzer, "_commands", lambda self: (primary, primary))
+    with pytest.raises(json.JSONDecodeError):
+        SafetyAnalyzer(tmp_path).run()
+
+
+def test_safety_stream_bad_exit_code_raises(tmp_path: Path):
+    """Verify unexpected exit codes raise CalledProcessError."""
+    code = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        SafetyAnalyzer(tmp_path)._run_stream(_py(code))
+
+    assert "boom" in exc_info.value.stderr
+
+
+def test_safety_timeout_enforced(tmp_path: Path):
+    """Verify a hung safety process is killed after the timeout."""
+    with pytest.raises(subprocess.TimeoutExpired):
+        SafetyAnalyzer(tmp_path, timeout=0.5)._run_stream(_py("import time; time.sleep(30)"))
+
+
+def test_vulnerability_stream_chunk_boundaries():
+    """Verify objects split across arbitrary chunk boundaries are reassembled."""
+    doc = {
+        "report_meta": {"vulnerabilities": ["ignored"]},
+        "vulnerabilities": [{"package": 'a"}]', "n": [1, {"x": "\\"}]}, {"package": "é"}],
+    }
+    data = json.dumps(doc).encode("utf-8")
+
+    for size in (1, 2, 7, len(data)):
+        stream = VulnerabilityStream()
+        out = []
+        for i in range(0, len(data), size):
+            out.extend(stream.feed(data[i : i + size]))
+        stream.close()
+        assert out == doc["vulnerabilities"]
@@ -1,7 +1,9 @@
 """Test SARIF output generation."""
 
 from pathlib import Path
+from specify_cli.baseline import stamp_fingerprints
 from specify_cli.reporters.sarif import combine_to_sarif
+from specify_cli.reporters.sarif_bandit import bandit_findings_to_sarif
 
 
 def test_sarif_contains_runs_and_results(tmp_path: Path):
@@ -65,3 +67,28 @@ def test_sarif_fingerprints_present(tmp_path: Path):
     result = sarif["runs"][0]["results"][0]
     assert "fingerprints" in result, "Should have fingerprints"
     assert "primaryLocationLineHash" in result["fingerprints"], "Should have line hash fingerprint"
+
+
+def test_sarif_fingerprints_independent_of_checkout_root(tmp_path: Path):
+    """Verify the same tree checked out in two places yields the same fingerprints."""
+
+    def hashes(root: Path, stamp: bool):
+        code = [
+            {
+                "rule_id": "B201",
+                "severity": "MEDIUM",
+                "file_path": str(root / "app" / "test.py"),
+                "line": 10,
+                "message": "debug mode",
+            }
+        ]
+        if stamp:
+            stamp_fingerprints(code, root=root)
+        combined = combine_to_sarif(code, [], root)["runs"][0]["results"][0]
+        bandit = bandit_findings_to_sarif(code, root)["runs"][0]["results"][0]
+        return combined["fingerprints"], bandit["fingerprints"]
+
+    expected = hashes(tmp_path / "proj", stamp=True)
+    assert expected[0]["primaryLocationLineHash"] == expected[1]["primaryLocationLineHash"]
+    assert hashes(tmp_path / "proj2", stamp=True) == expected
+    assert hashes(tmp_path / "proj3", stamp=False) == expected
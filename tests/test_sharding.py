@@ -0,0 +1,109 @@
+"""Test deterministic sharding and shard report merging."""
+
+import json
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app
+from specify_cli.sharding import ShardError, canonical_order, parse_shard, shard_of
+
+runner = CliRunner()
+
+
+class TestShardAssignment:
+    """Test shard parsing and path partitioning."""
+
+    def test_parse_shard(self):
+        """INDEX/COUNT parses to a 0-based pair."""
+        assert parse_shard("0/8") == (0, 8)
+        assert parse_shard("7/8") == (7, 8)
+
+    @pytest.mark.parametrize("spec", ["8/8", "-1/4", "1", "a/b", "0/0"])
+    def test_parse_shard_rejects_invalid(self, spec):
+        """Out-of-range or malformed specs raise ShardError."""
+        with pytest.raises(ShardError):
+            parse_shard(spec)
+
+    def test_assignment_is_stable_and_separator_independent(self):
+        """The same relative path always lands on the same shard."""
+        assert shard_of("pkg/mod.py", 8) == shard_of("pkg/mod.py", 8)
+        assert shard_of("pkg\\mod.py".replace("\\", "/"), 8) == shard_of("pkg/mod.py", 8)
+
+    def test_canonical_order_keeps_order_within_file(self):
+        """Findings sort by path parts, like discovery; same-file order is preserved."""
+        findings = [
+            {"file_path": "b.py", "rule_id": "2"},
+            {"file_path": "a/z.py", "rule_id": "1"},
+            {"file_path": "b.py", "rule_id": "1"},
+            {"file_path": "a.py", "rule_id": "0"},
+        ]
+        ordered = canonical_order(findings)
+        assert [(f["file_path"], f["rule_id"]) for f in ordered] == [
+            ("a/z.py", "1"),
+            ("a.py", "0"),
+            ("b.py", "2"),
+            ("b.py", "1"),
+        ]
+
+
+def _project(tmp_path):
+    for i in range(12):
+        sub = tmp_path / f"pkg{i % 3}"
+        sub.mkdir(exist_ok=True)
+        (sub / f"mod{i}.py").write_text(f"import os\nos.system('echo {i}')\nassert {i}\n")
+    return tmp_path
+
+
+class TestShardMerge:
+    """Merged shard reports equal the unsharded report."""
+
+    @pytest.mark.parametrize("fmt,name", [("json", "analysis"), ("sarif", "report")])
+    def test_merge_matches_unsharded(self, tmp_path, fmt, name):
+        project = _project(tmp_path)
+        out_dir = project / ".speckit" / "analysis"
+        base = ["audit", "run", "--path", str(project), "--no-safety", "--output", fmt]
+
+        runner.invoke(app, base)
+        expected = json.loads((out_dir / f"{name}.{fmt}").read_text())
+        (out_dir / f"{name}.{fmt}").unlink()
+
+        shard_files = []
+        for i in range(3):
+            runner.invoke(app, base + ["--shard", f"{i}/3"])
+            shard_files.append(str(out_dir / f"{name}.shard-{i}-of-3.{fmt}"))
+
+        result = runner.invoke(app, ["audit", "merge", *shard_files, "--path", str(project)])
+
+        assert result.exit_code in (0, 1), result.output
+        assert json.loads((out_dir / f"{name}.{fmt}").read_text()) == expected
+
+    def test_merge_rejects_missing_shard(self, tmp_path):
+        """An incomplete shard set is an error (exit code 2)."""
+        project = _project(tmp_path)
+        out_dir = project / ".speckit" / "analysis"
+        base = ["audit", "run", "--path", str(project), "--no-safety", "--output", "json"]
+        runner.invoke(app, base + ["--shard", "0/2"])
+
+        result = runner.invoke(
+            app,
+            ["audit", "merge", str(out_dir / "analysis.shard-0-of-2.json"), "--path", str(project)],
+        )
+        assert result.exit_code == 2
+        assert "missing [1]" in result.output
+
+    def test_merge_sums_budget_coverage(self, tmp_path):
+        """Coverage of time-budgeted shards is summed in the merged report."""
+        project = _project(tmp_path)
+        out_dir = project / ".speckit" / "analysis"
+        base = ["audit", "run", "--path", str(project), "--no-safety", "--output", "json"]
+        shard_files = []
+        for i in range(2):
+            runner.invoke(app, base + ["--shard", f"{i}/2", "--time-budget", "60"])
+            shard_files.append(str(out_dir / f"analysis.shard-{i}-of-2.json"))
+            assert "coverage" in json.loads((out_dir / f"analysis.shard-{i}-of-2.json").read_text())
+
+        runner.invoke(app, ["audit", "merge", *shard_files, "--path", str(project)])
+
+        merged = json.loads((out_dir / "analysis.json").read_text())
+        assert merged["partial"] is False
+        files = len(list(project.rglob("*.py")))
+        assert merged["coverage"]["files_total"] == merged["coverage"]["files_analyzed"] == files
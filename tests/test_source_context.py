@@ -0,0 +1,99 @@
+"""Test line-independent context fingerprints."""
+
+from specify_cli.baseline import (
+    filter_with_baseline,
+    load_baseline,
+    stamp_fingerprints,
+    write_baseline,
+)
+from specify_cli.source_context import CONTEXT_FIELD, line_scopes
+
+SOURCE = b"""import os
+
+
+class Client:
+    def connect(self):
+        os.system(cmd)  # flagged
+
+    # comment
+    def close(self):
+        os.system(cmd)  # flagged
+
+
+os.system(cmd)  # flagged
+"""
+
+
+def _findings(source, rule="B605"):
+    lines = source.decode().splitlines()
+    return [
+        {"file_path": "src/client.py", "line": i, "rule_id": rule, "message": "shell"}
+        for i, text in enumerate(lines, 1)
+        if "flagged" in text
+    ]
+
+
+def _stamped(source):
+    findings = _findings(source)
+    stamp_fingerprints(findings, source=source, path="src/client.py")
+    return findings
+
+
+class TestLineScopes:
+    """Test enclosing scopes taken from indentation."""
+
+    def test_nested_blocks(self):
+        scopes = line_scopes(SOURCE.decode().splitlines())
+        assert scopes[3] == ""  # the class line itself
+        assert scopes[4] == "Client"
+        assert scopes[5] == "Client.connect"
+        assert scopes[7] == "Client.connect"  # comment keeps the scope above
+        assert scopes[9] == "Client.close"
+        assert scopes[12] == ""
+
+
+class TestContextFingerprint:
+    """Test fingerprints that survive code moving around the file."""
+
+    def test_unaffected_by_inserted_lines(self):
+        before = _stamped(SOURCE)
+        after = _stamped(b"# header\n\n" + SOURCE)
+
+        assert [f[CONTEXT_FIELD] for f in after] == [f[CONTEXT_FIELD] for f in before]
+        assert all(a["fingerprint"] != b["fingerprint"] for a, b in zip(after, before))
+
+    def test_repeated_lines_stay_distinct(self):
+        source = b"def f():\n    eval(x)  # flagged\n    eval(x)  # flagged\n"
+        findings = _stamped(source)
+        assert len({f[CONTEXT_FIELD] for f in findings}) == 2
+
+    def test_other_files_left_alone(self):
+        findings = _findings(SOURCE) + [
+            {"file_path": "src/other.py", "line": 1, "rule_id": "B605", "message": "shell"}
+        ]
+        stamp_fingerprints(findings, source=SOURCE, path="src/client.py")
+        assert CONTEXT_FIELD not in findings[-1] and "fingerprint" in findings[-1]
+
+    def test_independent_of_checkout_directory(self, tmp_path):
+        def stamped(root, source):
+            findings = _findings(source)
+            for f in findings:
+                f["file_path"] = str(root / f["file_path"])
+            stamp_fingerprints(findings, source=source, path=findings[0]["file_path"], root=root)
+            return findings
+
+        write_baseline(stamped(tmp_path / "proj", SOURCE), tmp_path / "baseline.json")
+        baseline = load_baseline(tmp_path / "baseline.json")
+
+        moved = stamped(tmp_path / "proj2", b"import sys\n" + SOURCE)
+        assert filter_with_baseline(moved, baseline) == []
+
+    def test_baseline_suppresses_moved_findings(self, tmp_path):
+        write_baseline(_stamped(SOURCE), tmp_path / "baseline.json")
+        baseline = load_baseline(tmp_path / "baseline.json")
+
+        moved = _stamped(b"import sys\n" + SOURCE)
+        new = _stamped(SOURCE + b"os.popen(cmd)  # flagged\n")
+
+        assert filter_with_baseline(moved, baseline) == []
+        assert [f["line"] for f in filter_with_baseline(new, baseline)] == [14]
@@ -0,0 +1,134 @@
+"""Test bounded-memory finding collections and spilled audits."""
+
+import io
+import json
+import os
+import pytest
+from specify_cli import runner
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.api import audit, last_run_writer, report_writer
+from specify_cli.errors import ConfigError
+from specify_cli.sharding import canonical_key, canonical_order
+from specify_cli.spill import SpillList, dump_json, parse_size
+
+
+def _findings(n):
+    # Out of path order, with several findings per file
+    return [
+        {"rule_id": f"R{i}", "file_path": f"pkg{i % 7}/m{i % 3}.py", "line": i, "message": "m"}
+        for i in range(n)
+    ]
+
+
+def _scan(ctx):
+    """Stand-in analyzer with many findings per file."""
+    return [
+        {"rule_id": "B1", "file_path": str(p), "line": n, "severity": "LOW", "message": "x" * n}
+        for p in ctx.files
+        for n in range(1, 40)
+    ]
+
+
+class TestSpillList:
+    """Test spilling, ordering and cleanup."""
+
+    def test_spills_and_keeps_insertion_order(self, tmp_path):
+        items = _findings(500)
+        spill = SpillList(1000, tmp_path)
+        spill.extend(items)
+
+        assert spill.spilled and len(spill) == 500
+        assert list(spill) == items
+        assert list(spill) == items  # iterable more than once
+
+    def test_sorted_merge_matches_canonical_order(self, tmp_path):
+        items = _findings(500)
+        spill = SpillList(1000, tmp_path, key=canonical_key)
+        spill.extend(items)
+        assert list(spill) == canonical_order(items)
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+    def test_merge_within_open_file_limit(self, tmp_path):
+        """More segments than file descriptors are merged in bounded passes."""
+        resource = pytest.importorskip("resource")
+        items = _findings(3000)
+        spill = SpillList(200, tmp_path, key=canonical_key)
+        spill.extend(items)
+        assert len(spill._segments) >= 1000
+
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        limit = len(os.listdir("/proc/self/fd")) + 100
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+        try:
+            merged = list(spill)
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+        assert merged == canonical_order(items)
+        assert list(spill) == merged
+        spill.extend(_findings(10))  # spills after a merge land in the merged file
+        assert len(list(spill)) == 3010
+        spill.close()
+        assert not os.listdir(tmp_path)
+
+    def test_close_removes_segment_file(self, tmp_path):
+        spill = SpillList(10, tmp_path)
+        spill.extend(_findings(20))
+        assert os.listdir(tmp_path)
+        spill.close()
+        assert not os.listdir(tmp_path) and len(spill) == 0
+
+    def test_parse_size(self):
+        assert parse_size("512M") == 512 << 20
+        assert parse_size("2GiB") == 2 << 30
+        assert parse_size(4096) == 4096
+        for bad in ("lots", "0", -1):
+            with pytest.raises(ConfigError):
+                parse_size(bad)
+
+
+def test_dump_json_matches_json_dumps(tmp_path):
+    items = _findings(50)
+    spill = SpillList(100, tmp_path)
+    spill.extend(items)
+    doc = {"code": spill, "deps": [], "meta": {}, "runs": [{"a": [1, 2]}], "lazy": iter(())}
+
+    out = io.StringIO()
+    dump_json(doc, out)
+
+    expected = dict(doc, code=items, lazy=[])
+    assert out.getvalue() == json.dumps(expected, indent=2)
+
+
+class TestSpilledAudit:
+    """Test that spilling does not change reports or the gate."""
+
+    @pytest.fixture
+    def tree(self, tmp_path, monkeypatch):
+        plugins = {"bandit": AnalyzerPlugin("bandit", f"{__name__}:_scan", cost="io")}
+        monkeypatch.setattr(runner, "discover_plugins", lambda: plugins)
+        monkeypatch.setattr("specify_cli.api.discover_plugins", lambda: plugins)
+        for d in ("b", "a", "c"):
+            (tmp_path / d).mkdir()
+            for i in range(3):
+                (tmp_path / d / f"m{i}.py").write_text("x = 1\n")
+        return tmp_path
+
+    @pytest.mark.parametrize("fmt, name", [("json", "analysis.json"), ("sarif", "report.sarif")])
+    def test_reports_identical(self, tree, fmt, name):
+        outputs = []
+        for limit in (None, "2K"):
+            out = tree / f"out-{limit}"
+            result = audit(
+                tree,
+                safety=False,
+                use_cache=False,
+                fail_on="LOW",
+                max_memory=limit,
+                reporters=[report_writer(fmt, out), last_run_writer(out)],
+            )
+            assert result.exit_code == 1 and len(result.code) == 9 * 39
+            outputs.append(((out / name).read_text(), (out / "last_run.json").read_text()))
+
+        assert isinstance(result.code, SpillList) and result.code.spilled
+        assert outputs[0] == outputs[1]
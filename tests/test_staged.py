@@ -0,0 +1,150 @@
+"""Test scanning staged content from the git index."""
+
+import json
+import subprocess
+import pytest
+from typer.testing import CliRunner
+from specify_cli import app
+from specify_cli.analyzers.registry import BANDIT, AnalyzerPlugin
+from specify_cli.gitutils import iter_staged_blobs, staged_python_files
+from specify_cli.staged import scan_staged
+
+runner = CliRunner()
+
+SEEN = []
+
+
+def _todo_scan(ctx):
+    """Stand-in in-memory analyzer: one finding per line containing TODO."""
+    SEEN.append(dict(ctx.buffers))
+    out = []
+    for name, data in ctx.buffers.items():
+        for n, line in enumerate(data.decode().splitlines(), start=1):
+            if "TODO" in line:
+                out.append(
+                    {
+                        "file_path": name,
+                        "line": n,
+                        "rule_id": "T1",
+                        "severity": "HIGH",
+                        "message": "todo",
+                    }
+                )
+    return out
+
+
+PLUGIN = AnalyzerPlugin("todo", f"{__name__}:_todo_scan", scope="file", in_memory=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Git repo with a committed file."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=tmp_path)
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=tmp_path)
+    (tmp_path / "base.py").write_text("x = 1\n")
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    subprocess.run(["git", "commit", "-qm", "init"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+def _stage(repo, rel, text):
+    path = repo / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    subprocess.run(["git", "add", rel], cwd=repo, check=True)
+
+
+class TestIndexReading:
+    """Test listing and streaming staged blobs."""
+
+    def test_lists_only_staged_python_files(self, repo):
+        _stage(repo, "pkg/a.py", "a = 1\n")
+        _stage(repo, "notes.txt", "hi\n")
+        (repo / "untracked.py").write_text("u = 1\n")
+        (repo / "base.py").write_text("x = 2\n")  # modified but not staged
+
+        assert staged_python_files(repo) == ["pkg/a.py"]
+
+    def test_blobs_come_from_index_not_working_tree(self, repo):
+        _stage(repo, "a.py", "staged = 1\n")
+        _stage(repo, "b.py", "other = 2\n")
+        (repo / "a.py").write_text("working = 1\n")
+
+        blobs = dict(iter_staged_blobs(repo, ["a.py", "missing.py", "b.py"]))
+        assert blobs == {"a.py": b"staged = 1\n", "b.py": b"other = 2\n"}
+
+
+class TestScanStaged:
+    """Test the in-memory scan of staged content."""
+
+    def test_scans_staged_version(self, repo):
+        _stage(repo, "a.py", "x = 1  # TODO\n")
+        (repo / "a.py").write_text("x = 1\n")  # fixed only in the working tree
+
+        result = scan_staged(repo, [PLUGIN], use_cache=False)
+        assert result.files == ["a.py"]
+        assert [(f["file_path"], f["line"]) for f in result.findings] == [(str(repo / "a.py"), 1)]
+
+    def test_excludes_and_baseline(self, repo):
+        _stage(repo, "a.py", "x = 1  # TODO\n")
+        _stage(repo, "vendor/b.py", "y = 1  # TODO\n")
+        f = {"file_path": str(repo / "a.py"), "line": 1, "rule_id": "T1", "message": "todo"}
+        from specify_cli.baseline import _fingerprint
+
+        result = scan_staged(
+            repo,
+            [PLUGIN],
+            exclude_globs=["vendor/*"],
+            baseline={_fingerprint(f, repo)},
+            use_cache=False,
+        )
+        assert result.files == ["a.py"]
+        assert result.findings == []
+        assert result.suppressed == 1
+
+    def test_cache_reused_for_identical_content(self, repo):
+        _stage(repo, "a.py", "x = 1  # TODO\n")
+        scan_staged(repo, [PLUGIN])
+        SEEN.clear()
+        result = scan_staged(repo, [PLUGIN])
+        assert SEEN == []
+        assert result.cached == 1
+        assert len(result.findings) == 1
+
+    def test_plugins_without_in_memory_support_skipped(self, repo):
+        _stage(repo, "a.py", "x = 1  # TODO\n")
+        on_disk = AnalyzerPlugin("disk", f"{__name__}:_todo_scan", scope="file")
+        assert scan_staged(repo, [on_disk], use_cache=False).findings == []
+
+    @pytest.mark.skipif(not BANDIT.available(), reason="bandit not installed")
+    def test_bandit_scans_buffers(self, repo):
+        _stage(repo, "a.py", "import subprocess\nsubprocess.call('ls', shell=True)\n")
+        _stage(repo, "broken.py", "def (:\n")
+        (repo / "a.py").write_text("x = 1\n")
+
+        result = scan_staged(repo, [BANDIT], use_cache=False)
+        rules = {(f["file_path"], f["rule_id"]) for f in result.findings}
+        assert (str(repo / "a.py"), "B602") in rules
+        assert all(f["file_path"] != str(repo / "broken.py") for f in result.findings)
+
+
+class TestStagedCommand:
+    """Test 'specify audit staged'."""
+
+    @pytest.mark.skipif(not BANDIT.available(), reason="bandit not installed")
+    def test_gate_on_staged_content(self, repo):
+        _stage(repo, "a.py", "import subprocess\nsubprocess.call('ls', shell=True)\n")
+        (repo / "a.py").write_text("x = 1\n")
+
+        result = runner.invoke(
+            app, ["audit", "staged", "--path", str(repo), "--fail-on", "LOW", "--json"]
+        )
+        assert result.exit_code == 1
+        doc = json.loads(result.stdout)
+        assert doc["files"] == ["a.py"]
+        assert any(f["rule_id"] == "B602" for f in doc["code"])
+
+    def test_not_a_repo(self, tmp_path):
+        result = runner.invoke(app, ["audit", "staged", "--path", str(tmp_path)])
+        assert result.exit_code == 2
@@ -0,0 +1,118 @@
+"""Test audit watch session."""
+
+import os
+import threading
+import time
+from specify_cli.analyzers.registry import AnalyzerPlugin
+from specify_cli.baseline import write_baseline
+from specify_cli.watch import ChangeWaiter, WatchSession, diff_snapshots, snapshot
+
+CALLS = []
+
+
+def _todo_scan(ctx):
+    """Stand-in analyzer: one finding per line containing TODO."""
+    CALLS.append(sorted(p.name for p in ctx.files))
+    out = []
+    for p in ctx.files:
+        for n, line in enumerate(p.read_text().splitlines(), start=1):
+            if "TODO" in line:
+                out.append({"file_path": str(p), "line": n, "rule_id": "T1", "message": "todo"})
+    return out
+
+
+PLUGIN = AnalyzerPlugin("todo", f"{__name__}:_todo_scan", scope="file", cost="io")
+
+
+def _touch(path, text):
+    path.write_text(text)
+    # Guarantee a new mtime even on coarse-grained filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestSnapshots:
+    """Test mtime/size change detection."""
+
+    def test_diff_detects_added_modified_removed(self, tmp_path):
+        (tmp_path / "a.py").write_text("a = 1\n")
+        (tmp_path / "b.py").write_text("b = 1\n")
+        old = snapshot(tmp_path)
+        _touch(tmp_path / "a.py", "a = 22\n")
+        (tmp_path / "b.py").unlink()
+        (tmp_path / "c.py").write_text("c = 1\n")
+
+        assert diff_snapshots(old, snapshot(tmp_path)) == (["a.py", "c.py"], ["b.py"])
+
+
+class TestWatchSession:
+    """Test incremental re-scans."""
+
+    def test_only_changed_files_rescanned(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1  # TODO\n")
+        (tmp_path / "b.py").write_text("y = 1\n")
+        session = WatchSession(tmp_path, [PLUGIN], baseline_path=None, use_cache=False)
+        assert session.start() == 2
+        assert len(session.findings()) == 1
+
+        CALLS.clear()
+        _touch(tmp_path / "b.py", "y = 1  # TODO\n")
+        delta = session.poll()
+
+        assert CALLS == [["b.py"]]
+        assert [f["file_path"] for f in delta.added] == [str(tmp_path / "b.py")]
+        assert delta.fixed == []
+        assert delta.total == 2
+        assert session.poll() is None
+
+    def test_fixed_and_removed_files(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1  # TODO\n")
+        (tmp_path / "b.py").write_text("y = 1  # TODO\n")
+        session = WatchSession(tmp_path, [PLUGIN], baseline_path=None, use_cache=False)
+        session.start()
+
+        _touch(tmp_path / "a.py", "x = 1\n")
+        (tmp_path / "b.py").unlink()
+        delta = session.poll()
+
+        assert len(delta.fixed) == 2
+        assert delta.total == 0
+
+    def test_baseline_reloaded_when_changed(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1  # TODO\n")
+        baseline = tmp_path / ".speckit" / "baseline.json"
+        session = WatchSession(tmp_path, [PLUGIN], baseline_path=baseline, use_cache=False)
+        session.start()
+        assert len(session.findings()) == 1
+
+        write_baseline(session.findings(), baseline)
+        delta = session.poll()
+
+        assert delta is not None
+        assert delta.total == 0
+
+        loaded = session._baseline
+        baseline.write_text('{"fingerprints": []}')
+        assert session.poll() is not None and session.findings()
+        assert len(loaded) == 0  # the replaced index was unmapped
+        session.close()
+
+
+class TestChangeWaiter:
+    """Test change notification."""
+
+    def test_wakes_on_change_before_interval(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        waiter = ChangeWaiter()
+        waiter.track(tmp_path, ["a.py"])
+        threading.Timer(0.1, lambda: (tmp_path / "a.py").write_text("x = 2\n")).start()
+
+        start = time.monotonic()
+        waiter.wait(1.0)
+        elapsed = time.monotonic() - start
+        waiter.close()
+
+        if waiter.mode == "inotify":
+            assert elapsed < 0.8
+        else:
+            assert elapsed >= 1.0